@@ -0,0 +1,73 @@
+"""Benchmark calculating data points for an archive of readings.
+
+"rows" processes every reading as its own payload (the way the server does); "batch"
+calculates every data point for all of the readings at once:
+
+    $ python benchmarks/batch_calculations.py --readings 100000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable
+
+from ecowitt2mqtt.core import Ecowitt
+from ecowitt2mqtt.data import ProcessedData
+from ecowitt2mqtt.helpers.calculator.batch import calculate_batch
+
+from tests.common import TEST_CONFIG_JSON
+
+
+def run(label: str, readings: int, func: Callable[[], None]) -> None:
+    """Run a function and print its per-reading cost."""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<8} {elapsed / readings * 1_000_000:10.2f} µs/reading")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readings", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    columns = {
+        "humidity": [rng.randint(10, 90) for _ in range(args.readings)],
+        "solarradiation": [
+            round(rng.uniform(0, 1200), 2) for _ in range(args.readings)
+        ],
+        "tempf": [round(rng.uniform(-10, 100), 1) for _ in range(args.readings)],
+        "tempinf": [round(rng.uniform(50, 90), 1) for _ in range(args.readings)],
+        "uv": [rng.randint(0, 11) for _ in range(args.readings)],
+        "windspeedmph": [round(rng.uniform(0, 60), 1) for _ in range(args.readings)],
+    }
+    ecowitt = Ecowitt(TEST_CONFIG_JSON)
+    payloads = [
+        {
+            "PASSKEY": "12345",
+            "model": "GW2000A",
+            "stationtype": "GW2000A_V2.1.4",
+            **{key: str(column[index]) for key, column in columns.items()},
+        }
+        for index in range(args.readings)
+    ]
+
+    def process_rows() -> None:
+        """Process every reading as a payload."""
+        for payload in payloads:
+            _ = ProcessedData(ecowitt, payload).output
+
+    def process_batch() -> None:
+        """Process every reading at once."""
+        calculate_batch(ecowitt.config.unit_converter, columns)
+
+    print(f"{args.readings} readings:")
+    run("rows", args.readings, process_rows)
+    run("batch", args.readings, process_batch)
+
+
+if __name__ == "__main__":
+    main()
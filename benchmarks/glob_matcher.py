@@ -0,0 +1,79 @@
+"""Benchmark finding calculators for payload keys via each glob search strategy.
+
+"levenshtein" ranks every substring match by its edit distance from the key (the way
+it was done before); "scan" checks every glob against the key and takes the longest;
+"matcher" checks the globs longest-first and stops at the first match:
+
+    $ python benchmarks/glob_matcher.py --payloads 5000
+"""
+from __future__ import annotations
+
+import argparse
+from difflib import SequenceMatcher
+import json
+from pathlib import Path
+import time
+from typing import Any, Callable
+
+from ecowitt2mqtt.data import CALCULATOR_FUNCTION_MAP, CALCULATOR_MATCHER
+from ecowitt2mqtt.util import glob_search
+
+FIXTURE_PATH = (
+    Path(__file__).parent.parent / "tests" / "fixtures" / "payload_gw2000a_2.json"
+)
+
+
+def levenshtein_glob_search(data: dict[str, Any], key: str) -> Any:
+    """Search the way glob_search did when it ranked matches by edit distance."""
+    if key in data:
+        return (key, data[key])
+    if not (matches := [k for k in data if k in key]):
+        return (None, None)
+    match = sorted(
+        matches,
+        key=lambda m: round(100 * SequenceMatcher(None, key, m).ratio()),
+        reverse=True,
+    )[0]
+    return (match, data[match])
+
+
+def run(label: str, payloads: int, func: Callable[[], None]) -> None:
+    """Run a function once per payload and print the per-payload cost."""
+    start = time.perf_counter()
+    for _ in range(payloads):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<12} {elapsed / payloads * 1_000_000:10.1f} µs/payload")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payloads", type=int, default=5000)
+    args = parser.parse_args()
+
+    keys = list(json.loads(FIXTURE_PATH.read_text(encoding="utf-8")))
+
+    def search_levenshtein() -> None:
+        """Search for every key by edit distance."""
+        for key in keys:
+            levenshtein_glob_search(CALCULATOR_FUNCTION_MAP, key)
+
+    def search_scan() -> None:
+        """Search for every key by scanning the globs."""
+        for key in keys:
+            glob_search(CALCULATOR_FUNCTION_MAP, key)
+
+    def search_matcher() -> None:
+        """Search for every key via the precompiled matcher."""
+        for key in keys:
+            CALCULATOR_MATCHER.search(key)
+
+    print(f"Glob search ({len(keys)} keys, {len(CALCULATOR_FUNCTION_MAP)} globs):")
+    run("levenshtein", args.payloads, search_levenshtein)
+    run("scan", args.payloads, search_scan)
+    run("matcher", args.payloads, search_matcher)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Benchmark the FastAPI ingest route against the raw ASGI fast path.
+
+Requests are driven straight into each ASGI application (no sockets involved), so the
+numbers reflect routing and body parsing overhead alone:
+
+    $ python benchmarks/ingest.py --requests 20000 --concurrency 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+import statistics
+import time
+from typing import Any
+from urllib.parse import urlencode
+
+from ecowitt2mqtt.const import (
+    CONF_ENDPOINT,
+    CONF_FAST_INGEST,
+    CONF_MQTT_BROKER,
+    CONF_MQTT_TOPIC,
+    CONF_QUEUE_SIZE,
+)
+from ecowitt2mqtt.core import Ecowitt
+
+ENDPOINT = "/data/report"
+FIXTURE_PATH = (
+    Path(__file__).parent.parent / "tests" / "fixtures" / "payload_gw2000a_2.json"
+)
+
+
+async def async_run(app: Any, body: bytes, requests: int, concurrency: int) -> None:
+    """Drive a number of requests through an ASGI app and print the results."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": ENDPOINT,
+        "raw_path": ENDPOINT.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", b"application/x-www-form-urlencoded"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 12345),
+        "server": ("127.0.0.1", 8080),
+    }
+    latencies: list[float] = []
+
+    async def async_request() -> None:
+        """Perform a single request."""
+        statuses = []
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        start = time.perf_counter()
+        await app(dict(scope), receive, send)
+        latencies.append(time.perf_counter() - start)
+        assert statuses == [204], statuses
+
+    async def async_worker(count: int) -> None:
+        """Perform requests sequentially."""
+        for _ in range(count):
+            await async_request()
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(async_worker(requests // concurrency) for _ in range(concurrency))
+    )
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"  {len(latencies) / elapsed:10.0f} req/s  "
+        f"mean {statistics.mean(latencies) * 1000:.3f} ms  "
+        f"p99 {p99 * 1000:.3f} ms"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    body = urlencode(json.loads(FIXTURE_PATH.read_text(encoding="utf-8"))).encode()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    for label, fast_ingest in (("FastAPI route", False), ("ASGI fast path", True)):
+        ecowitt = Ecowitt(
+            {
+                CONF_ENDPOINT: ENDPOINT,
+                CONF_FAST_INGEST: fast_ingest,
+                CONF_MQTT_BROKER: "127.0.0.1",
+                CONF_MQTT_TOPIC: "benchmark",
+                CONF_QUEUE_SIZE: args.requests + 1,
+            }
+        )
+        logging.getLogger("ecowitt2mqtt").setLevel(logging.WARNING)
+        print(f"{label}:")
+        loop.run_until_complete(
+            async_run(
+                ecowitt._runtime._server.config.app,  # pylint: disable=protected-access
+                body,
+                args.requests,
+                args.concurrency,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark resolving payload keys to calculators with and without caching.
+
+"Uncached" repeats the work that used to be done for every key of every payload (a
+glob search to strip the unit and another to find the calculator); "cached" resolves
+each distinct key once. Full payload processing is measured with cold caches (so every
+payload builds a new processing plan) and with warm ones:
+
+    $ python benchmarks/key_resolution.py --payloads 5000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from pathlib import Path
+import time
+from typing import Callable
+
+from ecowitt2mqtt.const import (
+    CONF_DEFAULT_BATTERY_STRATEGY,
+    CONF_ENDPOINT,
+    CONF_INPUT_UNIT_SYSTEM,
+    CONF_MQTT_BROKER,
+    CONF_MQTT_TOPIC,
+    CONF_OUTPUT_UNIT_SYSTEM,
+    UNIT_SYSTEM_IMPERIAL,
+)
+from ecowitt2mqtt.core import Ecowitt
+from ecowitt2mqtt.data import (
+    CALCULATOR_FUNCTION_MAP,
+    PROCESSING_PLANS,
+    ProcessedData,
+    resolve_key,
+)
+from ecowitt2mqtt.helpers.calculator.battery import BatteryStrategy
+from ecowitt2mqtt.util import glob_search
+
+FIXTURE_PATH = (
+    Path(__file__).parent.parent / "tests" / "fixtures" / "payload_gw2000a_2.json"
+)
+
+
+def run(label: str, payloads: int, func: Callable[[], None]) -> None:
+    """Run a function once per payload and print the per-payload cost."""
+    start = time.perf_counter()
+    for _ in range(payloads):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<10} {elapsed / payloads * 1_000_000:10.1f} µs/payload")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payloads", type=int, default=5000)
+    args = parser.parse_args()
+
+    payload = json.loads(FIXTURE_PATH.read_text(encoding="utf-8"))
+    ecowitt = Ecowitt(
+        {
+            CONF_DEFAULT_BATTERY_STRATEGY: BatteryStrategy.BOOLEAN,
+            CONF_ENDPOINT: "/data/report",
+            CONF_INPUT_UNIT_SYSTEM: UNIT_SYSTEM_IMPERIAL,
+            CONF_MQTT_BROKER: "127.0.0.1",
+            CONF_MQTT_TOPIC: "benchmark",
+            CONF_OUTPUT_UNIT_SYSTEM: UNIT_SYSTEM_IMPERIAL,
+        }
+    )
+    logging.getLogger("ecowitt2mqtt").setLevel(logging.WARNING)
+
+    def resolve_uncached() -> None:
+        """Resolve every key the way it was done before the cache existed."""
+        for key in payload:
+            glob_search(CALCULATOR_FUNCTION_MAP, key)
+            glob_search(CALCULATOR_FUNCTION_MAP, key)
+
+    def resolve_cached() -> None:
+        """Resolve every key via the cache."""
+        for key in payload:
+            resolve_key(key)
+
+    def process_uncached() -> None:
+        """Process the payload with cold caches."""
+        PROCESSING_PLANS.clear()
+        resolve_key.cache_clear()
+        ProcessedData(ecowitt, payload)
+
+    def process_cached() -> None:
+        """Process the payload with warm caches."""
+        ProcessedData(ecowitt, payload)
+
+    print(f"Key resolution ({len(payload)} keys):")
+    run("uncached", args.payloads, resolve_uncached)
+    run("cached", args.payloads, resolve_cached)
+
+    print("Full payload processing:")
+    run("uncached", args.payloads, process_uncached)
+    run("cached", args.payloads, process_cached)
+
+
+if __name__ == "__main__":
+    main()
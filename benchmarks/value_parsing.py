@@ -0,0 +1,63 @@
+"""Benchmark parsing payload values into typed values.
+
+"generic" parses every value with get_typed_value (the way it was always done); "plan"
+parses each value with the parser that its processing plan step chose for its key. Both
+run over the values that get processed in every fixture payload:
+
+    $ python benchmarks/value_parsing.py --payloads 5000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import time
+from typing import Any, Callable
+
+from ecowitt2mqtt.data import ProcessingPlan, get_typed_value
+
+FIXTURES_PATH = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def run(label: str, payloads: int, func: Callable[[], None], repeat: int = 5) -> None:
+    """Run a function once per payload and print the (best) per-payload cost."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(payloads):
+            func()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<12} {best / payloads * 1_000_000:10.2f} µs/payload")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payloads", type=int, default=5000)
+    args = parser.parse_args()
+
+    for fixture_path in sorted(FIXTURES_PATH.glob("payload_*.json")):
+        payload: dict[str, Any] = json.loads(fixture_path.read_text(encoding="utf-8"))
+        plan = ProcessingPlan.from_payload_keys(payload)
+        values = [
+            (step.parser, payload[step.payload_key])
+            for step in plan.raw_data_steps.values()
+        ]
+
+        def parse_generic() -> None:
+            """Parse every value with the generic parser."""
+            for _, value in values:  # pylint: disable=cell-var-from-loop
+                get_typed_value(value)
+
+        def parse_plan() -> None:
+            """Parse every value with its key's parser."""
+            for value_parser, value in values:  # pylint: disable=cell-var-from-loop
+                value_parser(value)
+
+        print(f"{fixture_path.name} ({len(values)} values):")
+        run("generic", args.payloads, parse_generic)
+        run("plan", args.payloads, parse_plan)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,15 +9,27 @@ import uvloop
 from ecowitt2mqtt.const import (
     CONF_VERBOSE,
     ENV_BATTERY_OVERRIDE,
+    ENV_COALESCE_WINDOW,
     ENV_CONFIG,
+    ENV_DEDUPE_WINDOW,
     ENV_DEFAULT_BATTERY_STRATEGY,
     ENV_DIAGNOSTICS,
     ENV_DISABLE_CALCULATED_DATA,
     ENV_ENDPOINT,
+    ENV_EXCLUDE_KEY,
+    ENV_FAST_INGEST,
+    ENV_HASS_DEADBAND,
+    ENV_HASS_DELTA_PUBLISHING,
     ENV_HASS_DISCOVERY,
     ENV_HASS_DISCOVERY_PREFIX,
     ENV_HASS_ENTITY_ID_PREFIX,
+    ENV_HASS_HEARTBEAT,
+    ENV_INCLUDE_KEY,
+    ENV_INGEST_WORKERS,
     ENV_INPUT_UNIT_SYSTEM,
+    ENV_LOCAL_API_GATEWAY,
+    ENV_LOCAL_API_POLL_INTERVAL,
+    ENV_LOCAL_API_TIMEOUT,
     ENV_MQTT_BROKER,
     ENV_MQTT_PASSWORD,
     ENV_MQTT_PORT,
@@ -27,7 +39,13 @@ from ecowitt2mqtt.const import (
     ENV_MQTT_USERNAME,
     ENV_OUTPUT_UNIT_SYSTEM,
     ENV_PORT,
+    ENV_PUBLISH_WORKERS,
+    ENV_QUEUE_OVERFLOW_POLICY,
+    ENV_QUEUE_SIZE,
     ENV_RAW_DATA,
+    ENV_ROLLING_STATS_KEY,
+    ENV_SHUTDOWN_TIMEOUT,
+    ENV_STATION_CLAIM_BATCH_SIZE,
     ENV_VERBOSE,
     LEGACY_ENV_ENDPOINT,
     LEGACY_ENV_HASS_DISCOVERY,
@@ -46,9 +64,23 @@ from ecowitt2mqtt.const import (
     UNIT_SYSTEM_METRIC,
     __version__ as ecowitt2mqtt_version,
 )
+from ecowitt2mqtt.config import (
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_DEDUPE_WINDOW,
+    DEFAULT_HASS_HEARTBEAT,
+    DEFAULT_INGEST_WORKERS,
+    DEFAULT_LOCAL_API_POLL_INTERVAL,
+    DEFAULT_LOCAL_API_TIMEOUT,
+    DEFAULT_PUBLISH_WORKERS,
+    DEFAULT_QUEUE_OVERFLOW_POLICY,
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_SHUTDOWN_TIMEOUT,
+    DEFAULT_STATION_CLAIM_BATCH_SIZE,
+)
 from ecowitt2mqtt.core import Ecowitt
 from ecowitt2mqtt.helpers.calculator.battery import BatteryStrategy
 from ecowitt2mqtt.helpers.logging import log_exception
+from ecowitt2mqtt.helpers.queue import OverflowPolicy
 
 DEFAULT_ENDPOINT = "/data/report"
 DEFAULT_HASS_DISCOVERY_PREFIX = "homeassistant"
@@ -74,6 +106,12 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals
         envvar=[ENV_BATTERY_OVERRIDE],
         help="A battery configuration override (format: key,value)",
     ),
+    coalesce_window: int = typer.Option(
+        DEFAULT_COALESCE_WINDOW,
+        "--coalesce-window",
+        envvar=[ENV_COALESCE_WINDOW],
+        help="Merge a station's payloads that arrive within this many milliseconds.",
+    ),
     config: Path = typer.Option(
         None,
         "--config",
@@ -85,6 +123,12 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals
         help="A path to a YAML or JSON config file.",
         resolve_path=True,
     ),
+    dedupe_window: float = typer.Option(
+        DEFAULT_DEDUPE_WINDOW,
+        "--dedupe-window",
+        envvar=[ENV_DEDUPE_WINDOW],
+        help="Ignore a station's identical payloads within this many seconds.",
+    ),
     default_battery_strategy: BatteryStrategy = typer.Option(
         BatteryStrategy.BOOLEAN,
         "--default-battery-strategy",
@@ -111,6 +155,30 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals
         envvar=[ENV_ENDPOINT, LEGACY_ENV_ENDPOINT],
         help="The relative endpoint/path to serve ecowitt2mqtt on.",
     ),
+    exclude_key: List[str] = typer.Option(
+        None,
+        "--exclude-key",
+        envvar=[ENV_EXCLUDE_KEY],
+        help="A glob of payload keys/data points to skip (format: pattern)",
+    ),
+    fast_ingest: bool = typer.Option(
+        False,
+        "--fast-ingest",
+        envvar=[ENV_FAST_INGEST],
+        help="Parse incoming payloads with a raw ASGI fast path.",
+    ),
+    hass_deadband: List[str] = typer.Option(
+        None,
+        "--hass-deadband",
+        envvar=[ENV_HASS_DEADBAND],
+        help="A deadband for publishing changes (format: key=value or key=value%)",
+    ),
+    hass_delta_publishing: bool = typer.Option(
+        False,
+        "--hass-delta-publishing",
+        envvar=[ENV_HASS_DELTA_PUBLISHING],
+        help="Only publish Home Assistant entities whose values have changed.",
+    ),
     hass_discovery: bool = typer.Option(
         False,
         "--hass-discovery",
@@ -129,6 +197,24 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals
         envvar=[ENV_HASS_ENTITY_ID_PREFIX, LEGACY_ENV_HASS_ENTITY_ID_PREFIX],
         help="The prefix to use for Home Assistant entity IDs.",
     ),
+    hass_heartbeat: int = typer.Option(
+        DEFAULT_HASS_HEARTBEAT,
+        "--hass-heartbeat",
+        envvar=[ENV_HASS_HEARTBEAT],
+        help="Republish unchanged Home Assistant entities every this many minutes.",
+    ),
+    include_key: List[str] = typer.Option(
+        None,
+        "--include-key",
+        envvar=[ENV_INCLUDE_KEY],
+        help="A glob of payload keys/data points to process (format: pattern)",
+    ),
+    ingest_workers: int = typer.Option(
+        DEFAULT_INGEST_WORKERS,
+        "--ingest-workers",
+        envvar=[ENV_INGEST_WORKERS],
+        help="The number of processes that receive payloads.",
+    ),
     input_unit_system: str = typer.Option(
         UNIT_SYSTEM_IMPERIAL,
         "--input-unit-system",
@@ -136,6 +222,24 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals
         envvar=[ENV_INPUT_UNIT_SYSTEM, LEGACY_ENV_INPUT_UNIT_SYSTEM],
         help="The input unit system used by the device.",
     ),
+    local_api_gateway: List[str] = typer.Option(
+        None,
+        "--local-api-gateway",
+        envvar=[ENV_LOCAL_API_GATEWAY],
+        help="A gateway to poll via its local API (format: host[:port])",
+    ),
+    local_api_poll_interval: float = typer.Option(
+        DEFAULT_LOCAL_API_POLL_INTERVAL,
+        "--local-api-poll-interval",
+        envvar=[ENV_LOCAL_API_POLL_INTERVAL],
+        help="The number of seconds between local API polls of a gateway.",
+    ),
+    local_api_timeout: float = typer.Option(
+        DEFAULT_LOCAL_API_TIMEOUT,
+        "--local-api-timeout",
+        envvar=[ENV_LOCAL_API_TIMEOUT],
+        help="The number of seconds to wait for a local API response.",
+    ),
     mqtt_broker: str = typer.Option(
         None,
         "--mqtt-broker",
@@ -195,12 +299,52 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals
         envvar=[ENV_PORT, LEGACY_ENV_PORT],
         help="The port to serve ecowitt2mqtt on.",
     ),
+    publish_workers: int = typer.Option(
+        DEFAULT_PUBLISH_WORKERS,
+        "--publish-workers",
+        envvar=[ENV_PUBLISH_WORKERS],
+        help="The number of workers that publish payloads in parallel.",
+    ),
+    queue_overflow_policy: OverflowPolicy = typer.Option(
+        DEFAULT_QUEUE_OVERFLOW_POLICY,
+        "--queue-overflow-policy",
+        envvar=[ENV_QUEUE_OVERFLOW_POLICY],
+        help="What to do when a station's queue is full.",
+        metavar="TEXT",
+    ),
+    queue_size: int = typer.Option(
+        DEFAULT_QUEUE_SIZE,
+        "--queue-size",
+        envvar=[ENV_QUEUE_SIZE],
+        help="The maximum number of queued payloads per station.",
+    ),
     raw_data: bool = typer.Option(
         False,
         "--raw-data",
         envvar=[ENV_RAW_DATA, LEGACY_ENV_RAW_DATA],
         help="Return raw data (don't attempt to translate any values).",
     ),
+    rolling_stats_key: List[str] = typer.Option(
+        None,
+        "--rolling-stats-key",
+        envvar=[ENV_ROLLING_STATS_KEY],
+        help=(
+            "A glob of payload keys/data points to publish rolling statistics for "
+            "(format: pattern)"
+        ),
+    ),
+    shutdown_timeout: float = typer.Option(
+        DEFAULT_SHUTDOWN_TIMEOUT,
+        "--shutdown-timeout",
+        envvar=[ENV_SHUTDOWN_TIMEOUT],
+        help="The number of seconds to spend publishing queued payloads on exit.",
+    ),
+    station_claim_batch_size: int = typer.Option(
+        DEFAULT_STATION_CLAIM_BATCH_SIZE,
+        "--station-claim-batch-size",
+        envvar=[ENV_STATION_CLAIM_BATCH_SIZE],
+        help="The number of a station's payloads a publish worker claims at once.",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
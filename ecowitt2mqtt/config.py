@@ -2,21 +2,33 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, cast
+from typing import Any, Dict, List, Tuple, cast
 
 from ruamel.yaml import YAML
 
 from ecowitt2mqtt.const import (
     CONF_BATTERY_OVERRIDES,
+    CONF_COALESCE_WINDOW,
     CONF_CONFIG,
+    CONF_DEDUPE_WINDOW,
     CONF_DEFAULT_BATTERY_STRATEGY,
     CONF_DIAGNOSTICS,
     CONF_DISABLE_CALCULATED_DATA,
     CONF_ENDPOINT,
+    CONF_EXCLUDE_KEY,
+    CONF_FAST_INGEST,
+    CONF_HASS_DEADBAND,
+    CONF_HASS_DELTA_PUBLISHING,
     CONF_HASS_DISCOVERY,
     CONF_HASS_DISCOVERY_PREFIX,
     CONF_HASS_ENTITY_ID_PREFIX,
+    CONF_HASS_HEARTBEAT,
+    CONF_INCLUDE_KEY,
+    CONF_INGEST_WORKERS,
     CONF_INPUT_UNIT_SYSTEM,
+    CONF_LOCAL_API_GATEWAY,
+    CONF_LOCAL_API_POLL_INTERVAL,
+    CONF_LOCAL_API_TIMEOUT,
     CONF_MQTT_BROKER,
     CONF_MQTT_PASSWORD,
     CONF_MQTT_PORT,
@@ -26,10 +38,17 @@ from ecowitt2mqtt.const import (
     CONF_MQTT_USERNAME,
     CONF_OUTPUT_UNIT_SYSTEM,
     CONF_PORT,
+    CONF_PUBLISH_WORKERS,
+    CONF_QUEUE_OVERFLOW_POLICY,
+    CONF_QUEUE_SIZE,
     CONF_RAW_DATA,
+    CONF_ROLLING_STATS_KEY,
+    CONF_SHUTDOWN_TIMEOUT,
+    CONF_STATION_CLAIM_BATCH_SIZE,
     CONF_VERBOSE,
     ENV_BATTERY_OVERRIDE,
     ENV_ENDPOINT,
+    ENV_HASS_DEADBAND,
     ENV_HASS_DISCOVERY,
     ENV_HASS_DISCOVERY_PREFIX,
     ENV_HASS_ENTITY_ID_PREFIX,
@@ -61,8 +80,25 @@ from ecowitt2mqtt.const import (
 )
 from ecowitt2mqtt.errors import EcowittError
 from ecowitt2mqtt.helpers.calculator.battery import BatteryStrategy
+from ecowitt2mqtt.helpers.calculator.units import UnitConverter
+from ecowitt2mqtt.helpers.filter import KeyFilter
+from ecowitt2mqtt.helpers.local_api import DEFAULT_LOCAL_API_PORT
+from ecowitt2mqtt.helpers.publisher.delta import Deadband
+from ecowitt2mqtt.helpers.queue import OverflowPolicy
 from ecowitt2mqtt.helpers.typing import UnitSystemType
 
+DEFAULT_COALESCE_WINDOW = 0
+DEFAULT_DEDUPE_WINDOW = 0.0
+DEFAULT_HASS_HEARTBEAT = 15
+DEFAULT_INGEST_WORKERS = 1
+DEFAULT_LOCAL_API_POLL_INTERVAL = 5.0
+DEFAULT_LOCAL_API_TIMEOUT = 5.0
+DEFAULT_PUBLISH_WORKERS = 4
+DEFAULT_QUEUE_OVERFLOW_POLICY = OverflowPolicy.DROP_OLDEST
+DEFAULT_QUEUE_SIZE = 10
+DEFAULT_SHUTDOWN_TIMEOUT = 10.0
+DEFAULT_STATION_CLAIM_BATCH_SIZE = 1
+
 DEPRECATED_ENV_VAR_MAP = {
     LEGACY_ENV_ENDPOINT: ENV_ENDPOINT,
     LEGACY_ENV_HASS_DISCOVERY: ENV_HASS_DISCOVERY,
@@ -109,6 +145,59 @@ def convert_battery_config(configs: str | tuple) -> dict[str, BatteryStrategy]:
         raise ConfigError(f"Unable to parse battery configurations: {configs}") from err
 
 
+def convert_local_api_gateway_config(
+    configs: str | list | tuple,
+) -> list[tuple[str, int]]:
+    """Normalize incoming local API gateway addresses depending on the input format.
+
+    1. Config File/Environment Variables (str): "host1:port1 host2"
+    2. Config File/CLI Options (list/tuple): ("host1:port1", "host2")
+    """
+    if isinstance(configs, str):
+        configs = configs.split()
+
+    gateways = []
+    for address in configs:
+        host, _, port = str(address).partition(":")
+        try:
+            gateways.append((host, int(port) if port else DEFAULT_LOCAL_API_PORT))
+        except ValueError as err:
+            raise ConfigError(f"Invalid local API gateway: {address}") from err
+        if not host:
+            raise ConfigError(f"Invalid local API gateway: {address}")
+    return gateways
+
+
+def convert_deadband_config(configs: str | list | tuple | dict) -> dict[str, Deadband]:
+    """Normalize incoming deadband configurations depending on the input format.
+
+    1. Environment Variables (str): "key1=value1;key2=value2"
+    2. CLI Options (list/tuple): ("key1=val1", "key2=val2")
+    3. Config File (dict): {"key1": "val1", "key2": "val2"}
+    """
+    try:
+        if isinstance(configs, str):
+            configs = configs.split(";")
+        if not isinstance(configs, dict):
+            configs = dict(assignment.split("=") for assignment in configs)
+        return {key: Deadband.from_string(value) for key, value in configs.items()}
+    except (AttributeError, ValueError) as err:
+        raise ConfigError(
+            f"Unable to parse deadband configurations: {configs}"
+        ) from err
+
+
+def convert_key_pattern_config(configs: str | list | tuple) -> list[str]:
+    """Normalize incoming key patterns depending on the input format.
+
+    1. Config File/Environment Variables (str): "pattern1 pattern2"
+    2. Config File/CLI Options (list/tuple): ("pattern1", "pattern2")
+    """
+    if isinstance(configs, str):
+        configs = configs.split()
+    return [str(pattern) for pattern in configs]
+
+
 class Config:
     """Define the configuration management object."""
 
@@ -149,6 +238,12 @@ class Config:
             )
 
         self._config.setdefault(CONF_BATTERY_OVERRIDES, {})
+        local_api_gateways = self._config.get(CONF_LOCAL_API_GATEWAY, [])
+        deadbands = self._config.get(CONF_HASS_DEADBAND, {})
+        key_patterns = {
+            key: self._config.get(key, [])
+            for key in (CONF_EXCLUDE_KEY, CONF_INCLUDE_KEY, CONF_ROLLING_STATS_KEY)
+        }
 
         # Merge the CLI options/environment variables; if the value is falsey (but *not*
         # False), ignore it:
@@ -167,8 +262,99 @@ class Config:
                 params[CONF_BATTERY_OVERRIDES]
             )
 
+        self._validate_hass(params, deadbands)
+        self._validate_local_api(params, local_api_gateways)
+        self._validate_filters(params, key_patterns)
+        self._validate_queue()
+
+        # Build the unit conversions once, rather than per calculation:
+        try:
+            self._unit_converter = UnitConverter(
+                self.input_unit_system, self.output_unit_system
+            )
+        except ValueError as err:
+            raise ConfigError(
+                "Invalid unit systems: "
+                f"{self.input_unit_system} -> {self.output_unit_system}"
+            ) from err
+
         LOGGER.debug("Loaded Config: %s", self._config)
 
+    def _validate_hass(self, params: dict[str, Any], deadbands: dict[str, Any]) -> None:
+        """Validate the Home Assistant options."""
+        if env_deadbands := os.getenv(ENV_HASS_DEADBAND):
+            self._config[CONF_HASS_DEADBAND] = convert_deadband_config(env_deadbands)
+        else:
+            self._config[CONF_HASS_DEADBAND] = convert_deadband_config(
+                params.get(CONF_HASS_DEADBAND) or deadbands
+            )
+
+        if self.hass_heartbeat < 0:
+            raise ConfigError(
+                f"Invalid Home Assistant heartbeat: {self.hass_heartbeat}"
+            )
+
+    def _validate_filters(
+        self, params: dict[str, Any], key_patterns: dict[str, list[str]]
+    ) -> None:
+        """Validate the key patterns and build the filters that use them."""
+        for key, patterns in key_patterns.items():
+            self._config[key] = convert_key_pattern_config(params.get(key) or patterns)
+        self._key_filter = KeyFilter(
+            include=tuple(self._config[CONF_INCLUDE_KEY]),
+            exclude=tuple(self._config[CONF_EXCLUDE_KEY]),
+        )
+        self._rolling_stats_filter: KeyFilter | None = None
+        if rolling_stats_keys := self._config[CONF_ROLLING_STATS_KEY]:
+            self._rolling_stats_filter = KeyFilter(include=tuple(rolling_stats_keys))
+
+    def _validate_local_api(
+        self, params: dict[str, Any], local_api_gateways: list[str]
+    ) -> None:
+        """Validate the local API options."""
+        # An empty CLI option shouldn't wipe out gateways from the config file:
+        self._config[CONF_LOCAL_API_GATEWAY] = convert_local_api_gateway_config(
+            params.get(CONF_LOCAL_API_GATEWAY) or local_api_gateways
+        )
+
+        for option, value in (
+            ("local API poll interval", self.local_api_poll_interval),
+            ("local API timeout", self.local_api_timeout),
+        ):
+            if value <= 0:
+                raise ConfigError(f"Invalid {option}: {value}")
+
+    def _validate_queue(self) -> None:
+        """Validate the ingest, queue, publish and shutdown options."""
+        try:
+            self._config[CONF_QUEUE_OVERFLOW_POLICY] = OverflowPolicy(
+                self._config.get(
+                    CONF_QUEUE_OVERFLOW_POLICY, DEFAULT_QUEUE_OVERFLOW_POLICY
+                )
+            )
+        except ValueError as err:
+            raise ConfigError(
+                "Invalid queue overflow policy: "
+                f"{self._config[CONF_QUEUE_OVERFLOW_POLICY]}"
+            ) from err
+
+        for option, count in (
+            ("ingest workers", self.ingest_workers),
+            ("publish workers", self.publish_workers),
+            ("queue size", self.queue_size),
+            ("station claim batch size", self.station_claim_batch_size),
+        ):
+            if count < 1:
+                raise ConfigError(f"Invalid {option}: {count}")
+
+        for option, value in (
+            ("coalesce window", self.coalesce_window),
+            ("dedupe window", self.dedupe_window),
+            ("shutdown timeout", self.shutdown_timeout),
+        ):
+            if value < 0:
+                raise ConfigError(f"Invalid {option}: {value}")
+
     @property
     def battery_overrides(self) -> dict[str, BatteryStrategy]:
         """Return the battery overrides."""
@@ -176,6 +362,16 @@ class Config:
             Dict[str, BatteryStrategy], self._config.get(CONF_BATTERY_OVERRIDES)
         )
 
+    @property
+    def coalesce_window(self) -> int:
+        """Return the window (in milliseconds) in which payloads are merged."""
+        return int(self._config.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW))
+
+    @property
+    def dedupe_window(self) -> float:
+        """Return the window (in seconds) in which duplicate payloads are ignored."""
+        return float(self._config.get(CONF_DEDUPE_WINDOW, DEFAULT_DEDUPE_WINDOW))
+
     @property
     def default_battery_strategy(self) -> BatteryStrategy:
         """Return the default battery strategy."""
@@ -196,6 +392,21 @@ class Config:
         """Return the ecowitt2mqtt API endpoint."""
         return cast(str, self._config.get(CONF_ENDPOINT))
 
+    @property
+    def fast_ingest(self) -> bool:
+        """Return whether the raw ASGI ingest fast path is enabled."""
+        return cast(bool, self._config.get(CONF_FAST_INGEST, False))
+
+    @property
+    def hass_deadbands(self) -> dict[str, Deadband]:
+        """Return the deadbands to use when publishing changes to Home Assistant."""
+        return cast(Dict[str, Deadband], self._config[CONF_HASS_DEADBAND])
+
+    @property
+    def hass_delta_publishing(self) -> bool:
+        """Return whether to only publish Home Assistant entities that change."""
+        return cast(bool, self._config.get(CONF_HASS_DELTA_PUBLISHING, False))
+
     @property
     def hass_discovery(self) -> bool:
         """Return whether Home Assistant Discovery should be used."""
@@ -211,11 +422,47 @@ class Config:
         """Return the Home Assistant entity ID prefix."""
         return self._config.get(CONF_HASS_ENTITY_ID_PREFIX)
 
+    @property
+    def hass_heartbeat(self) -> int:
+        """Return the number of minutes between republishes of unchanged entities."""
+        return int(self._config.get(CONF_HASS_HEARTBEAT, DEFAULT_HASS_HEARTBEAT))
+
+    @property
+    def ingest_workers(self) -> int:
+        """Return the number of processes that serve the REST API."""
+        return int(self._config.get(CONF_INGEST_WORKERS, DEFAULT_INGEST_WORKERS))
+
     @property
     def input_unit_system(self) -> UnitSystemType:
         """Return the input unit system."""
         return cast(UnitSystemType, self._config.get(CONF_INPUT_UNIT_SYSTEM))
 
+    @property
+    def key_filter(self) -> KeyFilter:
+        """Return the filter of payload keys/data points to process."""
+        return self._key_filter
+
+    @property
+    def local_api_gateways(self) -> list[tuple[str, int]]:
+        """Return the (host, port) addresses of gateways to poll via the local API."""
+        return cast(List[Tuple[str, int]], self._config[CONF_LOCAL_API_GATEWAY])
+
+    @property
+    def local_api_poll_interval(self) -> float:
+        """Return the interval (in seconds) at which to poll local API gateways."""
+        return float(
+            self._config.get(
+                CONF_LOCAL_API_POLL_INTERVAL, DEFAULT_LOCAL_API_POLL_INTERVAL
+            )
+        )
+
+    @property
+    def local_api_timeout(self) -> float:
+        """Return the timeout (in seconds) for a local API request."""
+        return float(
+            self._config.get(CONF_LOCAL_API_TIMEOUT, DEFAULT_LOCAL_API_TIMEOUT)
+        )
+
     @property
     def mqtt_broker(self) -> str:
         """Return the MQTT broker host/IP address."""
@@ -261,11 +508,50 @@ class Config:
         """Return the ecowitt2mqtt API port."""
         return cast(int, self._config.get(CONF_PORT))
 
+    @property
+    def publish_workers(self) -> int:
+        """Return the number of workers that publish payloads in parallel."""
+        return int(self._config.get(CONF_PUBLISH_WORKERS, DEFAULT_PUBLISH_WORKERS))
+
+    @property
+    def queue_overflow_policy(self) -> OverflowPolicy:
+        """Return the strategy to use when a station's queue is full."""
+        return cast(OverflowPolicy, self._config[CONF_QUEUE_OVERFLOW_POLICY])
+
+    @property
+    def queue_size(self) -> int:
+        """Return the maximum number of queued payloads per station."""
+        return int(self._config.get(CONF_QUEUE_SIZE, DEFAULT_QUEUE_SIZE))
+
     @property
     def raw_data(self) -> bool:
         """Return whether raw data is configured."""
         return cast(bool, self._config.get(CONF_RAW_DATA, False))
 
+    @property
+    def rolling_stats_filter(self) -> KeyFilter | None:
+        """Return the filter of data points to publish rolling statistics for."""
+        return self._rolling_stats_filter
+
+    @property
+    def shutdown_timeout(self) -> float:
+        """Return the time (in seconds) allowed for flushing queued payloads on exit."""
+        return float(self._config.get(CONF_SHUTDOWN_TIMEOUT, DEFAULT_SHUTDOWN_TIMEOUT))
+
+    @property
+    def station_claim_batch_size(self) -> int:
+        """Return the number of a station's payloads claimed by a publish worker."""
+        return int(
+            self._config.get(
+                CONF_STATION_CLAIM_BATCH_SIZE, DEFAULT_STATION_CLAIM_BATCH_SIZE
+            )
+        )
+
+    @property
+    def unit_converter(self) -> UnitConverter:
+        """Return the unit conversions for the configured unit systems."""
+        return self._unit_converter
+
     @property
     def verbose(self) -> bool:
         """Return whether verbose logging is enabled."""
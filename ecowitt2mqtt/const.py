@@ -11,15 +11,27 @@ LOGGER = logging.getLogger(__package__)
 
 # Configuration keys:
 CONF_BATTERY_OVERRIDES: Final = "battery_override"
+CONF_COALESCE_WINDOW: Final = "coalesce_window"
 CONF_CONFIG: Final = "config"
+CONF_DEDUPE_WINDOW: Final = "dedupe_window"
 CONF_DEFAULT_BATTERY_STRATEGY: Final = "default_battery_strategy"
 CONF_DIAGNOSTICS: Final = "diagnostics"
 CONF_DISABLE_CALCULATED_DATA: Final = "disable_calculated_data"
 CONF_ENDPOINT: Final = "endpoint"
+CONF_EXCLUDE_KEY: Final = "exclude_key"
+CONF_FAST_INGEST: Final = "fast_ingest"
+CONF_HASS_DEADBAND: Final = "hass_deadband"
+CONF_HASS_DELTA_PUBLISHING: Final = "hass_delta_publishing"
 CONF_HASS_DISCOVERY: Final = "hass_discovery"
 CONF_HASS_DISCOVERY_PREFIX: Final = "hass_discovery_prefix"
 CONF_HASS_ENTITY_ID_PREFIX: Final = "hass_entity_id_prefix"
+CONF_HASS_HEARTBEAT: Final = "hass_heartbeat"
+CONF_INCLUDE_KEY: Final = "include_key"
+CONF_INGEST_WORKERS: Final = "ingest_workers"
 CONF_INPUT_UNIT_SYSTEM: Final = "input_unit_system"
+CONF_LOCAL_API_GATEWAY: Final = "local_api_gateway"
+CONF_LOCAL_API_POLL_INTERVAL: Final = "local_api_poll_interval"
+CONF_LOCAL_API_TIMEOUT: Final = "local_api_timeout"
 CONF_MQTT_BROKER: Final = "mqtt_broker"
 CONF_MQTT_PASSWORD: Final = "mqtt_password"
 CONF_MQTT_PORT: Final = "mqtt_port"
@@ -29,7 +41,13 @@ CONF_MQTT_TOPIC: Final = "mqtt_topic"
 CONF_MQTT_USERNAME: Final = "mqtt_username"
 CONF_OUTPUT_UNIT_SYSTEM: Final = "output_unit_system"
 CONF_PORT: Final = "port"
+CONF_PUBLISH_WORKERS: Final = "publish_workers"
+CONF_QUEUE_OVERFLOW_POLICY: Final = "queue_overflow_policy"
+CONF_QUEUE_SIZE: Final = "queue_size"
 CONF_RAW_DATA: Final = "raw_data"
+CONF_ROLLING_STATS_KEY: Final = "rolling_stats_key"
+CONF_SHUTDOWN_TIMEOUT: Final = "shutdown_timeout"
+CONF_STATION_CLAIM_BATCH_SIZE: Final = "station_claim_batch_size"
 CONF_VERBOSE: Final = "verbose"
 
 # Data points (glob):
@@ -56,11 +74,13 @@ DATA_POINT_GLOB_WIND: Final = "wind"
 DATA_POINT_GLOB_WINDDIR: Final = "winddir"
 
 # Data points (specific):
+DATA_POINT_BAROMRELIN: Final = "baromrelin"
 DATA_POINT_BEAUFORT_SCALE: Final = "beaufortscale"
 DATA_POINT_CO2: Final = "co2"
 DATA_POINT_CO2_24H: Final = "co2_24h"
 DATA_POINT_CO2_BATT: Final = "co2_batt"
 DATA_POINT_DAILY_RAIN: Final = "dailyrain"
+DATA_POINT_DATEUTC: Final = "dateutc"
 DATA_POINT_DEWPOINT: Final = "dewpoint"
 DATA_POINT_DRAIN_PIEZO: Final = "drain_piezo"
 DATA_POINT_ERAIN_PIEZO: Final = "erain_piezo"
@@ -80,7 +100,10 @@ DATA_POINT_LIGHTNING_NUM: Final = "lightning_num"
 DATA_POINT_LIGHTNING_TIME: Final = "lightning_time"
 DATA_POINT_MONTHLY_RAIN: Final = "monthlyrain"
 DATA_POINT_MRAIN_PIEZO: Final = "mrain_piezo"
+DATA_POINT_PRESSURE_TENDENCY: Final = "pressuretendency"
+DATA_POINT_PRESSURE_TREND: Final = "pressuretrend"
 DATA_POINT_RAIN_RATE: Final = "rainrate"
+DATA_POINT_ROLLING_STDDEV: Final = "rolling_stddev"
 DATA_POINT_RUNTIME: Final = "runtime"
 DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_1: Final = "safe_exposure_time_skin_type_1"
 DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_2: Final = "safe_exposure_time_skin_type_2"
@@ -117,18 +140,31 @@ DATA_POINT_WRAIN_PIEZO: Final = "wrain_piezo"
 DATA_POINT_WS90_VER: Final = "ws90_ver"
 DATA_POINT_YEARLY_RAIN: Final = "yearlyrain"
 DATA_POINT_YRAIN_PIEZO: Final = "yrain_piezo"
+DATA_POINT_ZAMBRETTI_FORECAST: Final = "zambrettiforecast"
 
 # Environment variables:
 ENV_BATTERY_OVERRIDE: Final = "ECOWITT2MQTT_BATTERY_OVERRIDE"
+ENV_COALESCE_WINDOW: Final = "ECOWITT2MQTT_COALESCE_WINDOW"
 ENV_CONFIG: Final = "ECOWITT2MQTT_CONFIG"
+ENV_DEDUPE_WINDOW: Final = "ECOWITT2MQTT_DEDUPE_WINDOW"
 ENV_DEFAULT_BATTERY_STRATEGY: Final = "ECOWITT2MQTT_DEFAULT_BATTERY_STRATEGY"
 ENV_DIAGNOSTICS: Final = "ECOWITT2MQTT_DIAGNOSTICS"
 ENV_DISABLE_CALCULATED_DATA: Final = "ECOWITT2MQTT_DISABLE_CALCULATED_DATA"
 ENV_ENDPOINT: Final = "ECOWITT2MQTT_ENDPOINT"
+ENV_EXCLUDE_KEY: Final = "ECOWITT2MQTT_EXCLUDE_KEY"
+ENV_FAST_INGEST: Final = "ECOWITT2MQTT_FAST_INGEST"
+ENV_HASS_DEADBAND: Final = "ECOWITT2MQTT_HASS_DEADBAND"
+ENV_HASS_DELTA_PUBLISHING: Final = "ECOWITT2MQTT_HASS_DELTA_PUBLISHING"
 ENV_HASS_DISCOVERY: Final = "ECOWITT2MQTT_HASS_DISCOVERY"
 ENV_HASS_DISCOVERY_PREFIX: Final = "ECOWITT2MQTT_HASS_DISCOVERY_PREFIX"
 ENV_HASS_ENTITY_ID_PREFIX: Final = "ECOWITT2MQTT_HASS_ENTITY_ID_PREFIX"
+ENV_HASS_HEARTBEAT: Final = "ECOWITT2MQTT_HASS_HEARTBEAT"
+ENV_INCLUDE_KEY: Final = "ECOWITT2MQTT_INCLUDE_KEY"
+ENV_INGEST_WORKERS: Final = "ECOWITT2MQTT_INGEST_WORKERS"
 ENV_INPUT_UNIT_SYSTEM: Final = "ECOWITT2MQTT_INPUT_UNIT_SYSTEM"
+ENV_LOCAL_API_GATEWAY: Final = "ECOWITT2MQTT_LOCAL_API_GATEWAY"
+ENV_LOCAL_API_POLL_INTERVAL: Final = "ECOWITT2MQTT_LOCAL_API_POLL_INTERVAL"
+ENV_LOCAL_API_TIMEOUT: Final = "ECOWITT2MQTT_LOCAL_API_TIMEOUT"
 ENV_MQTT_BROKER: Final = "ECOWITT2MQTT_MQTT_BROKER"
 ENV_MQTT_PASSWORD: Final = "ECOWITT2MQTT_MQTT_PASSWORD"
 ENV_MQTT_PORT: Final = "ECOWITT2MQTT_MQTT_PORT"
@@ -138,7 +174,13 @@ ENV_MQTT_TOPIC: Final = "ECOWITT2MQTT_MQTT_TOPIC"
 ENV_MQTT_USERNAME: Final = "ECOWITT2MQTT_MQTT_USERNAME"
 ENV_OUTPUT_UNIT_SYSTEM: Final = "ECOWITT2MQTT_OUTPUT_UNIT_SYSTEM"
 ENV_PORT: Final = "ECOWITT2MQTT_PORT"
+ENV_PUBLISH_WORKERS: Final = "ECOWITT2MQTT_PUBLISH_WORKERS"
+ENV_QUEUE_OVERFLOW_POLICY: Final = "ECOWITT2MQTT_QUEUE_OVERFLOW_POLICY"
+ENV_QUEUE_SIZE: Final = "ECOWITT2MQTT_QUEUE_SIZE"
 ENV_RAW_DATA: Final = "ECOWITT2MQTT_RAW_DATA"
+ENV_ROLLING_STATS_KEY: Final = "ECOWITT2MQTT_ROLLING_STATS_KEY"
+ENV_SHUTDOWN_TIMEOUT: Final = "ECOWITT2MQTT_SHUTDOWN_TIMEOUT"
+ENV_STATION_CLAIM_BATCH_SIZE: Final = "ECOWITT2MQTT_STATION_CLAIM_BATCH_SIZE"
 ENV_VERBOSE: Final = "ECOWITT2MQTT_VERBOSE"
 
 # Legacy environment variables that will be deprecated at some point:
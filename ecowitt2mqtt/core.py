@@ -12,6 +12,7 @@ from ecowitt2mqtt.const import (
     LOGGER,
     __version__ as ecowitt2mqtt_version,
 )
+from ecowitt2mqtt.data import PROCESSING_PLANS, resolve_key
 from ecowitt2mqtt.helpers.logging import TyperLoggerHandler
 from ecowitt2mqtt.runtime import Runtime
 
@@ -33,6 +34,12 @@ class Ecowitt:  # pylint: disable=too-few-public-methods
         )
 
         self._config = Config(params)
+
+        # Key resolutions and processing plans are cached process-wide, so don't carry
+        # them across configs:
+        PROCESSING_PLANS.clear()
+        resolve_key.cache_clear()
+
         self._runtime = Runtime(self)
 
     @property
@@ -1,14 +1,29 @@
 """Define data processing."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from functools import partial
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+from datetime import datetime, timezone
+from functools import lru_cache
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    TypeVar,
+    Union,
+)
 
 from ecowitt2mqtt.const import (
     DATA_POINT_BEAUFORT_SCALE,
     DATA_POINT_CO2,
     DATA_POINT_CO2_24H,
+    DATA_POINT_DATEUTC,
     DATA_POINT_DEWPOINT,
     DATA_POINT_FEELSLIKE,
     DATA_POINT_FROST_POINT,
@@ -62,6 +77,11 @@ from ecowitt2mqtt.const import (
 )
 from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint
 from ecowitt2mqtt.helpers.calculator.battery import calculate_battery
+from ecowitt2mqtt.helpers.calculator.derived import (
+    DerivedValueGraph,
+    DerivedValueNode,
+    DerivedValues,
+)
 from ecowitt2mqtt.helpers.calculator.leak import calculate_leak
 from ecowitt2mqtt.helpers.calculator.meteo import (
     calculate_absolute_humidity,
@@ -93,13 +113,20 @@ from ecowitt2mqtt.helpers.calculator.meteo import (
     calculate_wind_chill,
     calculate_wind_dir,
     calculate_wind_speed,
+    derive_absolute_humidity,
+    derive_dew_point,
+    derive_frost_point,
+    derive_simmer_index,
+    derive_temperature_c,
+    derive_temperature_f,
 )
 from ecowitt2mqtt.helpers.calculator.time import (
     calculate_dt_from_epoch,
     calculate_runtime,
 )
 from ecowitt2mqtt.helpers.device import Device, get_device_from_raw_payload
-from ecowitt2mqtt.util import glob_search
+from ecowitt2mqtt.helpers.filter import KeyFilter
+from ecowitt2mqtt.util import GlobMatcher
 
 if TYPE_CHECKING:
     from ecowitt2mqtt.core import Ecowitt
@@ -155,6 +182,7 @@ CALCULATOR_FUNCTION_MAP: dict[str, Callable[..., CalculatedDataPoint]] = {
     DATA_POINT_UV: calculate_uv_index,
     DATA_POINT_WINDCHILL: calculate_wind_chill,
 }
+CALCULATOR_MATCHER = GlobMatcher(CALCULATOR_FUNCTION_MAP)
 
 DEFAULT_KEYS_TO_IGNORE = [
     "PASSKEY",
@@ -175,33 +203,148 @@ UNIT_SUFFIX_MAP = {
     DATA_POINT_TOTAL_AIN: "in",
 }
 
-# Map calculated data points to the data points they depend on - note that the order
-# of the input keys inside the tuple is important, as those values are passed to their
-# respective calculator (as args) in that order:
+# Define intermediate values that several calculated data points share (so that each
+# is only derived once per payload):
+DERIVED_ABSOLUTE_HUMIDITY = "absolute_humidity"
+DERIVED_ABSOLUTE_HUMIDITY_IN = "absolute_humidity_in"
+DERIVED_DEW_POINT = "dew_point"
+DERIVED_FROST_POINT = "frost_point"
+DERIVED_SIMMER_INDEX = "simmer_index"
+DERIVED_TEMPERATURE_C = "temperature_c"
+DERIVED_TEMPERATURE_F = "temperature_f"
+DERIVED_TEMPERATURE_IN_C = "temperature_in_c"
+
+DERIVED_VALUES = DerivedValueGraph(
+    {
+        DERIVED_ABSOLUTE_HUMIDITY: DerivedValueNode(
+            derive_absolute_humidity, (DERIVED_TEMPERATURE_C, DATA_POINT_HUMIDITY)
+        ),
+        DERIVED_ABSOLUTE_HUMIDITY_IN: DerivedValueNode(
+            derive_absolute_humidity, (DERIVED_TEMPERATURE_IN_C, DATA_POINT_HUMIDITY)
+        ),
+        DERIVED_DEW_POINT: DerivedValueNode(
+            derive_dew_point, (DERIVED_TEMPERATURE_C, DATA_POINT_HUMIDITY)
+        ),
+        DERIVED_FROST_POINT: DerivedValueNode(
+            derive_frost_point, (DERIVED_TEMPERATURE_C, DERIVED_DEW_POINT)
+        ),
+        DERIVED_SIMMER_INDEX: DerivedValueNode(
+            derive_simmer_index, (DERIVED_TEMPERATURE_F, DATA_POINT_HUMIDITY)
+        ),
+        DERIVED_TEMPERATURE_C: DerivedValueNode(
+            derive_temperature_c, (DATA_POINT_TEMPF,)
+        ),
+        DERIVED_TEMPERATURE_F: DerivedValueNode(
+            derive_temperature_f, (DATA_POINT_TEMPF,)
+        ),
+        DERIVED_TEMPERATURE_IN_C: DerivedValueNode(
+            derive_temperature_c, (DATA_POINT_TEMPINF,)
+        ),
+    }
+)
+
+# Map calculated data points to the (payload or derived) values they depend on - note
+# that the order of the input keys inside the tuple is important, as those values are
+# passed to their respective calculator (as args) in that order:
 BEAUFORT_SCALE_KEYS = (DATA_POINT_WINDSPEEDMPH,)
-DEW_POINT_KEYS = (DATA_POINT_TEMPF, DATA_POINT_HUMIDITY)
-FEELS_LIKE_KEYS = (DATA_POINT_TEMPF, DATA_POINT_HUMIDITY, DATA_POINT_WINDSPEEDMPH)
-FROST_KEYS = (DATA_POINT_TEMPF, DATA_POINT_HUMIDITY)
-HEAT_INDEX_KEYS = (DATA_POINT_TEMPF, DATA_POINT_HUMIDITY)
-HUMIDITY_ABS_IN_KEYS = (DATA_POINT_TEMPINF, DATA_POINT_HUMIDITY)
-HUMIDITY_ABS_KEYS = (DATA_POINT_TEMPF, DATA_POINT_HUMIDITY)
+DEW_POINT_KEYS = (DERIVED_DEW_POINT,)
+FEELS_LIKE_KEYS = (DERIVED_TEMPERATURE_F, DATA_POINT_HUMIDITY, DATA_POINT_WINDSPEEDMPH)
+FROST_POINT_KEYS = (DERIVED_FROST_POINT,)
+FROST_RISK_KEYS = (
+    DERIVED_TEMPERATURE_C,
+    DERIVED_FROST_POINT,
+    DERIVED_ABSOLUTE_HUMIDITY,
+)
+HEAT_INDEX_KEYS = (DERIVED_TEMPERATURE_F, DATA_POINT_HUMIDITY)
+HUMIDITY_ABS_IN_KEYS = (DERIVED_ABSOLUTE_HUMIDITY_IN,)
+HUMIDITY_ABS_KEYS = (DERIVED_ABSOLUTE_HUMIDITY,)
 ILLUMINANCE_KEYS = (DATA_POINT_SOLARRADIATION,)
-SIMMER_KEYS = (DATA_POINT_TEMPF, DATA_POINT_HUMIDITY)
-THERMAL_PERCEPTION_KEYS = (DATA_POINT_TEMPF, DATA_POINT_HUMIDITY)
+SIMMER_KEYS = (DERIVED_SIMMER_INDEX,)
+THERMAL_PERCEPTION_KEYS = (DERIVED_DEW_POINT,)
 UV_INDEX_KEYS = (DATA_POINT_UV,)
-WIND_CHILL_KEYS = (DATA_POINT_TEMPF, DATA_POINT_WINDSPEEDMPH)
+WIND_CHILL_KEYS = (DERIVED_TEMPERATURE_F, DATA_POINT_WINDSPEEDMPH)
+
+# The maximum number of distinct payload keys to keep resolutions for (far more than
+# any real set of devices sends):
+KEY_RESOLUTION_CACHE_SIZE = 1024
+
+# A filter that selects every data point:
+DEFAULT_KEY_FILTER = KeyFilter()
+
+# The maximum number of distinct payload key-sets (i.e., device setups) to keep
+# processing plans for:
+PROCESSING_PLAN_CACHE_SIZE = 256
+
+# Map calculated data points to the data points they are calculated from:
+CALCULATED_DATA_POINT_INPUT_KEYS = (
+    (DATA_POINT_BEAUFORT_SCALE, BEAUFORT_SCALE_KEYS),
+    (DATA_POINT_DEWPOINT, DEW_POINT_KEYS),
+    (DATA_POINT_FEELSLIKE, FEELS_LIKE_KEYS),
+    (DATA_POINT_FROST_POINT, FROST_POINT_KEYS),
+    (DATA_POINT_FROST_RISK, FROST_RISK_KEYS),
+    (DATA_POINT_HEATINDEX, HEAT_INDEX_KEYS),
+    (DATA_POINT_HUMIDITY_ABS, HUMIDITY_ABS_KEYS),
+    (DATA_POINT_HUMIDITY_ABS_IN, HUMIDITY_ABS_IN_KEYS),
+    (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_1, UV_INDEX_KEYS),
+    (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_2, UV_INDEX_KEYS),
+    (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_3, UV_INDEX_KEYS),
+    (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_4, UV_INDEX_KEYS),
+    (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_5, UV_INDEX_KEYS),
+    (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_6, UV_INDEX_KEYS),
+    (DATA_POINT_SIMMER_INDEX, SIMMER_KEYS),
+    (DATA_POINT_SIMMER_ZONE, SIMMER_KEYS),
+    (DATA_POINT_SOLARRADIATION_LUX, ILLUMINANCE_KEYS),
+    (DATA_POINT_SOLARRADIATION_PERCEIVED, ILLUMINANCE_KEYS),
+    (DATA_POINT_THERMAL_PERCEPTION, THERMAL_PERCEPTION_KEYS),
+    (DATA_POINT_WINDCHILL, WIND_CHILL_KEYS),
+)
 
 T = TypeVar("T")
 
+ValueParser = Callable[[Any], Any]
+
+
+class KeyResolution(NamedTuple):
+    """Define how a payload key maps to a data point and its calculator."""
 
-def get_calculator_function(
-    ecowitt: Ecowitt, key: str
-) -> partial[CalculatedDataPoint] | None:
-    """Get a data calculator function for a particular data key (if it exists)."""
-    data_point, func = glob_search(CALCULATOR_FUNCTION_MAP, key)
-    if not data_point or not func:
-        return None
-    return partial(func, ecowitt, key, data_point)
+    data_point: str | None
+    calculator: Callable[..., CalculatedDataPoint] | None
+    key: str
+    unit_suffix: str | None
+
+
+@lru_cache(maxsize=KEY_RESOLUTION_CACHE_SIZE)
+def resolve_key(payload_key: str) -> KeyResolution:
+    """Resolve a payload key (once) into its data point, calculator, and unitless key.
+
+    Payloads repeat the same small set of keys, so the (comparatively expensive) glob
+    search is only ever done the first time a key is seen.
+    """
+    data_point, func = CALCULATOR_MATCHER.search(payload_key)
+
+    if not data_point:
+        return KeyResolution(None, None, payload_key, None)
+
+    suffix = UNIT_SUFFIX_MAP.get(data_point)
+    if suffix is None or not payload_key.endswith(suffix):
+        # Return the key as-is if the key doesn't end with the unit:
+        return KeyResolution(data_point, func, payload_key, None)
+
+    return KeyResolution(data_point, func, payload_key[: -len(suffix)], suffix)
+
+
+def get_payload_timestamp(data: dict[str, Any]) -> float:
+    """Return when a payload was measured (in seconds since the epoch).
+
+    Payloads are timestamped (in UTC) by the station, so replayed or queued payloads
+    keep their original times; payloads without a valid timestamp count as measured
+    now.
+    """
+    try:
+        measured_at = datetime.fromisoformat(data[DATA_POINT_DATEUTC])
+    except (KeyError, TypeError, ValueError):
+        return time.time()
+    return measured_at.replace(tzinfo=timezone.utc).timestamp()
 
 
 def get_typed_value(value: T) -> int | float | T:
@@ -215,85 +358,286 @@ def get_typed_value(value: T) -> int | float | T:
         return value
 
 
-def remove_unit_from_key(key: str) -> str:
-    """Remove a unit from the end of a key."""
-    data_point, _ = glob_search(CALCULATOR_FUNCTION_MAP, key)
+def get_numeric_value(value: T) -> int | float | T:
+    """Take a value that should be a number and return it as one (if possible).
+
+    This gives the same results as get_typed_value, but numeric keys that have no
+    value yet (e.g., lightning data before the first strike) are sent as empty strings,
+    so those are returned without raising (and catching) an exception.
+    """
+    if value == "":
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except ValueError:
+        return value
+
+
+def get_value_parser(func: Callable[..., CalculatedDataPoint]) -> ValueParser:
+    """Get the parser for the values of payload keys that a calculator handles.
+
+    Every calculator expects a number; keys without one can carry anything.
+    """
+    if func is calculate_raw_value:
+        return get_typed_value
+    return get_numeric_value
+
+
+def calculate_raw_value(
+    ecowitt: Ecowitt, key: str, data_point_key: str | None, *, value: Any
+) -> CalculatedDataPoint:
+    """Return a value that has no calculator as-is."""
+    return CalculatedDataPoint(data_point_key=key, value=value)
 
-    if not data_point:
-        return key
 
-    if (suffix := UNIT_SUFFIX_MAP.get(data_point)) is None or not key.endswith(suffix):
-        # Return the key as-is if:
-        #   1. This isn't a key we're monitoring.
-        #   2. The key doesn't end with the unit.
-        return key
+class RawDataStep(NamedTuple):
+    """Define how to process a data point for which raw data is provided."""
 
-    suffix_length = len(suffix)
-    return key[:-suffix_length]
+    payload_key: str
+    key: str
+    data_point: str | None
+    calculator: Callable[..., CalculatedDataPoint]
+    parser: ValueParser
+
+
+class CalculatedDataStep(NamedTuple):
+    """Define how to calculate a data point from others."""
+
+    data_point: str
+    input_keys: tuple[str, ...]
+    calculator: Callable[..., CalculatedDataPoint]
+
+
+DataPointStep = Union[RawDataStep, CalculatedDataStep]
+
+
+@dataclass(frozen=True)
+class ProcessingPlan:
+    """Define the steps that process payloads with a particular set of keys."""
+
+    # The steps that produce each output data point (in output order), both with and
+    # without calculated data:
+    raw_data_steps: Dict[str, RawDataStep]
+    data_point_steps: Dict[str, DataPointStep]
+    # The payload keys that the calculated data steps need:
+    calculated_data_input_keys: tuple[str, ...]
+
+    @classmethod
+    def from_payload_keys(
+        cls, payload_keys: Iterable[str], key_filter: KeyFilter = DEFAULT_KEY_FILTER
+    ) -> ProcessingPlan:
+        """Build a plan for payloads with a set of keys (in order).
+
+        Data points that the filter doesn't select are left out of the plan entirely
+        (though their payload values can still be used to calculate others).
+        """
+        raw_data_steps = []
+        payload_keys = [k for k in payload_keys if k not in DEFAULT_KEYS_TO_IGNORE]
+
+        for payload_key in payload_keys:
+            data_point, func, key, _ = resolve_key(payload_key)
+            if not key_filter.matches(payload_key, key):
+                LOGGER.debug("Skipping filtered data point: %s", payload_key)
+                continue
+            if func:
+                LOGGER.debug(
+                    "Calculator found for %s: %s (key: %s)",
+                    payload_key,
+                    func.__name__,
+                    key,
+                )
+            else:
+                LOGGER.debug("No calculator found for %s", payload_key)
+                func = calculate_raw_value
+            raw_data_steps.append(
+                RawDataStep(payload_key, key, data_point, func, get_value_parser(func))
+            )
+
+        calculated_data_steps = []
+        for data_point, input_keys in CALCULATED_DATA_POINT_INPUT_KEYS:
+            if not DERIVED_VALUES.get_inputs(input_keys).issubset(payload_keys):
+                continue
+            if not key_filter.matches(data_point):
+                LOGGER.debug("Skipping filtered data point: %s", data_point)
+                continue
+            _, func, _, _ = resolve_key(data_point)
+            if func:
+                calculated_data_steps.append(
+                    CalculatedDataStep(data_point, input_keys, func)
+                )
+
+        calculated_data_input_keys = DERIVED_VALUES.get_inputs(
+            key for step in calculated_data_steps for key in step.input_keys
+        )
+
+        # If multiple steps output the same key, the last one wins:
+        raw_data_steps_by_key = {step.key: step for step in raw_data_steps}
+        data_point_steps: dict[str, DataPointStep] = {**raw_data_steps_by_key}
+        for step in calculated_data_steps:
+            data_point_steps[step.data_point] = step
+
+        return cls(
+            raw_data_steps_by_key,
+            data_point_steps,
+            tuple(sorted(calculated_data_input_keys)),
+        )
+
+
+class ProcessingPlanCache:
+    """Define a bounded (LRU) cache of processing plans.
+
+    Plans are keyed by payload key-set (and the filter that they were built with).
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize."""
+        self._maxsize = maxsize
+        self._plans: OrderedDict[
+            tuple[frozenset[str], KeyFilter], ProcessingPlan
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached plans."""
+        return len(self._plans)
+
+    def clear(self) -> None:
+        """Remove all cached plans."""
+        self._plans.clear()
+
+    def get(
+        self, payload: dict[str, Any], key_filter: KeyFilter = DEFAULT_KEY_FILTER
+    ) -> ProcessingPlan:
+        """Return the plan for a payload (building it if its key-set is new)."""
+        plan_key = (frozenset(payload), key_filter)
+
+        if (plan := self._plans.get(plan_key)) is not None:
+            self._plans.move_to_end(plan_key)
+            return plan
+
+        LOGGER.debug("Building a processing plan for payload keys: %s", list(payload))
+        plan = self._plans[plan_key] = ProcessingPlan.from_payload_keys(
+            payload, key_filter
+        )
+        if len(self._plans) > self._maxsize:
+            self._plans.popitem(last=False)
+        return plan
+
+
+PROCESSING_PLANS = ProcessingPlanCache(PROCESSING_PLAN_CACHE_SIZE)
+
+
+class ProcessedOutput(Mapping[str, CalculatedDataPoint]):
+    """Define the data points of a processed payload.
+
+    Each data point is calculated the first time it is accessed (and then reused), so
+    consumers only pay for the data points that they actually use.
+    """
+
+    def __init__(
+        self, ecowitt: Ecowitt, data: dict[str, Any], plan: ProcessingPlan
+    ) -> None:
+        """Initialize."""
+        self._data = data
+        self._derived_values: DerivedValues | None = None
+        self._ecowitt = ecowitt
+        self._plan = plan
+        self._values: dict[str, CalculatedDataPoint] = {}
+
+        self._steps: Mapping[str, DataPointStep]
+        if ecowitt.config.disable_calculated_data:
+            self._steps = plan.raw_data_steps
+        else:
+            self._steps = plan.data_point_steps
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a data point exists (without calculating it)."""
+        return key in self._steps
+
+    def __getitem__(self, key: str) -> CalculatedDataPoint:
+        """Get a data point (calculating it if necessary)."""
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        step = self._steps[key]
+
+        if isinstance(step, RawDataStep):
+            value = step.calculator(
+                self._ecowitt,
+                step.payload_key,
+                step.data_point,
+                value=step.parser(self._data[step.payload_key]),
+            )
+        else:
+            derived_values = self._get_derived_values()
+            value = step.calculator(
+                self._ecowitt,
+                step.data_point,
+                step.data_point,
+                *(derived_values[input_key] for input_key in step.input_keys),
+            )
+
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the data point keys."""
+        return iter(self._steps)
+
+    def __len__(self) -> int:
+        """Return the number of data points."""
+        return len(self._steps)
+
+    def __repr__(self) -> str:
+        """Return a representation of every data point."""
+        return repr(dict(self))
+
+    def _get_derived_values(self) -> DerivedValues:
+        """Get the values that calculated data points are derived from."""
+        if self._derived_values is None:
+            self._derived_values = DERIVED_VALUES.evaluate(
+                self._ecowitt,
+                {
+                    key: get_numeric_value(self._data[key])
+                    for key in self._plan.calculated_data_input_keys
+                },
+            )
+        return self._derived_values
+
+    def calculate_all(self) -> None:
+        """Calculate every data point that hasn't been already."""
+        for key in self._steps:
+            _ = self[key]
 
 
 @dataclass(frozen=True)
 class ProcessedData:
-    """Define a processed data payload."""
+    """Define a processed data payload.
+
+    By default, every data point is calculated up front; a lazy instance calculates
+    each one as its output is accessed.
+    """
 
     ecowitt: Ecowitt
     data: dict[str, Any]
+    lazy: bool = False
     device: Device = field(init=False)
-    output: dict[str, CalculatedDataPoint] = field(default_factory=dict)
+    output: ProcessedOutput = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize."""
         object.__setattr__(self, "device", get_device_from_raw_payload(self.data))
 
-        # Process all of the data points for which raw data was provided:
-        for payload_key, payload_value in self.data.items():
-            if payload_key in DEFAULT_KEYS_TO_IGNORE:
-                continue
-
-            key = remove_unit_from_key(payload_key)
-            value = get_typed_value(payload_value)
+        # Payloads with the same keys are always processed the same way, so the
+        # decisions about how to do so are only made once per key-set:
+        plan = PROCESSING_PLANS.get(self.data, self.ecowitt.config.key_filter)
+        object.__setattr__(
+            self, "output", ProcessedOutput(self.ecowitt, self.data, plan)
+        )
 
-            if calculator := get_calculator_function(self.ecowitt, payload_key):
-                LOGGER.debug(
-                    "Calculator found for %s: %s (key: %s, value: %s)",
-                    payload_key,
-                    calculator.func.__name__,
-                    key,
-                    value,
-                )
-                self.output[key] = calculator(value=value)
-            else:
-                LOGGER.debug("No calculator found for %s", payload_key)
-                self.output[key] = CalculatedDataPoint(data_point_key=key, value=value)
-
-        if not self.ecowitt.config.disable_calculated_data:
-            # Process any from-scratch data points that can be calculated from others:
-            for payload_key, input_keys in (
-                (DATA_POINT_BEAUFORT_SCALE, BEAUFORT_SCALE_KEYS),
-                (DATA_POINT_DEWPOINT, DEW_POINT_KEYS),
-                (DATA_POINT_FEELSLIKE, FEELS_LIKE_KEYS),
-                (DATA_POINT_FROST_POINT, FROST_KEYS),
-                (DATA_POINT_FROST_RISK, FROST_KEYS),
-                (DATA_POINT_HEATINDEX, HEAT_INDEX_KEYS),
-                (DATA_POINT_HUMIDITY_ABS, HUMIDITY_ABS_KEYS),
-                (DATA_POINT_HUMIDITY_ABS_IN, HUMIDITY_ABS_IN_KEYS),
-                (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_1, UV_INDEX_KEYS),
-                (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_2, UV_INDEX_KEYS),
-                (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_3, UV_INDEX_KEYS),
-                (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_4, UV_INDEX_KEYS),
-                (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_5, UV_INDEX_KEYS),
-                (DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_6, UV_INDEX_KEYS),
-                (DATA_POINT_SIMMER_INDEX, SIMMER_KEYS),
-                (DATA_POINT_SIMMER_ZONE, SIMMER_KEYS),
-                (DATA_POINT_SOLARRADIATION_LUX, ILLUMINANCE_KEYS),
-                (DATA_POINT_SOLARRADIATION_PERCEIVED, ILLUMINANCE_KEYS),
-                (DATA_POINT_THERMAL_PERCEPTION, THERMAL_PERCEPTION_KEYS),
-                (DATA_POINT_WINDCHILL, WIND_CHILL_KEYS),
-            ):
-                if not all(k in self.data for k in input_keys):
-                    continue
-
-                if calculator := get_calculator_function(self.ecowitt, payload_key):
-                    self.output[payload_key] = calculator(
-                        *(get_typed_value(self.data[key]) for key in input_keys)
-                    )
+        if not self.lazy:
+            self.output.calculate_all()
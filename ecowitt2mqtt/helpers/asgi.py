@@ -0,0 +1,139 @@
+"""Define a raw ASGI fast path for ingesting Ecowitt payloads."""
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Dict, MutableMapping
+from urllib.parse import unquote_plus
+
+from fastapi import status
+
+from ecowitt2mqtt.const import LOGGER
+
+ASGIMessage = MutableMapping[str, Any]
+ASGIReceive = Callable[[], Awaitable[ASGIMessage]]
+ASGISend = Callable[[ASGIMessage], Awaitable[None]]
+ASGIApp = Callable[[Dict[str, Any], ASGIReceive, ASGISend], Awaitable[None]]
+
+CONTENT_TYPE_FORM_URLENCODED = b"application/x-www-form-urlencoded"
+
+# Ecowitt payloads are ~2 KiB; anything well beyond that isn't a gateway:
+DEFAULT_MAX_BODY_SIZE = 64 * 1024
+
+
+class MalformedBodyError(ValueError):
+    """Define an error related to a body that can't be parsed."""
+
+    pass
+
+
+def parse_urlencoded_body(body: bytes) -> dict[str, str]:
+    """Parse an application/x-www-form-urlencoded body in a single pass.
+
+    Gateways send plain ASCII key/value pairs, so percent-decoding is only attempted on
+    the (rare) fields that actually need it.
+    """
+    try:
+        text = body.decode("ascii")
+    except UnicodeDecodeError as err:
+        raise MalformedBodyError("Body contains non-ASCII bytes") from err
+
+    payload: dict[str, str] = {}
+    for field in text.split("&"):
+        if not field:
+            continue
+
+        key, separator, value = field.partition("=")
+        if not separator or not key:
+            raise MalformedBodyError(f"Malformed field: {field}")
+
+        if "%" in field or "+" in field:
+            key = unquote_plus(key)
+            value = unquote_plus(value)
+
+        payload[key] = value
+
+    if not payload:
+        raise MalformedBodyError("Body contains no fields")
+
+    return payload
+
+
+class FastIngestMiddleware:
+    """Define ASGI middleware that handles payload POSTs without FastAPI routing.
+
+    Any request that isn't a urlencoded POST to the ingest path is passed through to
+    the wrapped application untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path: str,
+        async_on_payload: Callable[[dict[str, str]], Awaitable[bool]],
+        *,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ) -> None:
+        """Initialize."""
+        self._app = app
+        self._max_body_size = max_body_size
+        self._async_on_payload = async_on_payload
+        self._path = path
+
+    def _is_ingest_request(self, scope: dict[str, Any]) -> bool:
+        """Return whether a request should be handled by the fast path."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] != self._path
+        ):
+            return False
+
+        headers = dict(scope["headers"])
+        content_type: bytes = headers.get(b"content-type", b"")
+        return content_type.startswith(CONTENT_TYPE_FORM_URLENCODED)
+
+    async def __call__(
+        self, scope: dict[str, Any], receive: ASGIReceive, send: ASGISend
+    ) -> None:
+        """Handle an ASGI request."""
+        if not self._is_ingest_request(scope):
+            await self._app(scope, receive, send)
+            return
+
+        chunks = []
+        body_size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            body_size += len(chunk)
+            if body_size > self._max_body_size:
+                LOGGER.debug("Rejecting body larger than %s bytes", self._max_body_size)
+                await self._async_respond(
+                    send, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+                )
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        try:
+            payload = parse_urlencoded_body(b"".join(chunks))
+        except MalformedBodyError as err:
+            LOGGER.debug("Rejecting malformed body: %s", err)
+            await self._async_respond(send, status.HTTP_400_BAD_REQUEST)
+            return
+
+        if await self._async_on_payload(payload):
+            await self._async_respond(send, status.HTTP_204_NO_CONTENT)
+        else:
+            await self._async_respond(send, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    @staticmethod
+    async def _async_respond(send: ASGISend, status_code: int) -> None:
+        """Send an empty response with a particular status code."""
+        headers = []
+        if status_code != status.HTTP_204_NO_CONTENT:
+            headers.append((b"content-length", b"0"))
+        await send(
+            {"type": "http.response.start", "status": status_code, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": b""})
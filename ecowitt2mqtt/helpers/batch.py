@@ -0,0 +1,132 @@
+"""Define an incremental parser for batches of payloads."""
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, AsyncIterator, Iterator
+
+JSON_WHITESPACE = " \t\n\r"
+
+
+class MalformedBatchError(ValueError):
+    """Define an error related to a batch that can't be parsed."""
+
+    pass
+
+
+def normalize_batch_payload(item: Any) -> dict[str, str]:
+    """Return a batch item in the same shape as a form-encoded payload."""
+    if not isinstance(item, dict):
+        raise MalformedBatchError(f"Batch item isn't an object: {item!r}")
+    return {key: str(value) for key, value in item.items()}
+
+
+class BatchPayloadParser:
+    """Define a parser for NDJSON or a JSON array of payloads, fed in chunks.
+
+    The format is detected from the first non-whitespace character of the body. Each
+    call to `feed` yields the payloads that have been completed by that chunk (before
+    raising on any malformed data that follows them).
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._buffer = ""
+        self._decoder = json.JSONDecoder()
+        self._is_array: bool | None = None
+        self._array_closed = False
+        self._array_items = 0
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def _parse_array(self) -> Iterator[dict[str, str]]:
+        """Parse as many complete items as possible from a buffered JSON array."""
+        while True:
+            idx = self._skip_whitespace(0)
+            if idx == len(self._buffer):
+                self._buffer = ""
+                break
+
+            if self._array_closed:
+                raise MalformedBatchError("Unexpected data after the end of the array")
+
+            if self._buffer[idx] == "]":
+                self._array_closed = True
+                self._buffer = self._buffer[idx + 1 :]
+                continue
+
+            if self._array_items:
+                if self._buffer[idx] != ",":
+                    raise MalformedBatchError("Expected ',' between array items")
+                idx = self._skip_whitespace(idx + 1)
+
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, idx)
+            except json.JSONDecodeError:
+                # Most likely an incomplete item, so wait for more data:
+                break
+
+            self._array_items += 1
+            self._buffer = self._buffer[end:]
+            yield normalize_batch_payload(item)
+
+    def _skip_whitespace(self, idx: int) -> int:
+        """Return the index of the next non-whitespace character in the buffer."""
+        while idx < len(self._buffer) and self._buffer[idx] in JSON_WHITESPACE:
+            idx += 1
+        return idx
+
+    def _parse_lines(self, final: bool = False) -> Iterator[dict[str, str]]:
+        """Parse every complete line from a buffered NDJSON body."""
+        *lines, self._buffer = self._buffer.split("\n")
+        if final:
+            lines.append(self._buffer)
+            self._buffer = ""
+
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as err:
+                raise MalformedBatchError(f"Invalid JSON line: {line}") from err
+            yield normalize_batch_payload(item)
+
+    def feed(self, chunk: bytes, *, final: bool = False) -> Iterator[dict[str, str]]:
+        """Add a chunk of the body and yield any payloads it completes."""
+        try:
+            self._buffer += self._text_decoder.decode(chunk, final=final)
+        except UnicodeDecodeError as err:
+            raise MalformedBatchError("Body isn't valid UTF-8") from err
+
+        if self._is_array is None:
+            self._buffer = self._buffer.lstrip(JSON_WHITESPACE)
+            if not self._buffer:
+                return
+            self._is_array = self._buffer.startswith("[")
+            if self._is_array:
+                self._buffer = self._buffer[1:]
+
+        if self._is_array:
+            yield from self._parse_array()
+        else:
+            yield from self._parse_lines()
+
+    def close(self) -> Iterator[dict[str, str]]:
+        """Finish parsing (raising if the body was incomplete)."""
+        yield from self.feed(b"", final=True)
+        if not self._is_array:
+            yield from self._parse_lines(final=True)
+        elif not self._array_closed:
+            raise MalformedBatchError("Incomplete or invalid JSON array")
+
+
+async def async_parse_batch(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[dict[str, str]]:
+    """Yield payloads from a stream of batch body chunks as they are completed."""
+    parser = BatchPayloadParser()
+    async for chunk in chunks:
+        for payload in parser.feed(chunk):
+            yield payload
+    for payload in parser.close():
+        yield payload
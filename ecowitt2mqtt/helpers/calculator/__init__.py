@@ -1,12 +1,16 @@
 """Define various calculators."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+import sys
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from ecowitt2mqtt.helpers.typing import DataValueType
 
+# Most data points have no attributes, so they all share this (immutable) mapping:
+EMPTY_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+
 
 class DataPointType(Enum):
     """Define types of battery configuration."""
@@ -15,12 +19,42 @@ class DataPointType(Enum):
     NON_BOOLEAN = 2
 
 
-@dataclass
 class CalculatedDataPoint:
-    """Define a calculated data point."""
-
-    data_point_key: str
-    value: DataValueType
-    unit: str | None = None
-    attributes: dict[str, Any] = field(default_factory=dict)
-    data_type: DataPointType = DataPointType.NON_BOOLEAN
+    """Define a calculated data point.
+
+    Every payload creates dozens of these, so they don't carry a per-instance __dict__
+    (or, unless they have some, an attributes dict of their own); units are interned so
+    that every data point with the same unit shares one string.
+    """
+
+    __slots__ = ("data_point_key", "value", "unit", "attributes", "data_type")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        data_point_key: str,
+        value: DataValueType,
+        unit: str | None = None,
+        attributes: Mapping[str, Any] = EMPTY_ATTRIBUTES,
+        data_type: DataPointType = DataPointType.NON_BOOLEAN,
+    ) -> None:
+        """Initialize."""
+        self.data_point_key = data_point_key
+        self.value = value
+        self.unit = unit if unit is None else sys.intern(unit)
+        self.attributes = attributes
+        self.data_type = data_type
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether two data points are equal."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a representation of the data point."""
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
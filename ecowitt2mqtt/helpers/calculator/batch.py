@@ -0,0 +1,522 @@
+"""Define vectorized calculators for batches (e.g., archives) of data.
+
+Every calculated data point is calculated for whole columns of values at once; this
+requires NumPy, which is an optional dependency (`pip install ecowitt2mqtt[batch]`).
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Callable, Iterable, Mapping, NamedTuple, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from ecowitt2mqtt.const import (
+    DATA_POINT_BEAUFORT_SCALE,
+    DATA_POINT_DEWPOINT,
+    DATA_POINT_FEELSLIKE,
+    DATA_POINT_FROST_POINT,
+    DATA_POINT_FROST_RISK,
+    DATA_POINT_HEATINDEX,
+    DATA_POINT_HUMIDITY,
+    DATA_POINT_HUMIDITY_ABS,
+    DATA_POINT_HUMIDITY_ABS_IN,
+    DATA_POINT_SIMMER_INDEX,
+    DATA_POINT_SIMMER_ZONE,
+    DATA_POINT_SOLARRADIATION,
+    DATA_POINT_SOLARRADIATION_LUX,
+    DATA_POINT_SOLARRADIATION_PERCEIVED,
+    DATA_POINT_TEMPF,
+    DATA_POINT_TEMPINF,
+    DATA_POINT_THERMAL_PERCEPTION,
+    DATA_POINT_UV,
+    DATA_POINT_WINDCHILL,
+    DATA_POINT_WINDSPEEDMPH,
+    UNIT_SYSTEM_IMPERIAL,
+    UNIT_SYSTEM_METRIC,
+)
+from ecowitt2mqtt.helpers.calculator import kernel
+from ecowitt2mqtt.helpers.calculator.meteo import (
+    BEAUFORT_SCALE_LOOKUPS,
+    FROST_RISK_HUMIDITY_ABS_THRESHOLD,
+    SAFE_EXPOSURE_INFO_MAP,
+    SIMMER_ZONE_LOOKUP,
+    THERMAL_PERCEPTION_LOOKUP,
+    FrostRisk,
+    RatingLookup,
+)
+from ecowitt2mqtt.helpers.calculator.units import (
+    UNIT_CONVERSIONS,
+    Quantity,
+    UnitConversion,
+    UnitConverter,
+)
+from ecowitt2mqtt.helpers.typing import UnitSystemType
+
+BoolArray = npt.NDArray[np.bool_]
+FloatArray = npt.NDArray[np.float64]
+ObjectArray = npt.NDArray[np.object_]
+
+# NumPy's exp, log, and pow can differ from the scalar ones in the last bit or so; any
+# value this close (relatively) to a rounding or rating boundary is recalculated with
+# the scalar kernel, so that the results are always identical:
+BOUNDARY_TOLERANCE = 1e-9
+
+FROST_RISKS = np.array(
+    [FrostRisk.UNLIKELY, FrostRisk.VERY_PROBABLE, FrostRisk.PROBABLE, FrostRisk.NO_RISK]
+    + [None],
+    dtype=object,
+)
+
+
+class RatingTable(NamedTuple):
+    """Define a table of ratings that cover consecutive ranges of values."""
+
+    edges: FloatArray
+    ratings: ObjectArray
+
+    @classmethod
+    def from_lookup(
+        cls, lookup: RatingLookup[Any], value: Callable[[Any], Any] = lambda r: r
+    ) -> RatingTable:
+        """Create a table from a (scalar) rating lookup."""
+        # Values outside of every range are rated with the trailing None:
+        ratings = [value(rating) for rating in lookup.ratings] + [None]
+        return cls(
+            np.array(lookup.boundaries, dtype=np.float64),
+            np.array(ratings, dtype=object),
+        )
+
+    def rate(self, values: FloatArray) -> ObjectArray:
+        """Get the rating of each value."""
+        indices = np.searchsorted(self.edges, values, side="right") - 1
+        in_range = (values >= self.edges[0]) & (values < self.edges[-1])
+        return cast(
+            ObjectArray, self.ratings[np.where(in_range, indices, len(self.edges) - 1)]
+        )
+
+
+BEAUFORT_SCALES = {
+    unit_system: RatingTable.from_lookup(lookup, lambda r: r.number)
+    for unit_system, lookup in BEAUFORT_SCALE_LOOKUPS.items()
+}
+SIMMER_ZONES = RatingTable.from_lookup(SIMMER_ZONE_LOOKUP)
+THERMAL_PERCEPTIONS = RatingTable.from_lookup(THERMAL_PERCEPTION_LOOKUP)
+
+
+def _is_near(values: FloatArray, boundaries: Iterable[float]) -> BoolArray:
+    """Get whether each value is too close to a boundary to be rated reliably."""
+    near = np.zeros(values.shape, dtype=np.bool_)
+    for boundary in boundaries:
+        near |= np.abs(values - boundary) <= BOUNDARY_TOLERANCE * max(
+            abs(boundary), 1.0
+        )
+    return near
+
+
+def _recalculate(
+    values: FloatArray,
+    rows: BoolArray,
+    func: Callable[..., float],
+    *columns: FloatArray,
+) -> FloatArray:
+    """Recalculate some rows of values with a scalar function."""
+    values = values.copy()
+    for index in np.flatnonzero(rows):
+        values[index] = func(*(column[index].item() for column in columns))
+    return values
+
+
+def _round(
+    values: FloatArray,
+    precision: int,
+    func: Callable[..., float],
+    *columns: FloatArray,
+) -> FloatArray:
+    """Round values the way round() does.
+
+    Values that are (nearly) halfway between two roundings get the result of a scalar
+    function (which is expected to round them itself).
+    """
+    scale = 10.0**precision
+    scaled = values * scale
+    halfway = np.abs(scaled - np.floor(scaled) - 0.5) <= BOUNDARY_TOLERANCE * (
+        np.maximum(np.abs(scaled), 1.0)
+    )
+    return _recalculate(np.rint(scaled) / scale, halfway, func, *columns)
+
+
+def _convert(
+    conversion: UnitConversion,
+    values: FloatArray,
+    func: Callable[..., float],
+    *columns: FloatArray,
+) -> FloatArray:
+    """Convert values (which a scalar function calculates one row at a time)."""
+    converted = (
+        values - conversion.base
+    ) * conversion.multiplier / conversion.divisor + conversion.offset
+    return _round(
+        converted,
+        cast(int, conversion.precision),
+        lambda *args: conversion.convert(func(*args)),
+        *columns,
+    )
+
+
+def absolute_humidity(
+    temperature_c: FloatArray, relative_humidity: FloatArray
+) -> FloatArray:
+    """Calculate absolute humidity (in g/m³)."""
+    return cast(
+        FloatArray,
+        (
+            6.112
+            * np.exp((17.67 * temperature_c) / (temperature_c + 243.5))
+            * relative_humidity
+            * 2.1674
+        )
+        / (273.15 + temperature_c),
+    )
+
+
+def dew_point(temperature_c: FloatArray, relative_humidity: FloatArray) -> FloatArray:
+    """Calculate dew point (in °C); it's NaN for humidities outside of 1-100."""
+    positive = temperature_c > 0
+    b = np.where(
+        positive,
+        kernel.DEW_POINT_CONSTANTS_POSITIVE[0],
+        kernel.DEW_POINT_CONSTANTS_NEGATIVE[0],
+    )
+    c = np.where(
+        positive,
+        kernel.DEW_POINT_CONSTANTS_POSITIVE[1],
+        kernel.DEW_POINT_CONSTANTS_NEGATIVE[1],
+    )
+    vapor_pressure = (
+        relative_humidity / 100.0 * np.exp(b * temperature_c / (c + temperature_c))
+    )
+    return cast(
+        FloatArray,
+        np.where(
+            (relative_humidity < 1) | (relative_humidity > 100),
+            np.nan,
+            c * np.log(vapor_pressure) / (b - np.log(vapor_pressure)),
+        ),
+    )
+
+
+def frost_point(temperature_c: FloatArray, dew_point_c: FloatArray) -> FloatArray:
+    """Calculate frost point (in °C)."""
+    absolute_temp_c = temperature_c + 273.15
+    absolute_dew_point_c = dew_point_c + 273.15
+
+    return cast(
+        FloatArray,
+        (
+            absolute_dew_point_c
+            + (
+                2671.02
+                / (
+                    (2954.61 / absolute_temp_c)
+                    + 2.193665 * np.log(absolute_temp_c)
+                    - 13.3448
+                )
+            )
+            - absolute_temp_c
+        )
+        - 273.15,
+    )
+
+
+def heat_index(temperature_f: FloatArray, relative_humidity: FloatArray) -> FloatArray:
+    """Calculate heat index (in °F)."""
+    index = 0.5 * (
+        temperature_f + 61.0 + (temperature_f - 68.0) * 1.2 + relative_humidity * 0.094
+    )
+    c1, c2, c3, c4, c5, c6, c7, c8, c9 = kernel.HEAT_INDEX_COEFFICIENTS
+    regression = (
+        c1
+        + c2 * temperature_f
+        + c3 * relative_humidity
+        + c4 * temperature_f * relative_humidity
+        + c5 * temperature_f**2
+        + c6 * relative_humidity**2
+        + c7 * temperature_f**2 * relative_humidity
+        + c8 * temperature_f * relative_humidity**2
+        + c9 * temperature_f**2 * relative_humidity**2
+    )
+    return cast(FloatArray, np.where(index < 80, index, regression))
+
+
+def simmer_index(
+    temperature_f: FloatArray, relative_humidity: FloatArray
+) -> FloatArray:
+    """Calculate simmer index (in °F); it's NaN for temperatures below 70°F."""
+    return cast(
+        FloatArray,
+        np.where(
+            temperature_f < 70,
+            np.nan,
+            1.98
+            * (
+                temperature_f
+                - (0.55 - (0.0055 * relative_humidity)) * (temperature_f - 58.0)
+            )
+            - 56.83,
+        ),
+    )
+
+
+def wind_chill(temperature_f: FloatArray, wind_speed: FloatArray) -> FloatArray:
+    """Calculate wind chill (in °F); it's NaN where wind chill isn't defined."""
+    return cast(
+        FloatArray,
+        np.where(
+            (temperature_f > 50) | (wind_speed <= 3),
+            np.nan,
+            35.74
+            + (0.6215 * temperature_f)
+            - 35.75 * wind_speed**0.16
+            + 0.4275 * temperature_f * wind_speed**0.16,
+        ),
+    )
+
+
+def feels_like(
+    temperature_f: FloatArray, relative_humidity: FloatArray, wind_speed: FloatArray
+) -> FloatArray:
+    """Calculate "feels like" temperature (in °F)."""
+    return cast(
+        FloatArray,
+        np.where(
+            (temperature_f <= 50) & (wind_speed > 3),
+            wind_chill(temperature_f, wind_speed),
+            np.where(
+                temperature_f >= 80,
+                heat_index(temperature_f, relative_humidity),
+                temperature_f,
+            ),
+        ),
+    )
+
+
+def _frost_risk(
+    temperature_c: FloatArray, frost_point_c: FloatArray, absolute_humidity_: FloatArray
+) -> ObjectArray:
+    """Calculate the risk of frost forming."""
+    likely = (temperature_c <= 1.0) & (frost_point_c <= 0)
+    humid = absolute_humidity_ > FROST_RISK_HUMIDITY_ABS_THRESHOLD
+    indices = np.select(
+        [
+            np.isnan(temperature_c + frost_point_c + absolute_humidity_),
+            likely & ~humid,
+            likely,
+            (temperature_c <= 4.0) & (frost_point_c <= 0.5) & humid,
+        ],
+        [len(FROST_RISKS) - 1, 0, 1, 2],
+        default=3,
+    )
+    return cast(ObjectArray, FROST_RISKS[indices])
+
+
+def _temperatures(
+    unit_converter: UnitConverter, temperature: FloatArray
+) -> tuple[FloatArray, FloatArray]:
+    """Get temperatures (in the input unit system) in °C and °F."""
+    if unit_converter.input_unit_system == UNIT_SYSTEM_IMPERIAL:
+        return (temperature - 32) * 5 / 9.0, temperature
+    return temperature, temperature * 9 / 5.0 + 32
+
+
+def _temperature_conversion(
+    unit_converter: UnitConverter, unit_system: UnitSystemType
+) -> UnitConversion:
+    """Get the conversion of a temperature (in a unit system) to the output one."""
+    return UNIT_CONVERSIONS[Quantity.TEMPERATURE][
+        (unit_system, unit_converter.output_unit_system)
+    ]
+
+
+def _scalar_frost_point(temperature_c: float, relative_humidity: float) -> float:
+    """Calculate frost point (in °C) from temperature and humidity."""
+    return kernel.frost_point(
+        temperature_c, kernel.dew_point(temperature_c, relative_humidity)
+    )
+
+
+def _calculate_humidity_data_points(
+    unit_converter: UnitConverter,
+    temperature_c: FloatArray,
+    temperature_f: FloatArray,
+    relative_humidity: FloatArray,
+) -> dict[str, npt.NDArray[Any]]:
+    """Calculate the data points that need temperature and humidity."""
+    celsius = _temperature_conversion(unit_converter, UNIT_SYSTEM_METRIC)
+    fahrenheit = _temperature_conversion(unit_converter, UNIT_SYSTEM_IMPERIAL)
+    inputs_c = (temperature_c, relative_humidity)
+    inputs_f = (temperature_f, relative_humidity)
+
+    absolute_humidity_ = absolute_humidity(*inputs_c)
+    dew_point_c = dew_point(*inputs_c)
+    frost_point_c = frost_point(temperature_c, dew_point_c)
+    simmer_index_f = simmer_index(*inputs_f)
+
+    return {
+        DATA_POINT_DEWPOINT: _convert(
+            celsius, dew_point_c, kernel.dew_point, *inputs_c
+        ),
+        DATA_POINT_FROST_POINT: _convert(
+            celsius, frost_point_c, _scalar_frost_point, *inputs_c
+        ),
+        DATA_POINT_FROST_RISK: _frost_risk(
+            temperature_c,
+            _recalculate(
+                frost_point_c,
+                _is_near(frost_point_c, (0.0, 0.5)),
+                _scalar_frost_point,
+                *inputs_c,
+            ),
+            _recalculate(
+                absolute_humidity_,
+                _is_near(absolute_humidity_, (FROST_RISK_HUMIDITY_ABS_THRESHOLD,)),
+                kernel.absolute_humidity,
+                *inputs_c,
+            ),
+        ),
+        DATA_POINT_HEATINDEX: _convert(
+            fahrenheit, heat_index(*inputs_f), kernel.heat_index, *inputs_f
+        ),
+        DATA_POINT_HUMIDITY_ABS: _convert(
+            unit_converter[Quantity.ABSOLUTE_HUMIDITY],
+            absolute_humidity_,
+            kernel.absolute_humidity,
+            *inputs_c,
+        ),
+        DATA_POINT_SIMMER_INDEX: _convert(
+            fahrenheit, simmer_index_f, kernel.simmer_index, *inputs_f
+        ),
+        # Simmer indices only need basic arithmetic, so they're already identical:
+        DATA_POINT_SIMMER_ZONE: SIMMER_ZONES.rate(simmer_index_f),
+        DATA_POINT_THERMAL_PERCEPTION: THERMAL_PERCEPTIONS.rate(
+            _recalculate(
+                dew_point_c,
+                _is_near(dew_point_c, THERMAL_PERCEPTIONS.edges),
+                kernel.dew_point,
+                *inputs_c,
+            )
+        ),
+    }
+
+
+def _calculate_solar_radiation_data_points(
+    solar_radiation: FloatArray,
+) -> dict[str, npt.NDArray[Any]]:
+    """Calculate the data points that need solar radiation."""
+    lux = _round(
+        solar_radiation / 0.0079,
+        1,
+        lambda value: round(value / 0.0079, 1),
+        solar_radiation,
+    )
+    perceived = _round(
+        np.log10(lux) / 5, 2, lambda value: round(math.log10(value) / 5, 2), lux
+    )
+
+    return {
+        DATA_POINT_SOLARRADIATION_LUX: lux,
+        # A math domain error (for lux at or below 0) means 0% perceived:
+        DATA_POINT_SOLARRADIATION_PERCEIVED: np.where(lux <= 0, 0.0, perceived * 100),
+    }
+
+
+def _calculate_uv_data_points(uv_index: FloatArray) -> dict[str, npt.NDArray[Any]]:
+    """Calculate the data points that need UV index."""
+    results: dict[str, npt.NDArray[Any]] = {}
+
+    for data_point_key, safe_exposure_info in SAFE_EXPOSURE_INFO_MAP.items():
+        constant = safe_exposure_info.constant
+        results[data_point_key] = _round(
+            np.where(uv_index == 0, np.nan, (200 * constant) / (3 * uv_index)),
+            1,
+            lambda value, c=constant: round((200 * c) / (3 * value), 1),
+            uv_index,
+        )
+
+    return results
+
+
+def calculate_batch(
+    unit_converter: UnitConverter, columns: Mapping[str, npt.ArrayLike]
+) -> dict[str, npt.NDArray[Any]]:
+    """Calculate data points for columns of payload values.
+
+    Columns are keyed by the payload keys they hold (tempf, tempinf, humidity,
+    windspeedmph, uv, and solarradiation) and are in the input unit system. Every
+    calculated data point whose inputs are present is returned (keyed by data point)
+    in the output unit system, with the same values as the per-payload calculators:
+    numeric data points are float arrays (with NaN where there is no value), and
+    ratings are object arrays (with None where there is no rating).
+    """
+    values = {
+        key: np.asarray(column, dtype=np.float64) for key, column in columns.items()
+    }
+    humidity = values.get(DATA_POINT_HUMIDITY)
+    wind_speed = values.get(DATA_POINT_WINDSPEEDMPH)
+    results: dict[str, npt.NDArray[Any]] = {}
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if (solar_radiation := values.get(DATA_POINT_SOLARRADIATION)) is not None:
+            results.update(_calculate_solar_radiation_data_points(solar_radiation))
+
+        if (uv_index := values.get(DATA_POINT_UV)) is not None:
+            results.update(_calculate_uv_data_points(uv_index))
+
+        if wind_speed is not None:
+            results[DATA_POINT_BEAUFORT_SCALE] = BEAUFORT_SCALES[
+                unit_converter.input_unit_system
+            ].rate(wind_speed)
+
+        if (temperature := values.get(DATA_POINT_TEMPF)) is not None:
+            temperature_c, temperature_f = _temperatures(unit_converter, temperature)
+            fahrenheit = _temperature_conversion(unit_converter, UNIT_SYSTEM_IMPERIAL)
+
+            if humidity is not None:
+                results.update(
+                    _calculate_humidity_data_points(
+                        unit_converter, temperature_c, temperature_f, humidity
+                    )
+                )
+
+            if wind_speed is not None:
+                results[DATA_POINT_WINDCHILL] = _convert(
+                    fahrenheit,
+                    wind_chill(temperature_f, wind_speed),
+                    kernel.wind_chill,
+                    temperature_f,
+                    wind_speed,
+                )
+
+            if humidity is not None and wind_speed is not None:
+                results[DATA_POINT_FEELSLIKE] = _convert(
+                    fahrenheit,
+                    feels_like(temperature_f, humidity, wind_speed),
+                    kernel.feels_like,
+                    temperature_f,
+                    humidity,
+                    wind_speed,
+                )
+
+        if (
+            temperature_in := values.get(DATA_POINT_TEMPINF)
+        ) is not None and humidity is not None:
+            temperature_in_c, _ = _temperatures(unit_converter, temperature_in)
+            results[DATA_POINT_HUMIDITY_ABS_IN] = _convert(
+                unit_converter[Quantity.ABSOLUTE_HUMIDITY],
+                absolute_humidity(temperature_in_c, humidity),
+                kernel.absolute_humidity,
+                temperature_in_c,
+                humidity,
+            )
+
+    return results
@@ -25,7 +25,7 @@ from ecowitt2mqtt.const import (
     PERCENTAGE,
 )
 from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint, DataPointType
-from ecowitt2mqtt.util import glob_search
+from ecowitt2mqtt.util import GlobMatcher
 
 if TYPE_CHECKING:
     from ecowitt2mqtt.core import Ecowitt
@@ -64,6 +64,7 @@ BATTERY_STRATEGY_MAP = {
     DATA_POINT_WH90BATT_PC: BatteryStrategy.PERCENTAGE,
     DATA_POINT_WH90CAP_VOLT: BatteryStrategy.NUMERIC,
 }
+BATTERY_STRATEGY_MATCHER = GlobMatcher(BATTERY_STRATEGY_MAP)
 
 
 def calculate_battery(
@@ -104,7 +105,7 @@ def get_battery_strategy(ecowitt: Ecowitt, key: str) -> BatteryStrategy:
     """Get the battery strategy for a particular key."""
     strategies = [ecowitt.config.battery_overrides.get(key)]
 
-    data_point, strategy = glob_search(BATTERY_STRATEGY_MAP, key)
+    data_point, strategy = BATTERY_STRATEGY_MATCHER.search(key)
     if data_point:
         strategies.append(strategy)
 
@@ -0,0 +1,90 @@
+"""Define a lazily evaluated graph of values derived from payload data."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, NamedTuple
+
+if TYPE_CHECKING:
+    from ecowitt2mqtt.core import Ecowitt
+
+
+class DerivedValueNode(NamedTuple):
+    """Define a value that is derived from others (payload values or other nodes).
+
+    The function is called with an Ecowitt object, followed by the values of the
+    dependencies (in order).
+    """
+
+    func: Callable[..., Any]
+    dependencies: tuple[str, ...]
+
+
+class DerivedValueGraph:
+    """Define a graph of values that are derived from payload values (and each other).
+
+    Any name that isn't a node is an input (i.e., a payload key).
+    """
+
+    def __init__(self, nodes: Mapping[str, DerivedValueNode]) -> None:
+        """Initialize."""
+        self._nodes = dict(nodes)
+        self._inputs: dict[str, frozenset[str]] = {}
+
+        for name in self._nodes:
+            self._resolve_inputs(name, ())
+
+    def _resolve_inputs(self, name: str, path: tuple[str, ...]) -> frozenset[str]:
+        """Get the inputs that a name ultimately depends on (checking for cycles)."""
+        if name not in self._nodes:
+            return frozenset((name,))
+        if name in path:
+            raise ValueError(f"Derived values form a cycle: {' -> '.join(path)}")
+        if (inputs := self._inputs.get(name)) is None:
+            inputs = self._inputs[name] = frozenset().union(
+                *(
+                    self._resolve_inputs(dependency, (*path, name))
+                    for dependency in self._nodes[name].dependencies
+                )
+            )
+        return inputs
+
+    def evaluate(self, ecowitt: Ecowitt, inputs: Mapping[str, Any]) -> DerivedValues:
+        """Return the (not-yet-evaluated) derived values for a set of inputs."""
+        return DerivedValues(self._nodes, ecowitt, inputs)
+
+    def get_inputs(self, names: Iterable[str]) -> frozenset[str]:
+        """Get the inputs that are needed to evaluate some names."""
+        return frozenset().union(
+            *(self._inputs.get(name, frozenset((name,))) for name in names)
+        )
+
+
+class DerivedValues:
+    """Define the derived values for a single payload.
+
+    A node is only evaluated the first time it (or a node that depends on it) is asked
+    for; its value is then reused.
+    """
+
+    def __init__(
+        self,
+        nodes: Mapping[str, DerivedValueNode],
+        ecowitt: Ecowitt,
+        inputs: Mapping[str, Any],
+    ) -> None:
+        """Initialize."""
+        self._ecowitt = ecowitt
+        self._nodes = nodes
+        self._values = dict(inputs)
+
+    def __getitem__(self, name: str) -> Any:
+        """Get a value (evaluating it if necessary)."""
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        func, dependencies = self._nodes[name]
+        value = self._values[name] = func(
+            self._ecowitt, *(self[dependency] for dependency in dependencies)
+        )
+        return value
@@ -0,0 +1,152 @@
+"""Define float-only meteorological formulas.
+
+Each formula works in the unit its definition uses (Celsius for the humidity-based
+ones, Fahrenheit for NOAA's indices) and takes and returns plain floats, so callers
+convert a temperature once rather than per formula. The arithmetic mirrors meteocalc
+step for step, so results are identical to the floats it produced.
+"""
+from __future__ import annotations
+
+import math
+
+DEW_POINT_CONSTANTS_NEGATIVE = (17.966, 247.15)
+DEW_POINT_CONSTANTS_POSITIVE = (17.368, 238.88)
+
+HEAT_INDEX_COEFFICIENTS = (
+    -42.379,
+    2.04901523,
+    10.14333127,
+    -0.22475541,
+    -6.83783e-3,
+    -5.481717e-2,
+    1.22874e-3,
+    8.5282e-4,
+    -1.99e-6,
+)
+
+
+def celsius_to_fahrenheit(temperature: float) -> float:
+    """Convert a temperature from Celsius to Fahrenheit."""
+    return temperature * 9 / 5.0 + 32
+
+
+def fahrenheit_to_celsius(temperature: float) -> float:
+    """Convert a temperature from Fahrenheit to Celsius."""
+    return (temperature - 32) * 5 / 9.0
+
+
+def absolute_humidity(temperature_c: float, relative_humidity: float) -> float:
+    """Calculate absolute humidity (in g/m³)."""
+    return (
+        6.112
+        * math.exp((17.67 * temperature_c) / (temperature_c + 243.5))
+        * relative_humidity
+        * 2.1674
+    ) / (273.15 + temperature_c)
+
+
+def dew_point(temperature_c: float, relative_humidity: float) -> float:
+    """Calculate dew point (in °C) with Arden Buck's constants."""
+    if relative_humidity < 1 or relative_humidity > 100:
+        raise ValueError(
+            f"Incorrect value for humidity: {relative_humidity!r}. Correct range 1-100."
+        )
+
+    if temperature_c > 0:
+        b, c = DEW_POINT_CONSTANTS_POSITIVE
+    else:
+        b, c = DEW_POINT_CONSTANTS_NEGATIVE
+
+    vapor_pressure = (
+        relative_humidity / 100.0 * math.exp(b * temperature_c / (c + temperature_c))
+    )
+    return c * math.log(vapor_pressure) / (b - math.log(vapor_pressure))
+
+
+def feels_like(
+    temperature_f: float, relative_humidity: float, wind_speed: float
+) -> float:
+    """Calculate "feels like" temperature (in °F).
+
+    This is wind chill in cold, windy conditions, heat index in hot ones, and the
+    temperature itself otherwise.
+    """
+    if temperature_f <= 50 and wind_speed > 3:
+        return wind_chill(temperature_f, wind_speed)
+    if temperature_f >= 80:
+        return heat_index(temperature_f, relative_humidity)
+    return temperature_f
+
+
+def frost_point(temperature_c: float, dew_point_c: float) -> float:
+    """Calculate frost point (in °C)."""
+    absolute_temp_c = temperature_c + 273.15
+    absolute_dew_point_c = dew_point_c + 273.15
+
+    return (
+        absolute_dew_point_c
+        + (
+            2671.02
+            / (
+                (2954.61 / absolute_temp_c)
+                + 2.193665 * math.log(absolute_temp_c)
+                - 13.3448
+            )
+        )
+        - absolute_temp_c
+    ) - 273.15
+
+
+def heat_index(temperature_f: float, relative_humidity: float) -> float:
+    """Calculate heat index (in °F) via NOAA's equations."""
+    # Try the simple formula first (which is used for heat indices below 80°F):
+    index = 0.5 * (
+        temperature_f + 61.0 + (temperature_f - 68.0) * 1.2 + relative_humidity * 0.094
+    )
+    if index < 80:
+        return index
+
+    # ...otherwise, use the Rothfusz regression:
+    c1, c2, c3, c4, c5, c6, c7, c8, c9 = HEAT_INDEX_COEFFICIENTS
+    return math.fsum(
+        (
+            c1,
+            c2 * temperature_f,
+            c3 * relative_humidity,
+            c4 * temperature_f * relative_humidity,
+            c5 * temperature_f**2,
+            c6 * relative_humidity**2,
+            c7 * temperature_f**2 * relative_humidity,
+            c8 * temperature_f * relative_humidity**2,
+            c9 * temperature_f**2 * relative_humidity**2,
+        )
+    )
+
+
+def simmer_index(temperature_f: float, relative_humidity: float) -> float:
+    """Calculate simmer index (in °F); it's only valid for temperatures above 70°F."""
+    return (
+        1.98
+        * (
+            temperature_f
+            - (0.55 - (0.0055 * relative_humidity)) * (temperature_f - 58.0)
+        )
+        - 56.83
+    )
+
+
+def wind_chill(temperature_f: float, wind_speed: float) -> float:
+    """Calculate wind chill (in °F) via NOAA's equation."""
+    if temperature_f > 50 or wind_speed <= 3:
+        raise ValueError(
+            "Wind Chill Temperature is only defined for temperatures at or below 50 F "
+            "and wind speeds above 3 mph."
+        )
+
+    wind_factor = float(wind_speed**0.16)
+    return (
+        35.74
+        + (0.6215 * temperature_f)
+        - 35.75 * wind_factor
+        + 0.4275 * temperature_f * wind_factor
+    )
@@ -1,11 +1,11 @@
 """Define meteorological helpers."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 import math
-from typing import TYPE_CHECKING, cast
-
-import meteocalc
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Generic, Iterable, Mapping, TypeVar, cast
 
 from ecowitt2mqtt.backports.enum import StrEnum
 from ecowitt2mqtt.const import (
@@ -18,29 +18,20 @@ from ecowitt2mqtt.const import (
     DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_5,
     DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_6,
     DEGREE,
-    DISTANCE_KILOMETERS,
-    DISTANCE_MILES,
     IRRADIATION_WATTS_PER_SQUARE_METER,
     LIGHT_LUX,
     LOGGER,
     PERCENTAGE,
-    PRESSURE_HPA,
-    PRESSURE_INHG,
     RAINFALL_INCHES,
     RAINFALL_MILLIMETERS,
-    SPEED_KILOMETERS_PER_HOUR,
-    SPEED_MILES_PER_HOUR,
     STRIKES,
-    TEMP_CELSIUS,
-    TEMP_FAHRENHEIT,
     TIME_MINUTES,
     UNIT_SYSTEM_IMPERIAL,
     UNIT_SYSTEM_METRIC,
     UV_INDEX,
-    WATER_VAPOR_GRAMS_PER_CUBIC_METER,
-    WATER_VAPOR_POUNDS_PER_CUBIC_FOOT,
 )
-from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint
+from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint, kernel
+from ecowitt2mqtt.helpers.calculator.units import Quantity
 from ecowitt2mqtt.helpers.typing import UnitSystemType
 
 if TYPE_CHECKING:
@@ -51,35 +42,40 @@ FROST_RISK_HUMIDITY_ABS_THRESHOLD = 2.8
 IMPERIAL_HIGH_THRESHOLD = 110.0
 IMPERIAL_LOW_THRESHOLD = -10.0
 
-ABSOLUTE_HUMIDITY_MAP = {
-    UNIT_SYSTEM_IMPERIAL: WATER_VAPOR_POUNDS_PER_CUBIC_FOOT,
-    UNIT_SYSTEM_METRIC: WATER_VAPOR_GRAMS_PER_CUBIC_METER,
+RAIN_RATE_UNIT_MAP = {
+    unit: f"{unit}/hr" for unit in (RAINFALL_INCHES, RAINFALL_MILLIMETERS)
 }
 
-DISTANCE_UNIT_MAP = {
-    UNIT_SYSTEM_IMPERIAL: DISTANCE_MILES,
-    UNIT_SYSTEM_METRIC: DISTANCE_KILOMETERS,
-}
+T = TypeVar("T")
 
-PRESSURE_UNIT_MAP = {
-    UNIT_SYSTEM_IMPERIAL: PRESSURE_INHG,
-    UNIT_SYSTEM_METRIC: PRESSURE_HPA,
-}
 
-RAIN_VOLUME_UNIT_MAP = {
-    UNIT_SYSTEM_IMPERIAL: RAINFALL_INCHES,
-    UNIT_SYSTEM_METRIC: RAINFALL_MILLIMETERS,
-}
+class RatingLookup(Generic[T]):
+    """Define a lookup of ratings that cover consecutive ranges of values.
 
-TEMP_UNIT_MAP = {
-    UNIT_SYSTEM_IMPERIAL: TEMP_FAHRENHEIT,
-    UNIT_SYSTEM_METRIC: TEMP_CELSIUS,
-}
+    The ranges are compiled into sorted boundaries, so a value's rating is found with a
+    binary search (rather than by checking every range).
+    """
 
-WIND_SPEED_UNIT_MAP = {
-    UNIT_SYSTEM_IMPERIAL: SPEED_MILES_PER_HOUR,
-    UNIT_SYSTEM_METRIC: SPEED_KILOMETERS_PER_HOUR,
-}
+    def __init__(self, ranges: Iterable[tuple[float, float, T]]) -> None:
+        """Initialize."""
+        ordered = sorted(ranges, key=lambda r: r[0])
+
+        # Each range has to start where the one before it ends:
+        for idx in range(1, len(ordered)):
+            maximum, minimum = ordered[idx - 1][1], ordered[idx][0]
+            if maximum != minimum:
+                raise ValueError(
+                    f"Rating ranges aren't consecutive: {maximum} -> {minimum}"
+                )
+
+        self.boundaries = [minimum for minimum, _, _ in ordered] + [ordered[-1][1]]
+        self.ratings = [rating for _, _, rating in ordered]
+
+    def get(self, value: float) -> T | None:
+        """Get the rating of a value (or None if it's outside of every range)."""
+        if not self.boundaries[0] <= value < self.boundaries[-1]:
+            return None
+        return self.ratings[bisect_right(self.boundaries, value) - 1]
 
 
 @dataclass
@@ -94,6 +90,17 @@ class BeaufortScaleRating:  # pylint: disable=too-many-instance-attributes
     description: str
     sea_conditions: str
     land_conditions: str
+    attributes: Mapping[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the (shared) attributes of data points with this rating."""
+        self.attributes = MappingProxyType(
+            {
+                "description": self.description,
+                "sea_conditions": self.sea_conditions,
+                "land_conditions": self.land_conditions,
+            }
+        )
 
 
 BEAUFORT_SCALE_RATINGS: list[BeaufortScaleRating] = [
@@ -296,6 +303,17 @@ class SafeExposureInfo:
     typical_features: str
     tanning_ability: str
     ethnicity: str
+    attributes: Mapping[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the (shared) attributes of data points with this exposure level."""
+        self.attributes = MappingProxyType(
+            {
+                "ethnicity": self.ethnicity,
+                "tanning_ability": self.tanning_ability,
+                "typical_features": self.typical_features,
+            }
+        )
 
 
 SAFE_EXPOSURE_INFO_MAP: dict[str, SafeExposureInfo] = {
@@ -480,94 +498,87 @@ THERMAL_PERCEPTION_RATINGS: list[ThermalPerceptionRating] = [
 ]
 
 
-def _get_absolute_humidity(temp_obj: meteocalc.Temp, relative_humidity: float) -> float:
-    """Get absolute humidity."""
-    return cast(
-        float,
-        (
-            6.112
-            * math.exp((17.67 * temp_obj.c) / (temp_obj.c + 243.5))
-            * relative_humidity
-            * 2.1674
-        )
-        / (273.15 + temp_obj.c),
-    )
+# Beaufort scale ratings are looked up by wind speed in the input unit system:
+BEAUFORT_SCALE_LOOKUPS: dict[UnitSystemType, RatingLookup[BeaufortScaleRating]] = {
+    UNIT_SYSTEM_IMPERIAL: RatingLookup(
+        (r.minimum_mph, r.maximum_mph, r) for r in BEAUFORT_SCALE_RATINGS
+    ),
+    UNIT_SYSTEM_METRIC: RatingLookup(
+        (r.minimum_kmh, r.maximum_kmh, r) for r in BEAUFORT_SCALE_RATINGS
+    ),
+}
+SIMMER_ZONE_LOOKUP: RatingLookup[SimmerZone] = RatingLookup(
+    (cast(float, r.minimum_f), cast(float, r.maximum_f), r.zone)
+    for r in SIMMER_ZONE_RATINGS
+)
+THERMAL_PERCEPTION_LOOKUP: RatingLookup[ThermalPerception] = RatingLookup(
+    (r.minimum_c, r.maximum_c, r.perception) for r in THERMAL_PERCEPTION_RATINGS
+)
 
 
-def _get_frost_point_object(
-    temp_obj: meteocalc.Temp, relative_humidity: float
-) -> meteocalc.Temp:
-    """Get a frost point object."""
-    dew_point_obj = meteocalc.dew_point(temp_obj, relative_humidity)
-    absolute_temp_c = temp_obj.c + 273.15
-    absolute_dew_point_c = dew_point_obj.c + 273.15
-
-    return _get_temperature_object(
-        (
-            absolute_dew_point_c
-            + (
-                2671.02
-                / (
-                    (2954.61 / absolute_temp_c)
-                    + 2.193665 * math.log(absolute_temp_c)
-                    - 13.3448
-                )
-            )
-            - absolute_temp_c
-        )
-        - 273.15,
-        UNIT_SYSTEM_METRIC,
-    )
+def derive_absolute_humidity(
+    ecowitt: Ecowitt, temperature_c: float, relative_humidity: float
+) -> float:
+    """Derive absolute humidity (in g/m³)."""
+    return kernel.absolute_humidity(temperature_c, relative_humidity)
+
+
+def derive_dew_point(
+    ecowitt: Ecowitt, temperature_c: float, relative_humidity: float
+) -> float:
+    """Derive dew point (in °C)."""
+    return kernel.dew_point(temperature_c, relative_humidity)
 
 
-def _get_simmer_index_object(
-    temp_obj: meteocalc.Temp, relative_humidity: float
-) -> meteocalc.Temp | None:
-    """Get a simmer index object."""
-    if temp_obj.f < 70:
-        raise ValueError(
-            "Simmer Index is only valid for temperatures above 70°F (21.1 °C)"
+def derive_frost_point(
+    ecowitt: Ecowitt, temperature_c: float, dew_point_c: float
+) -> float:
+    """Derive frost point (in °C)."""
+    return kernel.frost_point(temperature_c, dew_point_c)
+
+
+def derive_simmer_index(
+    ecowitt: Ecowitt, temperature_f: float, relative_humidity: float
+) -> float | None:
+    """Derive simmer index (in °F), if the temperature allows for one."""
+    if temperature_f < 70:
+        LOGGER.debug(
+            "Simmer Index is only valid for temperatures above 70°F (21.1 °C) "
+            "(temperature: %s)",
+            temperature_f,
         )
+        return None
 
-    return _get_temperature_object(
-        (
-            1.98
-            * (temp_obj.f - (0.55 - (0.0055 * relative_humidity)) * (temp_obj.f - 58.0))
-            - 56.83
-        ),
-        UNIT_SYSTEM_IMPERIAL,
-    )
+    return kernel.simmer_index(temperature_f, relative_humidity)
 
 
-def _get_temperature_object(
-    temperature: float, unit_system: UnitSystemType
-) -> meteocalc.Temp:
-    """Get a temperature object."""
-    if unit_system == UNIT_SYSTEM_IMPERIAL:
-        unit = "f"
-    else:
-        unit = "c"
-    return meteocalc.Temp(temperature, unit)
+def derive_temperature_c(ecowitt: Ecowitt, temperature: float) -> float:
+    """Derive a temperature (in °C) from one in the input unit system."""
+    if ecowitt.config.unit_converter.input_unit_system == UNIT_SYSTEM_IMPERIAL:
+        return kernel.fahrenheit_to_celsius(float(temperature))
+    return float(temperature)
+
+
+def derive_temperature_f(ecowitt: Ecowitt, temperature: float) -> float:
+    """Derive a temperature (in °F) from one in the input unit system."""
+    if ecowitt.config.unit_converter.input_unit_system == UNIT_SYSTEM_IMPERIAL:
+        return float(temperature)
+    return kernel.celsius_to_fahrenheit(float(temperature))
 
 
 def calculate_absolute_humidity(
     ecowitt: Ecowitt,
     payload_key: str,
     data_point_key: str,
-    temperature: float,
-    relative_humidity: float,
+    absolute_humidity: float,
 ) -> CalculatedDataPoint:
     """Calculate absolute humidity."""
-    temp_obj = _get_temperature_object(temperature, ecowitt.config.input_unit_system)
-    final_value = _get_absolute_humidity(temp_obj, relative_humidity)
-
-    if ecowitt.config.output_unit_system == UNIT_SYSTEM_IMPERIAL:
-        final_value /= 16018.46592051
+    conversion = ecowitt.config.unit_converter[Quantity.ABSOLUTE_HUMIDITY]
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
-        value=round(final_value, 1),
-        unit=ABSOLUTE_HUMIDITY_MAP[ecowitt.config.output_unit_system],
+        value=conversion.convert(absolute_humidity),
+        unit=conversion.unit,
     )
 
 
@@ -578,27 +589,16 @@ def calculate_beaufort_scale(
     wind_speed: float,
 ) -> CalculatedDataPoint:
     """Calculate the Beaufort Scale of a wind speed."""
-    [rating] = [
-        r
-        for r in BEAUFORT_SCALE_RATINGS
-        if (
-            ecowitt.config.input_unit_system == UNIT_SYSTEM_IMPERIAL
-            and r.minimum_mph <= wind_speed < r.maximum_mph
-        )
-        or (
-            ecowitt.config.input_unit_system == UNIT_SYSTEM_METRIC
-            and r.minimum_kmh <= wind_speed < r.maximum_kmh
-        )
-    ]
+    lookup = BEAUFORT_SCALE_LOOKUPS[ecowitt.config.unit_converter.input_unit_system]
+
+    if (rating := lookup.get(wind_speed)) is None:
+        LOGGER.debug("Wind speed is outside of the Beaufort Scale: %s", wind_speed)
+        return CalculatedDataPoint(data_point_key=data_point_key, value=None)
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
         value=rating.number,
-        attributes={
-            "description": rating.description,
-            "sea_conditions": rating.sea_conditions,
-            "land_conditions": rating.land_conditions,
-        },
+        attributes=rating.attributes,
     )
 
 
@@ -615,22 +615,15 @@ def calculate_dew_point(
     ecowitt: Ecowitt,
     payload_key: str,
     data_point_key: str,
-    temperature: float,
-    relative_humidity: float,
+    dew_point_c: float,
 ) -> CalculatedDataPoint:
     """Calculate dew point in the appropriate unit system."""
-    temp_obj = _get_temperature_object(temperature, ecowitt.config.input_unit_system)
-    dew_point_obj = meteocalc.dew_point(temp_obj, relative_humidity)
-
-    if ecowitt.config.output_unit_system == UNIT_SYSTEM_IMPERIAL:
-        final_value = round(dew_point_obj.f, 1)
-    else:
-        final_value = round(dew_point_obj.c, 1)
+    unit_converter = ecowitt.config.unit_converter
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
-        value=final_value,
-        unit=TEMP_UNIT_MAP[ecowitt.config.output_unit_system],
+        value=unit_converter.convert_temperature(dew_point_c, UNIT_SYSTEM_METRIC),
+        unit=unit_converter[Quantity.TEMPERATURE].unit,
     )
 
 
@@ -638,23 +631,19 @@ def calculate_feels_like(  # pylint: disable=too-many-arguments
     ecowitt: Ecowitt,
     payload_key: str,
     data_point_key: str,
-    temperature: float,
+    temperature_f: float,
     relative_humidity: float,
     wind_speed: float,
 ) -> CalculatedDataPoint:
     """Calculate "feels like" temperature in the appropriate unit system."""
-    temp_obj = _get_temperature_object(temperature, ecowitt.config.input_unit_system)
-    feels_like_obj = meteocalc.feels_like(temp_obj, relative_humidity, wind_speed)
+    feels_like_f = kernel.feels_like(temperature_f, relative_humidity, wind_speed)
 
-    if ecowitt.config.output_unit_system == UNIT_SYSTEM_IMPERIAL:
-        final_value = round(feels_like_obj.f, 1)
-    else:
-        final_value = round(feels_like_obj.c, 1)
+    unit_converter = ecowitt.config.unit_converter
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
-        value=final_value,
-        unit=TEMP_UNIT_MAP[ecowitt.config.output_unit_system],
+        value=unit_converter.convert_temperature(feels_like_f, UNIT_SYSTEM_IMPERIAL),
+        unit=unit_converter[Quantity.TEMPERATURE].unit,
     )
 
 
@@ -662,45 +651,35 @@ def calculate_frost_point(
     ecowitt: Ecowitt,
     payload_key: str,
     data_point_key: str,
-    temperature: float,
-    relative_humidity: float,
+    frost_point_c: float,
 ) -> CalculatedDataPoint:
     """Calculate frost point in the appropriate unit system."""
-    temp_obj = _get_temperature_object(temperature, ecowitt.config.input_unit_system)
-    frost_point_obj = _get_frost_point_object(temp_obj, relative_humidity)
-
-    if ecowitt.config.output_unit_system == UNIT_SYSTEM_IMPERIAL:
-        final_value = round(frost_point_obj.f, 1)
-    else:
-        final_value = round(frost_point_obj.c, 1)
+    unit_converter = ecowitt.config.unit_converter
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
-        value=final_value,
-        unit=TEMP_UNIT_MAP[ecowitt.config.output_unit_system],
+        value=unit_converter.convert_temperature(frost_point_c, UNIT_SYSTEM_METRIC),
+        unit=unit_converter[Quantity.TEMPERATURE].unit,
     )
 
 
-def calculate_frost_risk(
+def calculate_frost_risk(  # pylint: disable=too-many-arguments
     ecowitt: Ecowitt,
     payload_key: str,
     data_point_key: str,
-    temperature: float,
-    relative_humidity: float,
+    temperature_c: float,
+    frost_point_c: float,
+    absolute_humidity: float,
 ) -> CalculatedDataPoint:
     """Calculate the risk of frost forming."""
-    temp_obj = _get_temperature_object(temperature, ecowitt.config.input_unit_system)
-    absolute_humidity = _get_absolute_humidity(temp_obj, relative_humidity)
-    frost_point_obj = _get_frost_point_object(temp_obj, relative_humidity)
-
-    if temp_obj.c <= 1.0 and frost_point_obj.c <= 0:
+    if temperature_c <= 1.0 and frost_point_c <= 0:
         if absolute_humidity <= FROST_RISK_HUMIDITY_ABS_THRESHOLD:
             final_value = FrostRisk.UNLIKELY
         else:
             final_value = FrostRisk.VERY_PROBABLE
     elif (
-        temp_obj.c <= 4.0
-        and frost_point_obj.c <= 0.5
+        temperature_c <= 4.0
+        and frost_point_c <= 0.5
         and absolute_humidity > FROST_RISK_HUMIDITY_ABS_THRESHOLD
     ):
         final_value = FrostRisk.PROBABLE
@@ -714,22 +693,18 @@ def calculate_heat_index(
     ecowitt: Ecowitt,
     payload_key: str,
     data_point_key: str,
-    temperature: float,
+    temperature_f: float,
     relative_humidity: float,
 ) -> CalculatedDataPoint:
     """Calculate heat index in the appropriate unit system."""
-    temp_obj = _get_temperature_object(temperature, ecowitt.config.input_unit_system)
-    heat_index_obj = meteocalc.heat_index(temp_obj, relative_humidity)
+    heat_index_f = kernel.heat_index(temperature_f, relative_humidity)
 
-    if ecowitt.config.output_unit_system == UNIT_SYSTEM_IMPERIAL:
-        final_value = round(heat_index_obj.f, 1)
-    else:
-        final_value = round(heat_index_obj.c, 1)
+    unit_converter = ecowitt.config.unit_converter
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
-        value=final_value,
-        unit=TEMP_UNIT_MAP[ecowitt.config.output_unit_system],
+        value=unit_converter.convert_temperature(heat_index_f, UNIT_SYSTEM_IMPERIAL),
+        unit=unit_converter[Quantity.TEMPERATURE].unit,
     )
 
 
@@ -746,15 +721,12 @@ def calculate_lightning_strike_distance(
         LOGGER.debug("Can't convert value to number: %s", value)
         return CalculatedDataPoint(data_point_key=data_point_key, value=None)
 
-    if ecowitt.config.output_unit_system == UNIT_SYSTEM_METRIC:
-        final_value = value
-    else:
-        final_value = round(value / 1.609, 1)
+    conversion = ecowitt.config.unit_converter[Quantity.DISTANCE]
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
-        value=final_value,
-        unit=DISTANCE_UNIT_MAP[ecowitt.config.output_unit_system],
+        value=conversion.convert(final_value),
+        unit=conversion.unit,
     )
 
 
@@ -800,17 +772,12 @@ def calculate_pressure(
     ecowitt: Ecowitt, payload_key: str, data_point_key: str, value: float
 ) -> CalculatedDataPoint:
     """Calculate pressure in the appropriate unit system."""
-    if ecowitt.config.input_unit_system == ecowitt.config.output_unit_system:
-        final_value = value
-    elif ecowitt.config.output_unit_system == UNIT_SYSTEM_IMPERIAL:
-        final_value = round(value / 33.8639, 3)
-    else:
-        final_value = round(value * 33.8639, 3)
+    conversion = ecowitt.config.unit_converter[Quantity.PRESSURE]
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
-        value=final_value,
-        unit=PRESSURE_UNIT_MAP[ecowitt.config.output_unit_system],
+        value=conversion.convert(value),
+        unit=conversion.unit,
     )
 
 
@@ -821,7 +788,7 @@ def calculate_rain_rate(
     data_point = calculate_rain_volume(
         ecowitt, payload_key, data_point_key, value=value
     )
-    data_point.unit = f"{data_point.unit}/hr"
+    data_point.unit = RAIN_RATE_UNIT_MAP[cast(str, data_point.unit)]
     return data_point
 
 
@@ -829,17 +796,12 @@ def calculate_rain_volume(
     ecowitt: Ecowitt, payload_key: str, data_point_key: str, value: float
 ) -> CalculatedDataPoint:
     """Calculate rain volume in the appropriate unit system."""
-    if ecowitt.config.input_unit_system == ecowitt.config.output_unit_system:
-        final_value = value
-    elif ecowitt.config.output_unit_system == UNIT_SYSTEM_IMPERIAL:
-        final_value = round(value / 25.4, 1)
-    else:
-        final_value = round(value * 25.4, 1)
+    conversion = ecowitt.config.unit_converter[Quantity.RAIN_VOLUME]
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
-        value=final_value,
-        unit=RAIN_VOLUME_UNIT_MAP[ecowitt.config.output_unit_system],
+        value=conversion.convert(value),
+        unit=conversion.unit,
     )
 
 
@@ -869,11 +831,7 @@ def calculate_safe_exposure_time(
         data_point_key=data_point_key,
         value=final_value,
         unit=TIME_MINUTES,
-        attributes={
-            "ethnicity": safe_exposure_info.ethnicity,
-            "tanning_ability": safe_exposure_info.tanning_ability,
-            "typical_features": safe_exposure_info.typical_features,
-        },
+        attributes=safe_exposure_info.attributes,
     )
 
 
@@ -881,28 +839,22 @@ def calculate_simmer_index(
     ecowitt: Ecowitt,
     payload_key: str,
     data_point_key: str,
-    temperature: float,
-    relative_humidity: float,
+    simmer_index_f: float | None,
 ) -> CalculatedDataPoint:
     """Calculate simmer index in the appropriate unit system."""
-    temp_obj = _get_temperature_object(temperature, ecowitt.config.input_unit_system)
+    unit_converter = ecowitt.config.unit_converter
 
-    try:
-        simmer_obj = _get_simmer_index_object(temp_obj, relative_humidity)
-    except ValueError as err:
-        LOGGER.debug("%s (temperature: %s)", err, temp_obj)
+    if simmer_index_f is None:
         final_value = None
     else:
-        assert simmer_obj
-        if ecowitt.config.output_unit_system == UNIT_SYSTEM_IMPERIAL:
-            final_value = round(simmer_obj.f, 1)
-        else:
-            final_value = round(simmer_obj.c, 1)
+        final_value = unit_converter.convert_temperature(
+            simmer_index_f, UNIT_SYSTEM_IMPERIAL
+        )
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
         value=final_value,
-        unit=TEMP_UNIT_MAP[ecowitt.config.output_unit_system],
+        unit=unit_converter[Quantity.TEMPERATURE].unit,
     )
 
 
@@ -910,23 +862,13 @@ def calculate_simmer_zone(
     ecowitt: Ecowitt,
     payload_key: str,
     data_point_key: str,
-    temperature: float,
-    relative_humidity: float,
+    simmer_index_f: float | None,
 ) -> CalculatedDataPoint:
     """Calculate the human perception of comfort level related to temperature."""
-    temp_obj = _get_temperature_object(temperature, ecowitt.config.input_unit_system)
-
-    try:
-        simmer_obj = _get_simmer_index_object(temp_obj, relative_humidity)
-    except ValueError as err:
-        LOGGER.debug("%s (temperature: %s)", err, temp_obj)
+    if simmer_index_f is None:
         final_value = None
-    else:
-        assert simmer_obj
-        [rating] = [
-            r for r in SIMMER_ZONE_RATINGS if r.minimum_f <= simmer_obj.f < r.maximum_f
-        ]
-        final_value = rating.zone
+    elif (final_value := SIMMER_ZONE_LOOKUP.get(simmer_index_f)) is None:
+        LOGGER.debug("Simmer Index is outside of every zone: %s", simmer_index_f)
 
     return CalculatedDataPoint(data_point_key=data_point_key, value=final_value)
 
@@ -978,25 +920,25 @@ def calculate_temperature(
     ecowitt: Ecowitt, payload_key: str, data_point_key: str, value: float
 ) -> CalculatedDataPoint:
     """Calculate temperature in the appropriate unit system."""
-    temp_obj = _get_temperature_object(value, ecowitt.config.input_unit_system)
+    unit_converter = ecowitt.config.unit_converter
+    temperature = float(value)
+    temperature_f = derive_temperature_f(ecowitt, temperature)
 
-    if temp_obj.f < IMPERIAL_LOW_THRESHOLD or temp_obj.f > IMPERIAL_HIGH_THRESHOLD:
+    if (
+        temperature_f < IMPERIAL_LOW_THRESHOLD
+        or temperature_f > IMPERIAL_HIGH_THRESHOLD
+    ):
         LOGGER.warning(
             'Value of "%s" (%s) with input unit system "%s" seems suspicious',
             payload_key,
             value,
-            ecowitt.config.input_unit_system,
+            unit_converter.input_unit_system,
         )
 
-    if ecowitt.config.output_unit_system == UNIT_SYSTEM_IMPERIAL:
-        final_value = round(temp_obj.f, 1)
-    else:
-        final_value = round(temp_obj.c, 1)
-
     return CalculatedDataPoint(
         data_point_key=data_point_key,
-        value=final_value,
-        unit=TEMP_UNIT_MAP[ecowitt.config.output_unit_system],
+        value=unit_converter[Quantity.TEMPERATURE].convert(temperature),
+        unit=unit_converter[Quantity.TEMPERATURE].unit,
     )
 
 
@@ -1004,20 +946,15 @@ def calculate_thermal_perception(
     ecowitt: Ecowitt,
     payload_key: str,
     data_point_key: str,
-    temperature: float,
-    relative_humidity: float,
+    dew_point_c: float,
 ) -> CalculatedDataPoint:
     """Calculate the human perception of comfort level related to dew point."""
-    temp_obj = _get_temperature_object(temperature, ecowitt.config.input_unit_system)
-    dew_point_obj = meteocalc.dew_point(temp_obj, relative_humidity)
-
-    [rating] = [
-        r
-        for r in THERMAL_PERCEPTION_RATINGS
-        if r.minimum_c <= dew_point_obj.c < r.maximum_c
-    ]
+    if (perception := THERMAL_PERCEPTION_LOOKUP.get(dew_point_c)) is None:
+        LOGGER.debug(
+            "Dew point is outside of every thermal perception: %s", dew_point_c
+        )
 
-    return CalculatedDataPoint(data_point_key=data_point_key, value=rating.perception)
+    return CalculatedDataPoint(data_point_key=data_point_key, value=perception)
 
 
 def calculate_uv_index(
@@ -1033,7 +970,7 @@ def calculate_wind_chill(
     ecowitt: Ecowitt,
     payload_key: str,
     data_point_key: str,
-    temperature: float,
+    temperature_f: float,
     wind_speed: float,
 ) -> CalculatedDataPoint:
     """Calculate wind chill in the appropriate unit system.
@@ -1041,23 +978,24 @@ def calculate_wind_chill(
     Note that because wind chill only applies at certain combinations of temperature
     and wind speed, it is possible for this method to return None.
     """
-    temp_obj = _get_temperature_object(temperature, ecowitt.config.input_unit_system)
+    unit_converter = ecowitt.config.unit_converter
 
     try:
-        wind_chill_obj = meteocalc.wind_chill(temp_obj, wind_speed)
+        wind_chill_f = kernel.wind_chill(temperature_f, wind_speed)
     except ValueError as err:
-        LOGGER.debug("%s (temperature: %s, wind speed: %s)", err, temp_obj, wind_speed)
+        LOGGER.debug(
+            "%s (temperature: %s, wind speed: %s)", err, temperature_f, wind_speed
+        )
         final_value = None
     else:
-        if ecowitt.config.output_unit_system == UNIT_SYSTEM_IMPERIAL:
-            final_value = round(wind_chill_obj.f, 1)
-        else:
-            final_value = round(wind_chill_obj.c, 1)
+        final_value = unit_converter.convert_temperature(
+            wind_chill_f, UNIT_SYSTEM_IMPERIAL
+        )
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
         value=final_value,
-        unit=TEMP_UNIT_MAP[ecowitt.config.output_unit_system],
+        unit=unit_converter[Quantity.TEMPERATURE].unit,
     )
 
 
@@ -1072,15 +1010,10 @@ def calculate_wind_speed(
     ecowitt: Ecowitt, payload_key: str, data_point_key: str, value: float
 ) -> CalculatedDataPoint:
     """Calculate wind speed in the appropriate unit system."""
-    if ecowitt.config.input_unit_system == ecowitt.config.output_unit_system:
-        final_value = value
-    elif ecowitt.config.output_unit_system == UNIT_SYSTEM_IMPERIAL:
-        final_value = round(value / 1.60934, 1)
-    else:
-        final_value = round(value * 1.60934, 1)
+    conversion = ecowitt.config.unit_converter[Quantity.WIND_SPEED]
 
     return CalculatedDataPoint(
         data_point_key=data_point_key,
-        value=final_value,
-        unit=WIND_SPEED_UNIT_MAP[ecowitt.config.output_unit_system],
+        value=conversion.convert(value),
+        unit=conversion.unit,
     )
@@ -0,0 +1,232 @@
+"""Define pressure tendency and forecast helpers."""
+from __future__ import annotations
+
+from array import array
+import math
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+from ecowitt2mqtt.backports.enum import StrEnum
+from ecowitt2mqtt.const import (
+    DATA_POINT_BAROMRELIN,
+    DATA_POINT_PRESSURE_TENDENCY,
+    DATA_POINT_PRESSURE_TREND,
+    DATA_POINT_ZAMBRETTI_FORECAST,
+    LOGGER,
+    UNIT_SYSTEM_METRIC,
+)
+from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint
+from ecowitt2mqtt.helpers.calculator.meteo import RatingLookup
+from ecowitt2mqtt.helpers.calculator.units import UNIT_CONVERSIONS, Quantity
+
+if TYPE_CHECKING:
+    from ecowitt2mqtt.core import Ecowitt
+
+# Pressure tendency is the change in (sea-level) pressure over the last 3 hours:
+TENDENCY_PERIOD = 3 * 60 * 60
+
+# Pressure history is kept in 5-minute slots; if a station didn't report during the
+# slot from exactly 3 hours ago, the nearest slot within this many of it is used:
+SLOT_DURATION = 5 * 60
+SLOT_TOLERANCE = 2
+TENDENCY_SLOTS = TENDENCY_PERIOD // SLOT_DURATION
+
+# The ring reaches back far enough to hold the oldest slot that can be used:
+RING_SIZE = TENDENCY_SLOTS + SLOT_TOLERANCE + 1
+REFERENCE_SLOT_OFFSETS = tuple(
+    sorted(range(-SLOT_TOLERANCE, SLOT_TOLERANCE + 1), key=abs)
+)
+
+# A slot number that no time maps to:
+EMPTY_SLOT = -(2**63)
+
+
+class PressureTrend(StrEnum):
+    """Define types of pressure trend."""
+
+    FALLING = "Falling"
+    FALLING_QUICKLY = "Falling quickly"
+    FALLING_SLOWLY = "Falling slowly"
+    FALLING_VERY_RAPIDLY = "Falling very rapidly"
+    RISING = "Rising"
+    RISING_QUICKLY = "Rising quickly"
+    RISING_SLOWLY = "Rising slowly"
+    RISING_VERY_RAPIDLY = "Rising very rapidly"
+    STEADY = "Steady"
+
+
+# Tendencies (in hPa, rounded to a tenth) are classified in the same way as shipping
+# forecasts:
+PRESSURE_TREND_LOOKUP: RatingLookup[PressureTrend] = RatingLookup(
+    (
+        (-math.inf, -6.05, PressureTrend.FALLING_VERY_RAPIDLY),
+        (-6.05, -3.55, PressureTrend.FALLING_QUICKLY),
+        (-3.55, -1.55, PressureTrend.FALLING),
+        (-1.55, -0.05, PressureTrend.FALLING_SLOWLY),
+        (-0.05, 0.05, PressureTrend.STEADY),
+        (0.05, 1.55, PressureTrend.RISING_SLOWLY),
+        (1.55, 3.55, PressureTrend.RISING),
+        (3.55, 6.05, PressureTrend.RISING_QUICKLY),
+        (6.05, math.inf, PressureTrend.RISING_VERY_RAPIDLY),
+    )
+)
+
+ZAMBRETTI_FORECASTS = {
+    "A": "Settled fine",
+    "B": "Fine weather",
+    "C": "Becoming fine",
+    "D": "Fine, becoming less settled",
+    "E": "Fine, possible showers",
+    "F": "Fairly fine, improving",
+    "G": "Fairly fine, possible showers early",
+    "H": "Fairly fine, showery later",
+    "I": "Showery early, improving",
+    "J": "Changeable, mending",
+    "K": "Fairly fine, showers likely",
+    "L": "Rather unsettled, clearing later",
+    "M": "Unsettled, probably improving",
+    "N": "Showery, bright intervals",
+    "O": "Showery, becoming less settled",
+    "P": "Changeable, some rain",
+    "Q": "Unsettled, short fine intervals",
+    "R": "Unsettled, rain later",
+    "S": "Unsettled, some rain",
+    "T": "Mostly very unsettled",
+    "U": "Occasional rain, worsening",
+    "V": "Rain at times, very unsettled",
+    "W": "Rain at frequent intervals",
+    "X": "Rain, very unsettled",
+    "Y": "Stormy, may improve",
+    "Z": "Stormy, much rain",
+}
+
+
+class ZambrettiFormula(NamedTuple):
+    """Define how a Zambretti forecast is calculated for a pressure trend."""
+
+    intercept: float
+    slope: float
+    first_number: int
+    letters: str
+
+    def get_forecast(self, pressure_hpa: float) -> str:
+        """Get the forecast for a (sea-level) pressure."""
+        number = round(self.intercept - self.slope * pressure_hpa)
+        index = min(max(number - self.first_number, 0), len(self.letters) - 1)
+        return ZAMBRETTI_FORECASTS[self.letters[index]]
+
+
+ZAMBRETTI_FALLING = ZambrettiFormula(127, 0.12, 1, "ABDHORUXZ")
+ZAMBRETTI_RISING = ZambrettiFormula(185, 0.16, 20, "ABCFGIJLMQTYZ")
+ZAMBRETTI_STEADY = ZambrettiFormula(144, 0.13, 10, "ABEKNPSWXZ")
+
+# Slow changes count as steady:
+ZAMBRETTI_FORMULAS = {
+    PressureTrend.FALLING: ZAMBRETTI_FALLING,
+    PressureTrend.FALLING_QUICKLY: ZAMBRETTI_FALLING,
+    PressureTrend.FALLING_SLOWLY: ZAMBRETTI_STEADY,
+    PressureTrend.FALLING_VERY_RAPIDLY: ZAMBRETTI_FALLING,
+    PressureTrend.RISING: ZAMBRETTI_RISING,
+    PressureTrend.RISING_QUICKLY: ZAMBRETTI_RISING,
+    PressureTrend.RISING_SLOWLY: ZAMBRETTI_STEADY,
+    PressureTrend.RISING_VERY_RAPIDLY: ZAMBRETTI_RISING,
+    PressureTrend.STEADY: ZAMBRETTI_STEADY,
+}
+
+
+class PressureHistory:
+    """Define a ring of a station's pressures, indexed by time slot.
+
+    Each slot holds the last pressure measured during it, so the pressure from (about)
+    3 hours ago is found in O(1) time and memory never grows.
+    """
+
+    __slots__ = ("_pressures", "_slots")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._pressures = array("d", [0.0] * RING_SIZE)
+        self._slots = array("q", [EMPTY_SLOT] * RING_SIZE)
+
+    def add(self, pressure: float, timestamp: float) -> float | None:
+        """Add a pressure and return the one from 3 hours earlier (if there is one)."""
+        slot = int(timestamp // SLOT_DURATION)
+
+        # A late payload mustn't overwrite a newer slot that shares its place:
+        if slot >= self._slots[slot % RING_SIZE]:
+            self._pressures[slot % RING_SIZE] = pressure
+            self._slots[slot % RING_SIZE] = slot
+
+        for offset in REFERENCE_SLOT_OFFSETS:
+            reference_slot = slot - TENDENCY_SLOTS + offset
+            if self._slots[reference_slot % RING_SIZE] == reference_slot:
+                return self._pressures[reference_slot % RING_SIZE]
+        return None
+
+
+class PressureTendencyCalculator:
+    """Define a calculator of each station's pressure tendency and forecast.
+
+    Unlike other calculated data points, these depend on earlier payloads, so (once the
+    station's relative pressure has 3 hours of history) they are calculated from a
+    per-station pressure history. Pressures are placed in that history by when their
+    payload was measured (rather than when it arrived).
+    """
+
+    def __init__(self, ecowitt: Ecowitt) -> None:
+        """Initialize."""
+        self._data_points = [
+            data_point
+            for data_point in (
+                DATA_POINT_PRESSURE_TENDENCY,
+                DATA_POINT_PRESSURE_TREND,
+                DATA_POINT_ZAMBRETTI_FORECAST,
+            )
+            if ecowitt.config.key_filter.matches(data_point)
+        ]
+        self._histories: dict[str, PressureHistory] = {}
+        self._to_hpa = UNIT_CONVERSIONS[Quantity.PRESSURE][
+            (ecowitt.config.input_unit_system, UNIT_SYSTEM_METRIC)
+        ]
+        self._to_output = UNIT_CONVERSIONS[Quantity.PRESSURE][
+            (UNIT_SYSTEM_METRIC, ecowitt.config.output_unit_system)
+        ]
+
+    def calculate(
+        self, station: str, data: dict[str, Any], timestamp: float
+    ) -> dict[str, CalculatedDataPoint]:
+        """Add a station's latest payload and return the calculated data points."""
+        if not self._data_points or DATA_POINT_BAROMRELIN not in data:
+            return {}
+
+        try:
+            pressure_hpa = self._to_hpa.convert(float(data[DATA_POINT_BAROMRELIN]))
+        except ValueError:
+            pressure_hpa = math.nan
+        if not math.isfinite(pressure_hpa):
+            LOGGER.debug("Invalid relative pressure: %s", data[DATA_POINT_BAROMRELIN])
+            return {}
+
+        try:
+            history = self._histories[station]
+        except KeyError:
+            history = self._histories[station] = PressureHistory()
+
+        tendency = trend = forecast = None
+        if (reference_hpa := history.add(pressure_hpa, timestamp)) is not None:
+            tendency_hpa = round(pressure_hpa - reference_hpa, 1)
+            tendency = self._to_output.convert(tendency_hpa)
+            trend = cast(PressureTrend, PRESSURE_TREND_LOOKUP.get(tendency_hpa))
+            forecast = ZAMBRETTI_FORMULAS[trend].get_forecast(pressure_hpa)
+
+        data_points = {
+            DATA_POINT_PRESSURE_TENDENCY: CalculatedDataPoint(
+                DATA_POINT_PRESSURE_TENDENCY, tendency, unit=self._to_output.unit
+            ),
+            DATA_POINT_PRESSURE_TREND: CalculatedDataPoint(
+                DATA_POINT_PRESSURE_TREND, trend
+            ),
+            DATA_POINT_ZAMBRETTI_FORECAST: CalculatedDataPoint(
+                DATA_POINT_ZAMBRETTI_FORECAST, forecast
+            ),
+        }
+        return {data_point: data_points[data_point] for data_point in self._data_points}
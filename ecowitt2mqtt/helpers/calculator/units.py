@@ -0,0 +1,187 @@
+"""Define conversions of quantities between unit systems."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Tuple
+
+from ecowitt2mqtt.const import (
+    DISTANCE_KILOMETERS,
+    DISTANCE_MILES,
+    PRESSURE_HPA,
+    PRESSURE_INHG,
+    RAINFALL_INCHES,
+    RAINFALL_MILLIMETERS,
+    SPEED_KILOMETERS_PER_HOUR,
+    SPEED_MILES_PER_HOUR,
+    TEMP_CELSIUS,
+    TEMP_FAHRENHEIT,
+    UNIT_SYSTEM_IMPERIAL,
+    UNIT_SYSTEM_METRIC,
+    WATER_VAPOR_GRAMS_PER_CUBIC_METER,
+    WATER_VAPOR_POUNDS_PER_CUBIC_FOOT,
+)
+from ecowitt2mqtt.helpers.typing import UnitSystemType
+
+
+class Quantity(Enum):
+    """Define the quantities that can be converted between unit systems."""
+
+    ABSOLUTE_HUMIDITY = "absolute_humidity"
+    DISTANCE = "distance"
+    PRESSURE = "pressure"
+    RAIN_VOLUME = "rain_volume"
+    TEMPERATURE = "temperature"
+    WIND_SPEED = "wind_speed"
+
+
+@dataclass(frozen=True)
+class UnitConversion:
+    """Define how a quantity is converted from one unit system to another.
+
+    A value is converted as ((value - base) * multiplier / divisor + offset); keeping
+    the multiplier and divisor apart means that conversions produce the exact same
+    floats (and therefore the same rounding) as the formulas they replaced. A
+    conversion that doesn't scale or round returns values as-is.
+    """
+
+    unit: str
+    base: float = 0.0
+    multiplier: float = 1.0
+    divisor: float = 1.0
+    offset: float = 0.0
+    precision: int | None = None
+    _scaled: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Determine whether the conversion scales values."""
+        object.__setattr__(
+            self,
+            "_scaled",
+            (self.base, self.multiplier, self.divisor, self.offset) != (0, 1, 1, 0),
+        )
+
+    def convert(self, value: float) -> float:
+        """Convert a value."""
+        if self._scaled:
+            value = (value - self.base) * self.multiplier / self.divisor + self.offset
+        if self.precision is not None:
+            value = round(value, self.precision)
+        return value
+
+
+ConversionTable = Dict[Tuple[UnitSystemType, UnitSystemType], UnitConversion]
+
+UNIT_CONVERSIONS: dict[Quantity, ConversionTable] = {
+    Quantity.ABSOLUTE_HUMIDITY: {
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_IMPERIAL): UnitConversion(
+            WATER_VAPOR_POUNDS_PER_CUBIC_FOOT, divisor=16018.46592051, precision=1
+        ),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_METRIC): UnitConversion(
+            WATER_VAPOR_GRAMS_PER_CUBIC_METER, precision=1
+        ),
+    },
+    Quantity.DISTANCE: {
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_IMPERIAL): UnitConversion(
+            DISTANCE_MILES, divisor=1.609, precision=1
+        ),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_METRIC): UnitConversion(DISTANCE_KILOMETERS),
+    },
+    Quantity.PRESSURE: {
+        (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_IMPERIAL): UnitConversion(PRESSURE_INHG),
+        (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_METRIC): UnitConversion(
+            PRESSURE_HPA, multiplier=33.8639, precision=3
+        ),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_IMPERIAL): UnitConversion(
+            PRESSURE_INHG, divisor=33.8639, precision=3
+        ),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_METRIC): UnitConversion(PRESSURE_HPA),
+    },
+    Quantity.RAIN_VOLUME: {
+        (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_IMPERIAL): UnitConversion(RAINFALL_INCHES),
+        (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_METRIC): UnitConversion(
+            RAINFALL_MILLIMETERS, multiplier=25.4, precision=1
+        ),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_IMPERIAL): UnitConversion(
+            RAINFALL_INCHES, divisor=25.4, precision=1
+        ),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_METRIC): UnitConversion(RAINFALL_MILLIMETERS),
+    },
+    Quantity.TEMPERATURE: {
+        (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_IMPERIAL): UnitConversion(
+            TEMP_FAHRENHEIT, precision=1
+        ),
+        (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_METRIC): UnitConversion(
+            TEMP_CELSIUS, base=32, multiplier=5, divisor=9, precision=1
+        ),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_IMPERIAL): UnitConversion(
+            TEMP_FAHRENHEIT, multiplier=9, divisor=5, offset=32, precision=1
+        ),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_METRIC): UnitConversion(
+            TEMP_CELSIUS, precision=1
+        ),
+    },
+    Quantity.WIND_SPEED: {
+        (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_IMPERIAL): UnitConversion(
+            SPEED_MILES_PER_HOUR
+        ),
+        (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_METRIC): UnitConversion(
+            SPEED_KILOMETERS_PER_HOUR, multiplier=1.60934, precision=1
+        ),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_IMPERIAL): UnitConversion(
+            SPEED_MILES_PER_HOUR, divisor=1.60934, precision=1
+        ),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_METRIC): UnitConversion(
+            SPEED_KILOMETERS_PER_HOUR
+        ),
+    },
+}
+
+# Some quantities always arrive in the same unit system, regardless of the device's:
+FIXED_INPUT_UNIT_SYSTEMS: dict[Quantity, UnitSystemType] = {
+    Quantity.ABSOLUTE_HUMIDITY: UNIT_SYSTEM_METRIC,
+    Quantity.DISTANCE: UNIT_SYSTEM_METRIC,
+}
+
+
+class UnitConverter:
+    """Define the unit conversions for a configured pair of unit systems."""
+
+    def __init__(
+        self, input_unit_system: UnitSystemType, output_unit_system: UnitSystemType
+    ) -> None:
+        """Initialize."""
+        self.input_unit_system = input_unit_system
+        self.output_unit_system = output_unit_system
+
+        try:
+            self._conversions = {
+                quantity: conversions[
+                    (
+                        FIXED_INPUT_UNIT_SYSTEMS.get(quantity, input_unit_system),
+                        output_unit_system,
+                    )
+                ]
+                for quantity, conversions in UNIT_CONVERSIONS.items()
+            }
+        except KeyError as err:
+            raise ValueError(
+                f"Unsupported unit systems: {input_unit_system} -> {output_unit_system}"
+            ) from err
+
+        self._temperature_conversions = {
+            unit_system: UNIT_CONVERSIONS[Quantity.TEMPERATURE][
+                (unit_system, output_unit_system)
+            ]
+            for unit_system in (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_METRIC)
+        }
+
+    def __getitem__(self, quantity: Quantity) -> UnitConversion:
+        """Get the conversion for a quantity in the input unit system."""
+        return self._conversions[quantity]
+
+    def convert_temperature(
+        self, temperature: float, unit_system: UnitSystemType
+    ) -> float:
+        """Convert a temperature (in whichever unit system it was calculated)."""
+        return self._temperature_conversions[unit_system].convert(temperature)
@@ -0,0 +1,70 @@
+"""Define duplicate payload suppression."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+from typing import Any, FrozenSet, Tuple
+
+PayloadFingerprint = FrozenSet[Tuple[str, Any]]
+
+# Gateways stamp every send (including retries) with a fresh time:
+FINGERPRINT_KEYS_TO_IGNORE = ("dateutc",)
+
+
+@dataclass
+class StationFingerprint:
+    """Define the last fingerprint seen for a station."""
+
+    fingerprint: PayloadFingerprint
+    received_at: float
+
+
+def fingerprint_payload(
+    payload: dict[str, Any], *, ignore_timestamp: bool = True
+) -> PayloadFingerprint:
+    """Return a fingerprint of a payload (which ignores its timestamp by default)."""
+    if not ignore_timestamp:
+        return frozenset(payload.items())
+    return frozenset(
+        item for item in payload.items() if item[0] not in FINGERPRINT_KEYS_TO_IGNORE
+    )
+
+
+class PayloadDeduplicator:
+    """Define an object that spots a station re-sending an identical payload.
+
+    Only the most recent fingerprint per station is kept; a payload is considered a
+    duplicate if it matches that fingerprint and arrived within the window.
+    """
+
+    def __init__(self, window: float) -> None:
+        """Initialize."""
+        self._last_seen: dict[str, StationFingerprint] = {}
+        self._window = window
+        self.suppressed = 0
+
+    def is_duplicate(
+        self, station: str, payload: dict[str, Any], *, ignore_timestamp: bool = True
+    ) -> bool:
+        """Return whether a payload duplicates the station's last one.
+
+        Historical readings (which carry the time they were taken, rather than the time
+        they were sent) should be checked without ignoring their timestamps.
+        """
+        if self._window <= 0:
+            return False
+
+        fingerprint = fingerprint_payload(payload, ignore_timestamp=ignore_timestamp)
+        now = time.monotonic()
+        last_seen = self._last_seen.get(station)
+
+        if (
+            last_seen is not None
+            and last_seen.fingerprint == fingerprint
+            and now - last_seen.received_at <= self._window
+        ):
+            self.suppressed += 1
+            return True
+
+        self._last_seen[station] = StationFingerprint(fingerprint, now)
+        return False
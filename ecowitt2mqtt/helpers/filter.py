@@ -0,0 +1,49 @@
+"""Define selection of the data points that get processed and published."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import fnmatch
+import re
+from typing import Iterable, Pattern
+
+
+def compile_patterns(patterns: Iterable[str]) -> Pattern[str] | None:
+    """Compile glob patterns into a single regex (or None if there are none)."""
+    if not (translated := [fnmatch.translate(pattern) for pattern in patterns]):
+        return None
+    return re.compile("|".join(translated))
+
+
+@dataclass(frozen=True)
+class KeyFilter:
+    """Define a filter of payload keys and data points, built from glob patterns.
+
+    A name is selected if it matches an include pattern (or there are none) and doesn't
+    match an exclude pattern.
+    """
+
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    _include_regex: Pattern[str] | None = field(init=False, compare=False, repr=False)
+    _exclude_regex: Pattern[str] | None = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Compile the patterns."""
+        object.__setattr__(self, "_include_regex", compile_patterns(self.include))
+        object.__setattr__(self, "_exclude_regex", compile_patterns(self.exclude))
+
+    def __bool__(self) -> bool:
+        """Return whether the filter excludes anything."""
+        return bool(self.include or self.exclude)
+
+    def matches(self, *names: str) -> bool:
+        """Return whether something (known by one or more names) is selected."""
+        if self._include_regex and not any(
+            self._include_regex.match(name) for name in names
+        ):
+            return False
+        if self._exclude_regex and any(
+            self._exclude_regex.match(name) for name in names
+        ):
+            return False
+        return True
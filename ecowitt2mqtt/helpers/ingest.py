@@ -0,0 +1,393 @@
+"""Define the HTTP ingest application and a multi-process pool that serves it."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import CancelledError
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.queues import SimpleQueue
+from multiprocessing.synchronize import BoundedSemaphore
+import os
+import signal
+import socket
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+import uvicorn
+import uvloop
+
+from ecowitt2mqtt.const import LOGGER, UNIT_SYSTEM_IMPERIAL
+from ecowitt2mqtt.errors import EcowittError
+from ecowitt2mqtt.helpers.asgi import ASGIApp, FastIngestMiddleware
+from ecowitt2mqtt.helpers.batch import MalformedBatchError, async_parse_batch
+from ecowitt2mqtt.helpers.typing import UnitSystemType
+from ecowitt2mqtt.helpers.wunderground import (
+    WUNDERGROUND_ENDPOINT,
+    WUNDERGROUND_RESPONSE,
+    normalize_wunderground_payload,
+)
+
+BATCH_ENDPOINT_SUFFIX = "/batch"
+
+# The most payloads that can be waiting to reach the publisher across all workers:
+DEFAULT_MAX_PENDING_PAYLOADS = 1000
+
+DEFAULT_DECISION_TIMEOUT = 5.0
+DEFAULT_PARENT_CHECK_INTERVAL = 1.0
+DEFAULT_WORKER_STOP_TIMEOUT = 5.0
+
+AsyncOnPayloadCallback = Callable[[Dict[str, Any]], Awaitable[bool]]
+OnBatchPayloadCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+OnPayloadCallback = Callable[[Dict[str, Any]], bool]
+
+# Where to send the parent's decision about a payload (a worker ID and sequence number):
+ReplyTo = Optional[Tuple[int, int]]
+
+
+class IngestWorkerError(EcowittError):
+    """Define an error related to an ingest worker."""
+
+    pass
+
+
+class MyCustomUvicornServer(uvicorn.Server):  # type: ignore
+    """Define a Uvicorn server that doesn't swallow signals."""
+
+    def install_signal_handlers(self) -> None:
+        """Don't swallow signals."""
+        pass
+
+
+def create_ingest_app(
+    endpoint: str,
+    async_on_payload: AsyncOnPayloadCallback,
+    async_on_batch_payload: OnBatchPayloadCallback,
+    *,
+    fast_ingest: bool = False,
+    input_unit_system: UnitSystemType = UNIT_SYSTEM_IMPERIAL,
+) -> ASGIApp:
+    """Create the ASGI application that gateways post payloads to.
+
+    `async_on_payload` is awaited with each parsed payload and returns whether it was
+    accepted; rejected payloads get an HTTP 503 response. Payloads posted to the batch
+    endpoint are instead awaited one at a time via `async_on_batch_payload`, which
+    waits until there is room for each one. Payloads sent via the Wunderground protocol
+    (a GET to either the Wunderground path or the endpoint) are normalized (into the
+    input unit system) and handed to `async_on_payload` as well.
+    """
+    app = FastAPI()
+
+    @app.post(f"{endpoint}{BATCH_ENDPOINT_SUFFIX}")
+    async def async_post_batch(request: Request) -> JSONResponse:
+        """Define an endpoint for posting NDJSON or a JSON array of payloads."""
+        accepted = 0
+        try:
+            async for payload in async_parse_batch(request.stream()):
+                await async_on_batch_payload(payload)
+                accepted += 1
+        except MalformedBatchError as err:
+            return JSONResponse(
+                {"accepted": accepted, "error": str(err)},
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        return JSONResponse({"accepted": accepted})
+
+    @app.post(endpoint, status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+    async def async_post_data(request: Request) -> Response | None:
+        """Define an endpoint for the Ecowitt device to post data to."""
+        payload = dict(await request.form())
+        if not await async_on_payload(payload):
+            return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return None
+
+    @app.get(WUNDERGROUND_ENDPOINT, response_class=PlainTextResponse)
+    @app.get(endpoint, response_class=PlainTextResponse)
+    async def async_get_wunderground_data(request: Request) -> PlainTextResponse:
+        """Define an endpoint for a device in Wunderground mode to send data to."""
+        payload = normalize_wunderground_payload(
+            request.query_params, input_unit_system
+        )
+        if not await async_on_payload(payload):
+            return PlainTextResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return PlainTextResponse(WUNDERGROUND_RESPONSE)
+
+    if fast_ingest:
+        return FastIngestMiddleware(app, endpoint, async_on_payload)
+    return app
+
+
+def create_reuseport_socket(host: str, port: int) -> socket.socket:
+    """Create a socket that several processes can bind to the same port."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+
+async def async_serve_ingest_worker(  # pylint: disable=too-many-arguments
+    host: str,
+    port: int,
+    endpoint: str,
+    fast_ingest: bool,
+    verbose: bool,
+    input_unit_system: UnitSystemType,
+    payloads: SimpleQueue,
+    slots: BoundedSemaphore,
+    parent_pid: int,
+    worker_id: int,
+    decisions: Connection | None,
+) -> None:
+    """Serve the ingest application, handing payloads to the parent process.
+
+    If `decisions` is provided, the parent may reject payloads (e.g., when using the
+    reject queue overflow policy), so each payload's response waits for its decision;
+    the wait doesn't block the loop, so other requests are handled in the meantime.
+    """
+    loop = asyncio.get_running_loop()
+    pending_decisions: dict[int, asyncio.Future[bool]] = {}
+    sequence = 0
+
+    def read_decisions(connection: Connection) -> None:
+        """Resolve the payloads that the parent has made decisions about."""
+        while connection.poll():
+            decided_sequence, accepted = connection.recv()
+            # Skip any decisions that arrived after we stopped waiting for them:
+            future = pending_decisions.pop(decided_sequence, None)
+            if future is not None:
+                future.set_result(accepted)
+
+    async def async_on_payload(payload: dict[str, Any]) -> bool:
+        """Pass a payload to the parent (if there is room for it)."""
+        nonlocal sequence
+
+        if not slots.acquire(block=False):
+            return False
+
+        # This write completes before the gateway gets its response, so a station's
+        # payloads reach the parent in order even if they hit different workers:
+        if decisions is None:
+            payloads.put((payload, False, None))
+            return True
+
+        sequence += 1
+        payload_sequence = sequence
+        future = pending_decisions[payload_sequence] = loop.create_future()
+        payloads.put((payload, False, (worker_id, payload_sequence)))
+
+        try:
+            return await asyncio.wait_for(future, DEFAULT_DECISION_TIMEOUT)
+        except asyncio.TimeoutError:
+            LOGGER.warning(
+                "Timed out waiting for the parent process to accept a payload"
+            )
+            return False
+        finally:
+            pending_decisions.pop(payload_sequence, None)
+
+    async def async_on_batch_payload(payload: dict[str, Any]) -> None:
+        """Pass a payload to the parent (waiting until there is room for it)."""
+        await asyncio.get_running_loop().run_in_executor(None, slots.acquire)
+        payloads.put((payload, True, None))
+
+    server = MyCustomUvicornServer(
+        config=uvicorn.Config(
+            create_ingest_app(
+                endpoint,
+                async_on_payload,
+                async_on_batch_payload,
+                fast_ingest=fast_ingest,
+                input_unit_system=input_unit_system,
+            ),
+            log_level="debug" if verbose else "error",
+        )
+    )
+
+    def handle_exit_signal() -> None:
+        """Handle a request from the parent to exit."""
+        server.should_exit = True
+
+    async def async_watch_parent() -> None:
+        """Exit if the parent process goes away without stopping us."""
+        while os.getppid() == parent_pid:
+            await asyncio.sleep(DEFAULT_PARENT_CHECK_INTERVAL)
+        LOGGER.warning("Parent process has exited; stopping ingest worker")
+        server.should_exit = True
+
+    loop.add_signal_handler(signal.SIGTERM, handle_exit_signal)
+    if decisions is not None:
+        loop.add_reader(decisions.fileno(), read_decisions, decisions)
+    watch_parent_task = asyncio.create_task(async_watch_parent())
+
+    try:
+        await server.serve(sockets=[create_reuseport_socket(host, port)])
+    finally:
+        watch_parent_task.cancel()
+        if decisions is not None:
+            loop.remove_reader(decisions.fileno())
+        loop.remove_signal_handler(signal.SIGTERM)
+
+
+def run_ingest_worker(*args: Any) -> None:
+    """Run an ingest worker process (taking the same arguments as the server)."""
+    # Ctrl+C reaches the whole process group, but shutdown is the parent's job; it
+    # stops workers via SIGTERM:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    loop = uvloop.new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(async_serve_ingest_worker(*args))
+
+
+class IngestWorkerPool:
+    """Define a pool of processes that serve the ingest application on one port.
+
+    Each worker binds its own listening socket with SO_REUSEPORT (so the kernel spreads
+    connections across them) and writes parsed payloads into a single pipe; a reader
+    thread in the parent hands them, in order, to a callback on the parent's loop.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        count: int,
+        *,
+        host: str,
+        port: int,
+        endpoint: str,
+        fast_ingest: bool,
+        verbose: bool,
+        input_unit_system: UnitSystemType = UNIT_SYSTEM_IMPERIAL,
+        max_pending: int = DEFAULT_MAX_PENDING_PAYLOADS,
+        wait_for_decisions: bool = False,
+    ) -> None:
+        """Initialize.
+
+        `wait_for_decisions` makes workers wait for the parent to accept or reject each
+        payload before responding to it (rather than acknowledging it right away).
+        """
+        # Spawn (rather than fork) so workers don't inherit the parent's loop/threads:
+        context = multiprocessing.get_context("spawn")
+        self._decisions: list[Connection] = []
+        self._payloads = context.SimpleQueue()
+        self._reader: threading.Thread | None = None
+        self._slots = context.BoundedSemaphore(max_pending)
+        self._processes = []
+
+        for idx in range(count):
+            worker_decisions = None
+            if wait_for_decisions:
+                worker_decisions, parent_decisions = context.Pipe(duplex=False)
+                self._decisions.append(parent_decisions)
+
+            self._processes.append(
+                context.Process(
+                    target=run_ingest_worker,
+                    args=(
+                        host,
+                        port,
+                        endpoint,
+                        fast_ingest,
+                        verbose,
+                        input_unit_system,
+                        self._payloads,
+                        self._slots,
+                        os.getpid(),
+                        idx,
+                        worker_decisions,
+                    ),
+                    daemon=True,
+                    name=f"ecowitt2mqtt-ingest-{idx}",
+                )
+            )
+
+    def _handle_payload(
+        self, on_payload: OnPayloadCallback, payload: dict[str, Any], reply_to: ReplyTo
+    ) -> None:
+        """Pass a payload to the callback (and its decision back to the worker)."""
+        accepted = on_payload(payload)
+        if reply_to is not None:
+            worker_id, sequence = reply_to
+            self._decisions[worker_id].send((sequence, accepted))
+
+    def _join_workers(self) -> None:
+        """Wait for the workers to exit (killing any that take too long)."""
+        for process in self._processes:
+            process.join(DEFAULT_WORKER_STOP_TIMEOUT)
+            if process.is_alive():
+                LOGGER.warning("Ingest worker %s didn't stop; killing it", process.name)
+                process.kill()
+                process.join()
+
+    def _read_payloads(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        on_payload: OnPayloadCallback,
+        async_on_batch_payload: OnBatchPayloadCallback,
+    ) -> None:
+        """Pass payloads from the workers to the callbacks (running in a thread)."""
+        while (item := self._payloads.get()) is not None:
+            payload, from_batch, reply_to = item
+            try:
+                if from_batch:
+                    # Block until the payload is accepted so that backpressure reaches
+                    # the workers:
+                    asyncio.run_coroutine_threadsafe(
+                        async_on_batch_payload(payload), loop
+                    ).result()
+                else:
+                    loop.call_soon_threadsafe(
+                        self._handle_payload, on_payload, payload, reply_to
+                    )
+            except (CancelledError, RuntimeError):
+                # The loop has been stopped or closed, so we're shutting down:
+                return
+            finally:
+                self._slots.release()
+
+    def check_workers(self) -> None:
+        """Raise if a worker has exited (e.g., because it couldn't bind its socket)."""
+        for process in self._processes:
+            if process.exitcode is not None:
+                raise IngestWorkerError(
+                    f"Ingest worker {process.name} exited unexpectedly "
+                    f"(exit code: {process.exitcode})"
+                )
+
+    def start(
+        self,
+        on_payload: OnPayloadCallback,
+        async_on_batch_payload: OnBatchPayloadCallback,
+    ) -> None:
+        """Start the workers and begin passing their payloads to the callbacks."""
+        for process in self._processes:
+            process.start()
+
+        # A daemon thread, since it can block on the pipe for as long as we're alive:
+        self._reader = threading.Thread(
+            target=self._read_payloads,
+            args=(asyncio.get_running_loop(), on_payload, async_on_batch_payload),
+            daemon=True,
+            name="ecowitt2mqtt-ingest-reader",
+        )
+        self._reader.start()
+
+    async def async_stop(self) -> None:
+        """Stop the workers (giving them a chance to finish in-flight requests).
+
+        Once the workers have exited, every payload they acknowledged is in the pipe, so
+        the reader thread hands those over before this returns.
+        """
+        loop = asyncio.get_running_loop()
+
+        for process in self._processes:
+            process.terminate()
+        # Joining blocks, so it happens off of the loop (which the reader thread still
+        # needs in order to hand payloads over):
+        await loop.run_in_executor(None, self._join_workers)
+
+        if self._reader is None:
+            return
+        self._payloads.put(None)
+        await loop.run_in_executor(None, self._reader.join)
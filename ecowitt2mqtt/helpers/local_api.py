@@ -0,0 +1,388 @@
+"""Define a poller for the binary local API of Ecowitt gateways (GW1000, GW2000, etc.).
+
+Gateways answer commands on a TCP port (45000 by default); live data comes back as a
+series of (item ID, value) pairs in fixed metric units, which are decoded here into
+the same shape as the payloads that gateways push.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+import hashlib
+import struct
+from typing import Any, Callable, NamedTuple
+
+from ecowitt2mqtt.const import LOGGER, UNIT_SYSTEM_IMPERIAL
+from ecowitt2mqtt.errors import EcowittError
+from ecowitt2mqtt.helpers.typing import UnitSystemType
+
+DEFAULT_LOCAL_API_PORT = 45000
+
+CMD_READ_STATION_MAC = 0x26
+CMD_LIVEDATA = 0x27
+CMD_READ_FIRMWARE_VERSION = 0x50
+
+FRAME_HEADER = b"\xff\xff"
+
+# Responses to these commands use a 2-byte (rather than a 1-byte) size field:
+LARGE_RESPONSE_COMMANDS = (CMD_LIVEDATA,)
+
+
+class LocalApiError(EcowittError):
+    """Define an error related to the gateway local API."""
+
+    pass
+
+
+def build_frame(command: int, payload: bytes = b"", *, size_length: int = 1) -> bytes:
+    """Build a local API frame.
+
+    The size counts the command, size, payload, and checksum bytes; the checksum is the
+    low byte of the sum of those same bytes (minus itself).
+    """
+    size = 1 + size_length + len(payload) + 1
+    body = bytes([command]) + size.to_bytes(size_length, "big") + payload
+    return FRAME_HEADER + body + bytes([sum(body) & 0xFF])
+
+
+async def async_read_frame(reader: asyncio.StreamReader, command: int) -> bytes:
+    """Read a response frame for a command and return its payload."""
+    size_length = 2 if command in LARGE_RESPONSE_COMMANDS else 1
+    prefix = await reader.readexactly(len(FRAME_HEADER) + 1 + size_length)
+
+    if prefix[:2] != FRAME_HEADER or prefix[2] != command:
+        raise LocalApiError(f"Unexpected response header: {prefix.hex()}")
+
+    size = int.from_bytes(prefix[3:], "big")
+    if size < 1 + size_length + 1:
+        raise LocalApiError(f"Invalid response size: {size}")
+
+    rest = await reader.readexactly(size - 1 - size_length)
+    payload, checksum = rest[:-1], rest[-1]
+
+    if sum(prefix[2:] + payload) & 0xFF != checksum:
+        raise LocalApiError("Response failed checksum validation")
+
+    return payload
+
+
+# Live data decoding:
+
+ValueConverter = Callable[[float, UnitSystemType], str]
+
+
+def _convert_distance(value: float, unit_system: UnitSystemType) -> str:
+    """Return a lightning distance (always reported in kilometers)."""
+    return str(int(value))
+
+
+def _convert_plain(value: float, unit_system: UnitSystemType) -> str:
+    """Return a value that has no unit to convert."""
+    if float(value).is_integer():
+        return str(int(value))
+    return f"{value:.1f}"
+
+
+def _convert_pressure(value: float, unit_system: UnitSystemType) -> str:
+    """Convert a pressure in hPa."""
+    if unit_system == UNIT_SYSTEM_IMPERIAL:
+        return f"{value / 33.8639:.3f}"
+    return f"{value:.1f}"
+
+
+def _convert_rain(value: float, unit_system: UnitSystemType) -> str:
+    """Convert a rainfall amount (or rate) in mm."""
+    if unit_system == UNIT_SYSTEM_IMPERIAL:
+        return f"{value / 25.4:.3f}"
+    return f"{value:.1f}"
+
+
+def _convert_solar_radiation(value: float, unit_system: UnitSystemType) -> str:
+    """Convert an illuminance in lux to solar radiation in W/m^2."""
+    return f"{value / 126.7:.2f}"
+
+
+def _convert_speed(value: float, unit_system: UnitSystemType) -> str:
+    """Convert a speed in m/s."""
+    if unit_system == UNIT_SYSTEM_IMPERIAL:
+        return f"{value * 2.23694:.2f}"
+    return f"{value * 3.6:.2f}"
+
+
+def _convert_temperature(value: float, unit_system: UnitSystemType) -> str:
+    """Convert a temperature in degrees Celsius."""
+    if unit_system == UNIT_SYSTEM_IMPERIAL:
+        return f"{value * 9 / 5 + 32:.1f}"
+    return f"{value:.1f}"
+
+
+class LiveDataItem(NamedTuple):
+    """Define how to decode a live data item."""
+
+    key: str | None
+    size: int
+    struct_format: str = ""
+    scale: float = 1.0
+    converter: ValueConverter = _convert_plain
+
+
+ITEM_WH45 = 0x70
+WH45_ITEM_SIZE = 16
+WH45_FORMAT = ">hBHHHHHHB"
+
+# Items with no key are known (so they can be skipped) but not part of push payloads:
+LIVE_DATA_ITEMS: dict[int, LiveDataItem] = {
+    0x01: LiveDataItem("tempinf", 2, ">h", 0.1, _convert_temperature),
+    0x02: LiveDataItem("tempf", 2, ">h", 0.1, _convert_temperature),
+    0x03: LiveDataItem(None, 2),  # Dew point
+    0x04: LiveDataItem(None, 2),  # Wind chill
+    0x05: LiveDataItem(None, 2),  # Heat index
+    0x06: LiveDataItem("humidityin", 1, ">B"),
+    0x07: LiveDataItem("humidity", 1, ">B"),
+    0x08: LiveDataItem("baromabsin", 2, ">H", 0.1, _convert_pressure),
+    0x09: LiveDataItem("baromrelin", 2, ">H", 0.1, _convert_pressure),
+    0x0A: LiveDataItem("winddir", 2, ">H"),
+    0x0B: LiveDataItem("windspeedmph", 2, ">H", 0.1, _convert_speed),
+    0x0C: LiveDataItem("windgustmph", 2, ">H", 0.1, _convert_speed),
+    0x0D: LiveDataItem("eventrainin", 2, ">H", 0.1, _convert_rain),
+    0x0E: LiveDataItem("rainratein", 2, ">H", 0.1, _convert_rain),
+    0x0F: LiveDataItem("hourlyrainin", 2, ">H", 0.1, _convert_rain),
+    0x10: LiveDataItem("dailyrainin", 2, ">H", 0.1, _convert_rain),
+    0x11: LiveDataItem("weeklyrainin", 2, ">H", 0.1, _convert_rain),
+    0x12: LiveDataItem("monthlyrainin", 4, ">I", 0.1, _convert_rain),
+    0x13: LiveDataItem("yearlyrainin", 4, ">I", 0.1, _convert_rain),
+    0x14: LiveDataItem("totalrainin", 4, ">I", 0.1, _convert_rain),
+    0x15: LiveDataItem("solarradiation", 4, ">I", 0.1, _convert_solar_radiation),
+    0x16: LiveDataItem(None, 2),  # UV radiation (uW/cm^2)
+    0x17: LiveDataItem("uv", 1, ">B"),
+    0x18: LiveDataItem(None, 6),  # Gateway date/time
+    0x19: LiveDataItem("maxdailygust", 2, ">H", 0.1, _convert_speed),
+    **{
+        0x1A + idx: LiveDataItem(f"temp{idx + 1}f", 2, ">h", 0.1, _convert_temperature)
+        for idx in range(8)
+    },
+    **{0x22 + idx: LiveDataItem(f"humidity{idx + 1}", 1, ">B") for idx in range(8)},
+    0x2A: LiveDataItem("pm25_ch1", 2, ">H", 0.1),
+    # Soil temperature and moisture alternate for channels 1-8:
+    **{0x2B + idx * 2: LiveDataItem(None, 2) for idx in range(8)},
+    **{
+        0x2C + idx * 2: LiveDataItem(f"soilmoisture{idx + 1}", 1, ">B")
+        for idx in range(8)
+    },
+    0x4C: LiveDataItem(None, 16),  # Legacy battery bitmap
+    **{
+        0x4D + idx: LiveDataItem(f"pm25_avg_24h_ch{idx + 1}", 2, ">H", 0.1)
+        for idx in range(4)
+    },
+    **{0x51 + idx: LiveDataItem(f"pm25_ch{idx + 2}", 2, ">H", 0.1) for idx in range(3)},
+    **{0x58 + idx: LiveDataItem(f"leak_ch{idx + 1}", 1, ">B") for idx in range(4)},
+    0x60: LiveDataItem("lightning", 1, ">B", 1.0, _convert_distance),
+    0x61: LiveDataItem("lightning_time", 4, ">I"),
+    0x62: LiveDataItem("lightning_num", 4, ">I"),
+    # WN34 temperatures are followed by a battery byte:
+    **{
+        0x63 + idx: LiveDataItem(f"tf_ch{idx + 1}", 3, ">hx", 0.1, _convert_temperature)
+        for idx in range(8)
+    },
+    0x6C: LiveDataItem(None, 4),  # Gateway free heap
+    # The WH45 item holds several values, so it is decoded separately:
+    ITEM_WH45: LiveDataItem(None, WH45_ITEM_SIZE),
+    **{
+        0x72 + idx: LiveDataItem(f"leafwetness_ch{idx + 1}", 1, ">B")
+        for idx in range(8)
+    },
+    0x7A: LiveDataItem(None, 1),  # Rain gauge priority
+    0x7B: LiveDataItem(None, 1),  # Solar radiation compensation
+    0x80: LiveDataItem("rrain_piezo", 2, ">H", 0.1, _convert_rain),
+    0x81: LiveDataItem("erain_piezo", 2, ">H", 0.1, _convert_rain),
+    0x82: LiveDataItem("hrain_piezo", 2, ">H", 0.1, _convert_rain),
+    0x83: LiveDataItem("drain_piezo", 4, ">I", 0.1, _convert_rain),
+    0x84: LiveDataItem("wrain_piezo", 4, ">I", 0.1, _convert_rain),
+    0x85: LiveDataItem("mrain_piezo", 4, ">I", 0.1, _convert_rain),
+    0x86: LiveDataItem("yrain_piezo", 4, ">I", 0.1, _convert_rain),
+    0x87: LiveDataItem(None, 20),  # Piezo rain gains
+    0x88: LiveDataItem(None, 3),  # Rain reset times
+}
+
+
+def _decode_wh45(data: bytes, unit_system: UnitSystemType) -> dict[str, str]:
+    """Decode the combined WH45 (CO2/PM) sensor item."""
+    temp, humidity, pm10, pm10_24h, pm25, pm25_24h, co2, co2_24h, batt = struct.unpack(
+        WH45_FORMAT, data
+    )
+    return {
+        "tf_co2": _convert_temperature(temp / 10, unit_system),
+        "humi_co2": str(humidity),
+        "pm10_co2": _convert_plain(pm10 / 10, unit_system),
+        "pm10_24h_co2": _convert_plain(pm10_24h / 10, unit_system),
+        "pm25_co2": _convert_plain(pm25 / 10, unit_system),
+        "pm25_24h_co2": _convert_plain(pm25_24h / 10, unit_system),
+        "co2": str(co2),
+        "co2_24h": str(co2_24h),
+        "co2_batt": str(batt),
+    }
+
+
+def decode_live_data(data: bytes, unit_system: UnitSystemType) -> dict[str, str]:
+    """Decode a live data payload into push-style keys and values.
+
+    Values are converted to the given unit system. Decoding stops at the first item
+    that isn't recognized (since its size isn't known).
+    """
+    payload: dict[str, str] = {}
+    idx = 0
+
+    while idx < len(data):
+        item_id = data[idx]
+        idx += 1
+
+        if (item := LIVE_DATA_ITEMS.get(item_id)) is None:
+            LOGGER.warning("Stopping at unknown live data item: 0x%02x", item_id)
+            break
+
+        if idx + item.size > len(data):
+            raise LocalApiError(f"Live data item 0x{item_id:02x} is truncated")
+
+        value = data[idx : idx + item.size]
+        if item_id == ITEM_WH45:
+            payload.update(_decode_wh45(value, unit_system))
+        elif item.key is not None:
+            (raw_value,) = struct.unpack(item.struct_format, value)
+            payload[item.key] = item.converter(raw_value * item.scale, unit_system)
+
+        idx += item.size
+
+    return payload
+
+
+class LocalApiGateway:
+    """Define a gateway that is polled over a persistent local API connection."""
+
+    def __init__(
+        self, host: str, port: int = DEFAULT_LOCAL_API_PORT, *, timeout: float = 5.0
+    ) -> None:
+        """Initialize."""
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._lock = asyncio.Lock()
+        self._mac: str | None = None
+        self._firmware: str | None = None
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    @property
+    def name(self) -> str:
+        """Return the gateway's address."""
+        return f"{self.host}:{self.port}"
+
+    async def _async_request(self, command: int) -> bytes:
+        """Send a command and return the payload of its response."""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        assert self._reader
+
+        self._writer.write(build_frame(command))
+        await self._writer.drain()
+        return await async_read_frame(self._reader, command)
+
+    async def async_close(self) -> None:
+        """Close the connection to the gateway (if open)."""
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is None:
+            return
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    async def async_request(self, command: int) -> bytes:
+        """Send a command (with a timeout) and return the payload of its response.
+
+        Any failure drops the connection, so that the next request starts afresh.
+        """
+        async with self._lock:
+            try:
+                return await asyncio.wait_for(
+                    self._async_request(command), self.timeout
+                )
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError, OSError) as err:
+                await self.async_close()
+                raise LocalApiError(f"Error talking to {self.name}: {err!r}") from err
+            except LocalApiError:
+                await self.async_close()
+                raise
+
+    async def async_get_payload(self, unit_system: UnitSystemType) -> dict[str, str]:
+        """Poll the gateway and return its live data as a push-style payload."""
+        if self._mac is None:
+            self._mac = (await self.async_request(CMD_READ_STATION_MAC)).hex(":")
+        if self._firmware is None:
+            response = await self.async_request(CMD_READ_FIRMWARE_VERSION)
+            self._firmware = response[1 : 1 + response[0]].decode("ascii")
+
+        live_data = await self.async_request(CMD_LIVEDATA)
+
+        return {
+            # Give each gateway a stable identity derived from its MAC address:
+            "PASSKEY": hashlib.md5(self._mac.upper().encode()).hexdigest().upper(),
+            "stationtype": self._firmware,
+            "dateutc": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+            **decode_live_data(live_data, unit_system),
+            "model": self._firmware.split("_V")[0],
+        }
+
+
+class LocalApiPoller:
+    """Define an object that polls many gateways concurrently.
+
+    Each gateway gets its own polling loop (and connection), so a slow or unreachable
+    gateway only delays itself.
+    """
+
+    def __init__(
+        self,
+        gateways: list[LocalApiGateway],
+        interval: float,
+        unit_system: UnitSystemType,
+        on_payload: Callable[[dict[str, Any]], Any],
+    ) -> None:
+        """Initialize."""
+        self._gateways = gateways
+        self._interval = interval
+        self._on_payload = on_payload
+        self._unit_system = unit_system
+
+    async def _async_poll_gateway(self, gateway: LocalApiGateway) -> None:
+        """Poll a single gateway until cancelled."""
+        loop = asyncio.get_running_loop()
+        failing = False
+
+        try:
+            while True:
+                started = loop.time()
+                try:
+                    payload = await gateway.async_get_payload(self._unit_system)
+                except LocalApiError as err:
+                    # Only warn once per outage (so that a dead gateway isn't noisy):
+                    log = LOGGER.debug if failing else LOGGER.warning
+                    log("Unable to poll gateway: %s", err)
+                    failing = True
+                else:
+                    if failing:
+                        LOGGER.info("Gateway %s is reachable again", gateway.name)
+                        failing = False
+                    self._on_payload(payload)
+                await asyncio.sleep(max(0, self._interval - (loop.time() - started)))
+        finally:
+            await gateway.async_close()
+
+    async def async_run(self) -> None:
+        """Poll every gateway until cancelled."""
+        LOGGER.debug("Polling %s gateway(s) via the local API", len(self._gateways))
+        await asyncio.gather(
+            *(self._async_poll_gateway(gateway) for gateway in self._gateways)
+        )
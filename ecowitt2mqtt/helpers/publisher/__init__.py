@@ -4,19 +4,24 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from datetime import datetime
 import json
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator, Mapping
 
 from asyncio_mqtt import Client
 
+from ecowitt2mqtt.data import get_payload_timestamp
+from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint
+from ecowitt2mqtt.helpers.calculator.pressure import PressureTendencyCalculator
+from ecowitt2mqtt.helpers.publisher.rolling import RollingStatistics
 from ecowitt2mqtt.helpers.typing import DataValueType
 
 if TYPE_CHECKING:
     from ecowitt2mqtt.core import Ecowitt
+    from ecowitt2mqtt.data import ProcessedData
 
 
 def generate_mqtt_payload(data: DataValueType) -> bytes:
     """Generate a binary MQTT payload from input data."""
-    if isinstance(data, dict):
+    if isinstance(data, Mapping):
         converted_data = json.dumps(data, default=json_serializer)
     elif not isinstance(data, str):
         converted_data = str(data)
@@ -29,9 +34,52 @@ def json_serializer(obj: Any) -> Any:
     """Define a custom JSON serializer."""
     if isinstance(obj, datetime):
         return obj.isoformat()
+    if isinstance(obj, Mapping):
+        return dict(obj)
     raise TypeError(f"Type {type(obj)} not serializable")
 
 
+class OverlaidOutput(Mapping[str, CalculatedDataPoint]):
+    """Define processed output with extra data points laid over it.
+
+    Nothing is copied, so the processed output's data points are still only calculated
+    when they're accessed; extra data points come after the processed ones.
+    """
+
+    def __init__(
+        self,
+        output: Mapping[str, CalculatedDataPoint],
+        extra_data_points: Mapping[str, CalculatedDataPoint],
+    ) -> None:
+        """Initialize."""
+        self._extra_data_points = extra_data_points
+        self._output = output
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a data point exists (without calculating it)."""
+        return key in self._extra_data_points or key in self._output
+
+    def __getitem__(self, key: str) -> CalculatedDataPoint:
+        """Get a data point."""
+        try:
+            return self._extra_data_points[key]
+        except KeyError:
+            return self._output[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the data point keys."""
+        yield from self._output
+        for key in self._extra_data_points:
+            if key not in self._output:
+                yield key
+
+    def __len__(self) -> int:
+        """Return the number of data points."""
+        return len(self._output) + sum(
+            key not in self._output for key in self._extra_data_points
+        )
+
+
 class MqttPublisher(ABC):
     """Define a base MQTT publisher."""
 
@@ -39,6 +87,36 @@ class MqttPublisher(ABC):
         """Initialize."""
         self.ecowitt = ecowitt
 
+        self._pressure_tendency: PressureTendencyCalculator | None = None
+        if not ecowitt.config.disable_calculated_data:
+            self._pressure_tendency = PressureTendencyCalculator(ecowitt)
+
+        self._rolling_statistics: RollingStatistics | None = None
+        if rolling_stats_filter := ecowitt.config.rolling_stats_filter:
+            self._rolling_statistics = RollingStatistics(rolling_stats_filter)
+
+    def get_output(
+        self, processed_data: ProcessedData
+    ) -> Mapping[str, CalculatedDataPoint]:
+        """Get the data points to publish (including any that depend on history)."""
+        station = processed_data.device.unique_id
+        timestamp = get_payload_timestamp(processed_data.data)
+        extra_data_points: dict[str, CalculatedDataPoint] = {}
+        output = OverlaidOutput(processed_data.output, extra_data_points)
+
+        if self._pressure_tendency:
+            extra_data_points.update(
+                self._pressure_tendency.calculate(
+                    station, processed_data.data, timestamp
+                )
+            )
+        if self._rolling_statistics:
+            extra_data_points.update(
+                self._rolling_statistics.update(station, output, timestamp)
+            )
+
+        return output
+
     @abstractmethod
     async def async_publish(self, client: Client, data: dict[str, Any]) -> None:
         """Publish the data."""
@@ -0,0 +1,105 @@
+"""Define tracking of published values, so that only changes get republished."""
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, NamedTuple, Tuple, cast
+
+from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint
+from ecowitt2mqtt.helpers.typing import DataValueType
+
+
+class Deadband(NamedTuple):
+    """Define how much a value must change by before it is republished."""
+
+    value: float
+    relative: bool = False
+
+    @classmethod
+    def from_string(cls, config: str | float) -> Deadband:
+        """Parse a deadband (e.g., "0.5" is absolute and "2%" is relative)."""
+        config = str(config).strip()
+        if config.endswith("%"):
+            deadband = cls(float(config[:-1]) / 100, relative=True)
+        else:
+            deadband = cls(float(config))
+
+        if deadband.value < 0:
+            raise ValueError(f"Deadband can't be negative: {config}")
+        return deadband
+
+    def is_exceeded(self, old: DataValueType, new: DataValueType) -> bool:
+        """Return whether the change from one value to another is large enough."""
+        if not all(
+            isinstance(value, (int, float)) and not isinstance(value, bool)
+            for value in (old, new)
+        ):
+            return old != new
+
+        old, new = cast(float, old), cast(float, new)
+        threshold = self.value * abs(old) if self.relative else self.value
+        return abs(new - old) > threshold
+
+
+DEFAULT_DEADBAND = Deadband(0.0)
+
+
+class PublishedEntity(NamedTuple):
+    """Define the state of an entity when it was last published."""
+
+    value: DataValueType
+    attributes: Mapping[str, Any]
+    published_at: float
+
+
+EntityKey = Tuple[str, str]
+PublishedEntities = Dict[EntityKey, PublishedEntity]
+
+
+class DeltaTracker:
+    """Define a cache of the last-published state of every (station, key) entity.
+
+    Values are compared to the last *published* one (so that slow drift still gets
+    published eventually); an entity is also republished once its heartbeat interval
+    passes (if there is one), so that retained state never goes stale.
+    """
+
+    def __init__(self, deadbands: dict[str, Deadband], heartbeat: float) -> None:
+        """Initialize."""
+        self._deadbands = deadbands
+        self._heartbeat = heartbeat
+        self._published: PublishedEntities = {}
+
+    def has_changed(
+        self,
+        station: str,
+        payload_key: str,
+        data_point: CalculatedDataPoint,
+        now: float,
+    ) -> bool:
+        """Return whether an entity needs to be (re)published."""
+        if (last := self._published.get((station, payload_key))) is None:
+            return True
+        if self._heartbeat and now - last.published_at >= self._heartbeat:
+            return True
+        if data_point.attributes != last.attributes:
+            return True
+        if (data_point.value is None) is not (last.value is None):
+            return True
+
+        # Deadbands can be set for a particular key or for a type of data point:
+        deadband = self._deadbands.get(
+            payload_key,
+            self._deadbands.get(data_point.data_point_key, DEFAULT_DEADBAND),
+        )
+        return deadband.is_exceeded(last.value, data_point.value)
+
+    def record(
+        self,
+        station: str,
+        payload_key: str,
+        data_point: CalculatedDataPoint,
+        now: float,
+    ) -> None:
+        """Record that an entity was published."""
+        self._published[(station, payload_key)] = PublishedEntity(
+            data_point.value, data_point.attributes, now
+        )
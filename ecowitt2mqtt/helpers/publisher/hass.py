@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+import time
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from asyncio_mqtt import Client, MqttError
@@ -47,7 +48,10 @@ from ecowitt2mqtt.const import (
     DATA_POINT_LIGHTNING_TIME,
     DATA_POINT_MONTHLY_RAIN,
     DATA_POINT_MRAIN_PIEZO,
+    DATA_POINT_PRESSURE_TENDENCY,
+    DATA_POINT_PRESSURE_TREND,
     DATA_POINT_RAIN_RATE,
+    DATA_POINT_ROLLING_STDDEV,
     DATA_POINT_RUNTIME,
     DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_1,
     DATA_POINT_SAFE_EXPOSURE_TIME_SKIN_TYPE_2,
@@ -71,6 +75,7 @@ from ecowitt2mqtt.const import (
     DATA_POINT_WS90_VER,
     DATA_POINT_YEARLY_RAIN,
     DATA_POINT_YRAIN_PIEZO,
+    DATA_POINT_ZAMBRETTI_FORECAST,
     LOGGER,
 )
 from ecowitt2mqtt.data import ProcessedData
@@ -81,6 +86,7 @@ from ecowitt2mqtt.helpers.calculator.battery import (
 )
 from ecowitt2mqtt.helpers.device import Device
 from ecowitt2mqtt.helpers.publisher import MqttPublisher, generate_mqtt_payload
+from ecowitt2mqtt.helpers.publisher.delta import DeltaTracker
 from ecowitt2mqtt.helpers.typing import DataValueType
 
 if TYPE_CHECKING:
@@ -332,10 +338,21 @@ ENTITY_DESCRIPTIONS = {
         device_class=DeviceClass.ILLUMINANCE,
         state_class=StateClass.MEASUREMENT,
     ),
+    DATA_POINT_PRESSURE_TENDENCY: EntityDescription(
+        icon="mdi:gauge",
+        state_class=StateClass.MEASUREMENT,
+    ),
+    DATA_POINT_PRESSURE_TREND: EntityDescription(
+        icon="mdi:trending-up",
+    ),
     DATA_POINT_RAIN_RATE: EntityDescription(
         icon="mdi:water",
         state_class=StateClass.MEASUREMENT,
     ),
+    DATA_POINT_ROLLING_STDDEV: EntityDescription(
+        icon="mdi:sigma",
+        state_class=StateClass.MEASUREMENT,
+    ),
     DATA_POINT_RUNTIME: EntityDescription(
         device_class=DeviceClass.DURATION,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -362,6 +379,9 @@ ENTITY_DESCRIPTIONS = {
         state_class=StateClass.MEASUREMENT,
     ),
     DATA_POINT_WS90_VER: EntityDescription(entity_category=EntityCategory.DIAGNOSTIC),
+    DATA_POINT_ZAMBRETTI_FORECAST: EntityDescription(
+        icon="mdi:weather-partly-cloudy",
+    ),
 }
 
 PLATFORM_MAP = {
@@ -400,8 +420,14 @@ class HomeAssistantDiscoveryPublisher(MqttPublisher):
         """Initialize."""
         super().__init__(ecowitt)
 
+        self._delta_tracker: DeltaTracker | None = None
         self._discovery_payloads: dict[str, HassDiscoveryPayload] = {}
 
+        if ecowitt.config.hass_delta_publishing:
+            self._delta_tracker = DeltaTracker(
+                ecowitt.config.hass_deadbands, ecowitt.config.hass_heartbeat * 60
+            )
+
     def _generate_discovery_payload(
         self, device: Device, payload_key: str, data_point: CalculatedDataPoint
     ) -> HassDiscoveryPayload:
@@ -480,11 +506,21 @@ class HomeAssistantDiscoveryPublisher(MqttPublisher):
         self, client: Client, data: dict[str, DataValueType]
     ) -> None:
         """Publish to MQTT."""
-        processed_data = ProcessedData(self.ecowitt, data)
+        processed_data = ProcessedData(self.ecowitt, data, lazy=True)
+        station = processed_data.device.unique_id
+        output = self.get_output(processed_data)
+        now = time.monotonic()
+        published = []
         tasks = []
 
         try:
-            for payload_key, data_point in processed_data.output.items():
+            for payload_key, data_point in output.items():
+                if self._delta_tracker and not self._delta_tracker.has_changed(
+                    station, payload_key, data_point, now
+                ):
+                    continue
+
+                published.append((payload_key, data_point))
                 discovery_payload = self._generate_discovery_payload(
                     processed_data.device, payload_key, data_point
                 )
@@ -517,5 +553,13 @@ class HomeAssistantDiscoveryPublisher(MqttPublisher):
                 task.cancel()
             raise
 
+        if self._delta_tracker:
+            for payload_key, data_point in published:
+                self._delta_tracker.record(station, payload_key, data_point, now)
+            LOGGER.debug(
+                "Skipped %s unchanged entities",
+                len(output) - len(published),
+            )
+
         LOGGER.info("Published to Home Assistant MQTT Discovery")
-        LOGGER.debug("Published data: %s", processed_data.output)
+        LOGGER.debug("Published data: %s", output)
@@ -0,0 +1,237 @@
+"""Define rolling (windowed) statistics of published data points."""
+from __future__ import annotations
+
+from collections import deque
+import math
+from typing import Deque, Dict, Mapping, NamedTuple, Tuple
+
+from ecowitt2mqtt.const import DATA_POINT_ROLLING_STDDEV
+from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint, DataPointType
+from ecowitt2mqtt.helpers.filter import KeyFilter
+
+# Each window is tracked as this many buckets (plus the one being filled), so that
+# memory use is the same no matter how often a station reports:
+BUCKETS_PER_WINDOW = 60
+
+STATISTIC_PRECISION = 3
+
+STATISTIC_MAX = "max"
+STATISTIC_MEAN = "mean"
+STATISTIC_MIN = "min"
+STATISTIC_STDDEV = "stddev"
+
+
+class Window(NamedTuple):
+    """Define a period of time that statistics are calculated over."""
+
+    name: str
+    duration: float
+
+
+ROLLING_WINDOWS = (
+    Window("10m", 10 * 60),
+    Window("1h", 60 * 60),
+    Window("24h", 24 * 60 * 60),
+)
+
+
+class Statistics(NamedTuple):
+    """Define the statistics of the samples in a window."""
+
+    minimum: float
+    maximum: float
+    mean: float
+    stddev: float
+
+
+class Bucket:  # pylint: disable=too-few-public-methods
+    """Define a summary of the samples received during part of a window.
+
+    Totals are of each sample's offset from a reference value (rather than of the
+    samples themselves), which keeps the variance numerically stable for values (like
+    pressures) that are large compared to how much they vary.
+    """
+
+    __slots__ = ("started_at", "minimum", "maximum", "total", "total_squares", "count")
+
+    def __init__(self, started_at: float, value: float) -> None:
+        """Initialize."""
+        self.started_at = started_at
+        self.minimum = value
+        self.maximum = value
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.count = 0
+
+
+class RollingWindow:
+    """Define the rolling statistics of a data point over a window.
+
+    Samples are summarized into buckets, which expire once they are older than the
+    window; the buckets holding the minimum and maximum are found via monotonic deques,
+    so adding a sample takes amortized O(1) time.
+    """
+
+    def __init__(self, window: Window) -> None:
+        """Initialize."""
+        self._bucket_duration = window.duration / BUCKETS_PER_WINDOW
+        self._buckets: Deque[Bucket] = deque()
+        self._count = 0
+        self._duration = window.duration
+        self._expirations = 0
+        self._maxima: Deque[Bucket] = deque()
+        self._minima: Deque[Bucket] = deque()
+        self._reference = 0.0
+        self.name = window.name
+        self._total = 0.0
+        self._total_squares = 0.0
+
+    def _expire(self, timestamp: float) -> None:
+        """Drop the buckets that have fallen out of the window."""
+        while (
+            self._buckets and self._buckets[0].started_at <= timestamp - self._duration
+        ):
+            bucket = self._buckets.popleft()
+            if self._minima[0] is bucket:
+                self._minima.popleft()
+            if self._maxima[0] is bucket:
+                self._maxima.popleft()
+
+            self._count -= bucket.count
+            self._total -= bucket.total
+            self._total_squares -= bucket.total_squares
+            self._expirations += 1
+
+        # Subtracting expired totals accumulates rounding errors, so the totals are
+        # periodically re-summed from the buckets (which only ever get added to):
+        if self._expirations >= BUCKETS_PER_WINDOW:
+            self._expirations = 0
+            self._total = math.fsum(bucket.total for bucket in self._buckets)
+            self._total_squares = math.fsum(
+                bucket.total_squares for bucket in self._buckets
+            )
+
+    def add(self, value: float, timestamp: float) -> Statistics:
+        """Add a sample (measured at a timestamp) and return the statistics."""
+        self._expire(timestamp)
+
+        if not self._buckets:
+            self._reference = value
+            self._total = self._total_squares = 0.0
+        if (
+            not self._buckets
+            or timestamp - self._buckets[-1].started_at >= self._bucket_duration
+        ):
+            self._buckets.append(Bucket(timestamp, value))
+
+        bucket = self._buckets[-1]
+        bucket.minimum = min(bucket.minimum, value)
+        bucket.maximum = max(bucket.maximum, value)
+
+        offset = value - self._reference
+        bucket.count += 1
+        bucket.total += offset
+        bucket.total_squares += offset * offset
+        self._count += 1
+        self._total += offset
+        self._total_squares += offset * offset
+
+        # The newest bucket is always at the back of both deques; it is moved forward
+        # past any older buckets that it now dominates:
+        if self._minima and self._minima[-1] is bucket:
+            self._minima.pop()
+        while self._minima and self._minima[-1].minimum >= bucket.minimum:
+            self._minima.pop()
+        self._minima.append(bucket)
+
+        if self._maxima and self._maxima[-1] is bucket:
+            self._maxima.pop()
+        while self._maxima and self._maxima[-1].maximum <= bucket.maximum:
+            self._maxima.pop()
+        self._maxima.append(bucket)
+
+        mean_offset = self._total / self._count
+        variance = max(self._total_squares / self._count - mean_offset**2, 0.0)
+        return Statistics(
+            minimum=self._minima[0].minimum,
+            maximum=self._maxima[0].maximum,
+            mean=self._reference + mean_offset,
+            stddev=math.sqrt(variance),
+        )
+
+
+SeriesKey = Tuple[str, str]
+Series = Dict[SeriesKey, Tuple[RollingWindow, ...]]
+
+
+class RollingStatistics:
+    """Define rolling statistics of every selected (station, key) data point.
+
+    Every window publishes its minimum, maximum, mean and (population) standard
+    deviation as extra data points (e.g., tempout_1h_max).
+    """
+
+    def __init__(self, key_filter: KeyFilter) -> None:
+        """Initialize."""
+        self._key_filter = key_filter
+        self._selected: dict[SeriesKey, bool] = {}
+        self._series: Series = {}
+
+    def _is_selected(self, key: str, data_point: CalculatedDataPoint) -> bool:
+        """Return whether statistics are calculated for a data point."""
+        series_key = (key, data_point.data_point_key)
+        try:
+            return self._selected[series_key]
+        except KeyError:
+            selected = self._selected[series_key] = self._key_filter.matches(
+                *(name for name in series_key if name)
+            )
+            return selected
+
+    def update(
+        self,
+        station: str,
+        output: Mapping[str, CalculatedDataPoint],
+        timestamp: float,
+    ) -> dict[str, CalculatedDataPoint]:
+        """Add a station's latest data points and return the updated statistics.
+
+        Samples are placed by when their payload was measured (rather than when it
+        arrived), so payloads that were queued or replayed don't bunch up.
+        """
+        statistics = {}
+
+        for key, data_point in output.items():
+            if (
+                data_point.data_type == DataPointType.BOOLEAN
+                or not isinstance(data_point.value, (int, float))
+                or isinstance(data_point.value, bool)
+                or not self._is_selected(key, data_point)
+            ):
+                continue
+
+            try:
+                windows = self._series[(station, key)]
+            except KeyError:
+                windows = self._series[(station, key)] = tuple(
+                    RollingWindow(window) for window in ROLLING_WINDOWS
+                )
+
+            for rolling_window in windows:
+                stats = rolling_window.add(data_point.value, timestamp)
+                prefix = f"{key}_{rolling_window.name}"
+                for statistic, value in (
+                    (STATISTIC_MIN, stats.minimum),
+                    (STATISTIC_MAX, stats.maximum),
+                    (STATISTIC_MEAN, round(stats.mean, STATISTIC_PRECISION)),
+                ):
+                    statistics[f"{prefix}_{statistic}"] = CalculatedDataPoint(
+                        data_point.data_point_key, value, unit=data_point.unit
+                    )
+                statistics[f"{prefix}_{STATISTIC_STDDEV}"] = CalculatedDataPoint(
+                    DATA_POINT_ROLLING_STDDEV,
+                    round(stats.stddev, STATISTIC_PRECISION),
+                    unit=data_point.unit,
+                )
+
+        return statistics
@@ -17,8 +17,13 @@ class TopicPublisher(MqttPublisher):
     ) -> None:
         """Publish to MQTT."""
         if not self.ecowitt.config.raw_data:
-            processed_data = ProcessedData(self.ecowitt, data)
-            data = {key: value.value for key, value in processed_data.output.items()}
+            processed_data = ProcessedData(self.ecowitt, data, lazy=True)
+            output = self.get_output(processed_data)
+            data = {key: value.value for key, value in output.items()}
+        elif key_filter := self.ecowitt.config.key_filter:
+            data = {
+                key: value for key, value in data.items() if key_filter.matches(key)
+            }
 
         await client.publish(
             self.ecowitt.config.mqtt_topic,
@@ -0,0 +1,212 @@
+"""Define a bounded, per-station payload queue."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from ecowitt2mqtt.backports.enum import StrEnum
+from ecowitt2mqtt.errors import EcowittError
+
+
+class OverflowPolicy(StrEnum):
+    """Define the strategies for handling a full station queue."""
+
+    COALESCE = "coalesce"
+    DROP_OLDEST = "drop_oldest"
+    REJECT = "reject"
+
+
+class QueueFullError(EcowittError):
+    """Define an error related to a full station queue."""
+
+    pass
+
+
+@dataclass
+class QueueStats:
+    """Define counters that describe how a payload queue is behaving."""
+
+    enqueued: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    merged: int = 0
+    rejected: int = 0
+    flushed: int = 0
+    abandoned: int = 0
+
+    @property
+    def overflows(self) -> int:
+        """Return the number of times a station queue has been full."""
+        return self.coalesced + self.dropped + self.rejected
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a dictionary."""
+        return {**asdict(self), "overflows": self.overflows}
+
+
+class PayloadQueue:
+    """Define a set of bounded FIFO queues (one per station).
+
+    Stations are served round-robin so that a chatty station can't starve the others.
+    A station that has been claimed by a consumer isn't handed to another one until it
+    is released, which keeps each station's payloads strictly ordered even when several
+    consumers run in parallel.
+
+    If a coalescing window is provided, a payload that arrives within that window of
+    the station's newest payload is merged into it (latest values win) rather than
+    queued separately; a payload isn't handed to a consumer until its window closes.
+    Payloads that are put without coalescing (e.g., historical readings from a batch)
+    are always queued separately and never open a window.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow_policy: OverflowPolicy,
+        *,
+        coalesce_window: float = 0.0,
+    ) -> None:
+        """Initialize."""
+        self._coalesce_window = coalesce_window
+        self._maxsize = maxsize
+        self._open_windows: dict[str, asyncio.TimerHandle] = {}
+        self._overflow_policy = overflow_policy
+        self._queues: dict[str, deque[dict[str, Any]]] = {}
+        self._ready: asyncio.Queue[str] = asyncio.Queue()
+        self._claimed: dict[str, int] = {}
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._not_full = asyncio.Condition()
+        self._scheduled: set[str] = set()
+        self.stats = QueueStats()
+
+    def __len__(self) -> int:
+        """Return the total number of queued payloads."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def pending(self) -> int:
+        """Return the number of payloads that are queued or claimed (but unreleased)."""
+        return len(self) + sum(self._claimed.values())
+
+    def _closed_count(self, station: str) -> int:
+        """Return the number of a station's payloads whose windows have closed.
+
+        Only the newest payload can still be open (a payload arriving while it is open
+        is merged into it), so at most one payload is excluded.
+        """
+        count = len(self._queues[station])
+        if station in self._open_windows:
+            count -= 1
+        return count
+
+    def _close_window(self, station: str) -> None:
+        """Close a station's coalescing window (making its newest payload ready)."""
+        self._open_windows.pop(station)
+        self._schedule(station)
+
+    def _schedule(self, station: str) -> None:
+        """Mark a station as having payloads ready to be consumed."""
+        if (
+            station in self._claimed
+            or station in self._scheduled
+            or not self._closed_count(station)
+        ):
+            return
+        self._scheduled.add(station)
+        self._ready.put_nowait(station)
+
+    def put(
+        self, station: str, payload: dict[str, Any], *, coalesce: bool = True
+    ) -> None:
+        """Add a payload to a station's queue (applying the overflow policy)."""
+        queue = self._queues.setdefault(station, deque())
+
+        if station in self._open_windows and not coalesce:
+            # The newest payload can't be merged into anymore, so it is ready now:
+            self._open_windows[station].cancel()
+            self._close_window(station)
+        elif station in self._open_windows:
+            # Merge the new payload into the still-open newest one (latest wins):
+            queue[-1].update(payload)
+            self.stats.merged += 1
+            return
+
+        if len(queue) >= self._maxsize:
+            if self._overflow_policy == OverflowPolicy.REJECT:
+                self.stats.rejected += 1
+                raise QueueFullError(f"Queue for station {station} is full")
+
+            if self._overflow_policy == OverflowPolicy.COALESCE:
+                # Merge the new payload into the newest queued one (latest wins):
+                queue[-1].update(payload)
+                self.stats.coalesced += 1
+                return
+
+            queue.popleft()
+            self.stats.dropped += 1
+
+        queue.append(payload)
+        self.stats.enqueued += 1
+        self._idle.clear()
+
+        if coalesce and self._coalesce_window > 0:
+            self._open_windows[station] = asyncio.get_running_loop().call_later(
+                self._coalesce_window, self._close_window, station
+            )
+
+        self._schedule(station)
+
+    async def async_put(
+        self, station: str, payload: dict[str, Any], *, coalesce: bool = True
+    ) -> None:
+        """Add a payload to a station's queue, waiting until the queue has room."""
+        async with self._not_full:
+            await self._not_full.wait_for(
+                lambda: len(self._queues.get(station, ())) < self._maxsize
+            )
+            self.put(station, payload, coalesce=coalesce)
+
+    async def async_claim(self, limit: int = 1) -> tuple[str, list[dict[str, Any]]]:
+        """Claim the next ready station and up to `limit` of its payloads (in order).
+
+        The station must be released (via `release`) once its payloads are handled.
+        """
+        station = await self._ready.get()
+        self._scheduled.discard(station)
+
+        queue = self._queues[station]
+        count = min(limit, self._closed_count(station))
+        payloads = [queue.popleft() for _ in range(count)]
+        self._claimed[station] = count
+
+        if payloads:
+            async with self._not_full:
+                self._not_full.notify_all()
+
+        return station, payloads
+
+    def release(self, station: str) -> None:
+        """Release a claimed station (rescheduling it if it has more payloads)."""
+        self._claimed.pop(station, None)
+        if self._queues[station]:
+            self._schedule(station)
+        elif not self.pending:
+            self._idle.set()
+
+    async def async_drain(self, timeout: float) -> None:
+        """Wait (up to a timeout) for every pending payload to be handled.
+
+        The number of payloads that were handled in time (and that weren't) are
+        recorded in the stats.
+        """
+        pending = self.pending
+        if not self._idle.is_set():
+            try:
+                await asyncio.wait_for(self._idle.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        self.stats.abandoned = self.pending
+        self.stats.flushed = pending - self.stats.abandoned
@@ -0,0 +1,96 @@
+"""Define normalization of payloads sent via the Wunderground protocol.
+
+Stations in "customized Wunderground" mode send their data as the query string of a GET
+request (always in imperial units); those payloads are translated into the same keys
+(and the configured input unit system) that the Ecowitt protocol uses so that they can
+share the rest of the pipeline.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import re
+from typing import Mapping
+
+from ecowitt2mqtt.const import UNIT_SYSTEM_IMPERIAL
+from ecowitt2mqtt.helpers.calculator.units import UNIT_CONVERSIONS, Quantity
+from ecowitt2mqtt.helpers.typing import UnitSystemType
+
+WUNDERGROUND_ENDPOINT = "/weatherstation/updateweatherstation.php"
+WUNDERGROUND_RESPONSE = "success\n"
+
+DEFAULT_WUNDERGROUND_MODEL = "Wunderground"
+
+WUNDERGROUND_KEY_MAP = {
+    "ID": "PASSKEY",
+    "UV": "uv",
+    "absbaromin": "baromabsin",
+    "baromin": "baromrelin",
+    "indoorhumidity": "humidityin",
+    "indoortempf": "tempinf",
+    "rainin": "hourlyrainin",
+    "softwaretype": "stationtype",
+}
+
+# Credentials/protocol options (which shouldn't be published) and values that we
+# calculate ourselves:
+WUNDERGROUND_KEYS_TO_DROP = (
+    "PASSWORD",
+    "action",
+    "dewptf",
+    "realtime",
+    "rtfreq",
+    "windchillf",
+)
+
+# The quantities of the (normalized) keys whose imperial values may need converting:
+WUNDERGROUND_KEY_QUANTITIES = (
+    (re.compile(r"^barom(abs|rel)in$"), Quantity.PRESSURE),
+    (re.compile(r"^[a-z]*rain(rate)?in$"), Quantity.RAIN_VOLUME),
+    (re.compile(r"^[a-z]*temp[a-z0-9]*f$"), Quantity.TEMPERATURE),
+    (re.compile(r"^wind[a-z]*mph(_[a-z0-9]+)?$"), Quantity.WIND_SPEED),
+)
+
+
+def _convert_value(key: str, value: str, unit_system: UnitSystemType) -> str:
+    """Convert an imperial value into a particular unit system (if it has a unit)."""
+    for pattern, quantity in WUNDERGROUND_KEY_QUANTITIES:
+        if not pattern.match(key):
+            continue
+        try:
+            float_value = float(value)
+        except ValueError:
+            return value
+        conversion = UNIT_CONVERSIONS[quantity][(UNIT_SYSTEM_IMPERIAL, unit_system)]
+        return str(conversion.convert(float_value))
+    return value
+
+
+def normalize_wunderground_payload(
+    params: Mapping[str, str], unit_system: UnitSystemType = UNIT_SYSTEM_IMPERIAL
+) -> dict[str, str]:
+    """Return a Wunderground payload in the same shape as an Ecowitt payload.
+
+    Values are converted from imperial units into the provided unit system (i.e., the
+    one that Ecowitt payloads are configured to arrive in).
+    """
+    payload = {
+        WUNDERGROUND_KEY_MAP.get(key, key): value
+        for key, value in params.items()
+        if key not in WUNDERGROUND_KEYS_TO_DROP
+    }
+
+    if unit_system != UNIT_SYSTEM_IMPERIAL:
+        payload = {
+            key: _convert_value(key, value, unit_system)
+            for key, value in payload.items()
+        }
+
+    if payload.get("dateutc", "now") == "now":
+        payload["dateutc"] = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+    # The model is used to identify the device, so derive one from the software type
+    # (e.g., "GW1000B_V1.6.8" or "EasyWeatherV1.6.3"):
+    station_type = payload.get("stationtype", DEFAULT_WUNDERGROUND_MODEL)
+    payload["model"] = station_type.split("_V")[0]
+
+    return payload
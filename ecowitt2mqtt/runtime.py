@@ -7,19 +7,28 @@ import signal
 from ssl import SSLContext
 import traceback
 from types import FrameType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from asyncio_mqtt import Client, MqttError
-from fastapi import FastAPI, Request, Response, status
 import uvicorn
 
 from ecowitt2mqtt.const import LOGGER
+from ecowitt2mqtt.helpers.dedupe import PayloadDeduplicator
+from ecowitt2mqtt.helpers.device import DEFAULT_UNIQUE_ID
+from ecowitt2mqtt.helpers.ingest import (
+    IngestWorkerPool,
+    MyCustomUvicornServer,
+    create_ingest_app,
+)
+from ecowitt2mqtt.helpers.local_api import LocalApiGateway, LocalApiPoller
 from ecowitt2mqtt.helpers.publisher.factory import get_publisher
+from ecowitt2mqtt.helpers.queue import OverflowPolicy, PayloadQueue, QueueFullError
 
 if TYPE_CHECKING:
     from ecowitt2mqtt.core import Ecowitt
 
 DEFAULT_HOST = "0.0.0.0"
+DEFAULT_INGEST_POOL_CHECK_INTERVAL = 0.1
 DEFAULT_MAX_RETRY_INTERVAL = 60
 
 HANDLED_SIGNALS = (
@@ -28,14 +37,6 @@ HANDLED_SIGNALS = (
 )
 
 
-class MyCustomUvicornServer(uvicorn.Server):  # type: ignore
-    """Define a Uvicorn server that doesn't swallow signals."""
-
-    def install_signal_handlers(self) -> None:
-        """Don't swallow signals."""
-        pass
-
-
 class Runtime:
     """Define the runtime manager."""
 
@@ -43,25 +44,63 @@ class Runtime:
         """Initialize."""
         self.ecowitt = ecowitt
 
-        app = FastAPI()
-        app.post(
-            ecowitt.config.endpoint,
-            status_code=status.HTTP_204_NO_CONTENT,
-            response_class=Response,
-        )(self._async_post_data)
         self._server = MyCustomUvicornServer(
             config=uvicorn.Config(
-                app,
+                create_ingest_app(
+                    ecowitt.config.endpoint,
+                    self._async_enqueue_payload,
+                    self._async_enqueue_batch_payload,
+                    fast_ingest=ecowitt.config.fast_ingest,
+                    input_unit_system=ecowitt.config.input_unit_system,
+                ),
                 host=DEFAULT_HOST,
                 port=ecowitt.config.port,
                 log_level="debug" if ecowitt.config.verbose else "error",
             )
         )
 
-        self._latest_payload: dict[str, Any] | None = None
-        self._new_payload_condition = asyncio.Condition()
+        self._payload_queue = PayloadQueue(
+            ecowitt.config.queue_size,
+            ecowitt.config.queue_overflow_policy,
+            coalesce_window=ecowitt.config.coalesce_window / 1000,
+        )
+        self._ingest_pool: IngestWorkerPool | None = None
+        if ecowitt.config.ingest_workers > 1:
+            self._ingest_pool = IngestWorkerPool(
+                ecowitt.config.ingest_workers,
+                host=DEFAULT_HOST,
+                port=ecowitt.config.port,
+                endpoint=ecowitt.config.endpoint,
+                fast_ingest=ecowitt.config.fast_ingest,
+                verbose=ecowitt.config.verbose,
+                input_unit_system=ecowitt.config.input_unit_system,
+                # Only the reject policy turns payloads away (rather than making room):
+                wait_for_decisions=(
+                    ecowitt.config.queue_overflow_policy == OverflowPolicy.REJECT
+                ),
+            )
+
+        self._local_api_poller: LocalApiPoller | None = None
+        if ecowitt.config.local_api_gateways:
+            self._local_api_poller = LocalApiPoller(
+                [
+                    LocalApiGateway(
+                        host, port, timeout=ecowitt.config.local_api_timeout
+                    )
+                    for host, port in ecowitt.config.local_api_gateways
+                ],
+                ecowitt.config.local_api_poll_interval,
+                ecowitt.config.input_unit_system,
+                self._enqueue_payload,
+            )
+
+        self._mqtt_retry_attempt = 0
+        self._payload_deduplicator = PayloadDeduplicator(ecowitt.config.dedupe_window)
         self._publisher = get_publisher(ecowitt)
+        self._ingest_tasks: list[asyncio.Task] = []
+        self._local_api_poller_task: asyncio.Task | None = None
         self._runtime_tasks: list[asyncio.Task] = []
+        self._stop_task: asyncio.Task | None = None
 
         # Remove the existing Uvicorn logger handler so that we don't get duplicates:
         # https://github.com/encode/uvicorn/issues/1285
@@ -72,7 +111,6 @@ class Runtime:
         """Create the MQTT process loop."""
         LOGGER.debug("Starting MQTT process loop")
 
-        retry_attempt = 0
         while True:
             try:
                 async with Client(
@@ -83,19 +121,7 @@ class Runtime:
                     tls_context=SSLContext() if self.ecowitt.config.mqtt_tls else None,
                     username=self.ecowitt.config.mqtt_username,
                 ) as client:
-                    while True:
-                        async with self._new_payload_condition:
-                            await self._new_payload_condition.wait()
-                            LOGGER.debug("Publishing payload: %s", self._latest_payload)
-                            assert self._latest_payload
-                            await self._publisher.async_publish(
-                                client, self._latest_payload
-                            )
-                        retry_attempt = 0
-
-                        if self.ecowitt.config.diagnostics:
-                            LOGGER.debug("*** DIAGNOSTICS COLLECTED")
-                            self.stop()
+                    await self._async_run_publish_workers(client)
             except asyncio.CancelledError:
                 LOGGER.debug("Stopping MQTT process loop")
                 raise
@@ -103,32 +129,174 @@ class Runtime:
                 LOGGER.error("There was an MQTT error: %s", err)
                 LOGGER.debug("".join(traceback.format_tb(err.__traceback__)))
 
-            retry_attempt += 1
-            delay = min(retry_attempt**2, DEFAULT_MAX_RETRY_INTERVAL)
+            self._mqtt_retry_attempt += 1
+            delay = min(self._mqtt_retry_attempt**2, DEFAULT_MAX_RETRY_INTERVAL)
             LOGGER.info(
                 "Attempting MQTT reconnection in %s seconds (attempt %s)",
                 delay,
-                retry_attempt,
+                self._mqtt_retry_attempt,
             )
             await asyncio.sleep(delay)
 
+    async def _async_publish_worker(self, client: Client) -> None:
+        """Publish queued payloads, one station at a time, until cancelled."""
+        while True:
+            station, payloads = await self._payload_queue.async_claim(
+                self.ecowitt.config.station_claim_batch_size
+            )
+
+            try:
+                for payload in payloads:
+                    LOGGER.debug("Publishing payload: %s", payload)
+                    await self._publisher.async_publish(client, payload)
+                    self._mqtt_retry_attempt = 0
+
+                    if self.ecowitt.config.diagnostics:
+                        LOGGER.debug("*** DIAGNOSTICS COLLECTED")
+                        self.stop()
+            finally:
+                self._payload_queue.release(station)
+
+    async def _async_run_publish_workers(self, client: Client) -> None:
+        """Run the pool of publish workers (stopping all of them if one fails)."""
+        workers = [
+            asyncio.create_task(self._async_publish_worker(client))
+            for _ in range(self.ecowitt.config.publish_workers)
+        ]
+
+        try:
+            done, _ = await asyncio.wait(workers, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+        for worker in done:
+            # Workers only ever finish by raising, so surface the first exception:
+            worker.result()
+
     async def _async_create_server(self) -> None:
         """Create the REST API server."""
         LOGGER.debug("Starting REST API server")
 
         try:
-            await self._server.serve()
+            if self._ingest_pool:
+                await self._async_run_ingest_pool(self._ingest_pool)
+            else:
+                await self._server.serve()
         except asyncio.CancelledError:
             LOGGER.debug("Stopping REST API server")
             raise
 
-    async def _async_post_data(self, request: Request) -> Response:
-        """Define an endpoint for the Ecowitt device to post data to."""
-        payload = dict(await request.form())
+    async def _async_run_ingest_pool(self, ingest_pool: IngestWorkerPool) -> None:
+        """Serve the REST API from a pool of ingest worker processes."""
+        LOGGER.debug("Starting %s ingest workers", self.ecowitt.config.ingest_workers)
+        ingest_pool.start(self._enqueue_payload, self._async_enqueue_batch_payload)
+
+        try:
+            # Like the Uvicorn server, serve requests until we're asked to exit:
+            while not self._server.should_exit:
+                ingest_pool.check_workers()
+                await asyncio.sleep(DEFAULT_INGEST_POOL_CHECK_INTERVAL)
+        finally:
+            await ingest_pool.async_stop()
+
+    async def _async_enqueue_batch_payload(self, payload: dict[str, str]) -> None:
+        """Queue a payload from a batch (waiting until its station's queue has room)."""
+        LOGGER.debug("Received batched data from the Ecowitt device: %s", payload)
+
+        # Each payload in a batch is a distinct historical reading, so readings are
+        # never merged and are only duplicates if their timestamps match, too:
+        station = payload.get("PASSKEY", DEFAULT_UNIQUE_ID)
+        if self._is_duplicate_payload(station, payload, ignore_timestamp=False):
+            return
+
+        await self._payload_queue.async_put(station, payload, coalesce=False)
+
+    async def _async_enqueue_payload(self, payload: dict[str, str]) -> bool:
+        """Queue a payload received by the ingest application."""
+        return self._enqueue_payload(payload)
+
+    def _enqueue_payload(self, payload: dict[str, str]) -> bool:
+        """Queue a payload for publishing (returning False if it was rejected)."""
         LOGGER.debug("Received data from the Ecowitt device: %s", payload)
-        async with self._new_payload_condition:
-            self._latest_payload = payload
-            self._new_payload_condition.notify_all()
+
+        queue_stats = self._payload_queue.stats
+        overflows = queue_stats.overflows
+        station = payload.get("PASSKEY", DEFAULT_UNIQUE_ID)
+
+        if self._is_duplicate_payload(station, payload):
+            return True
+
+        try:
+            self._payload_queue.put(station, payload)
+        except QueueFullError:
+            LOGGER.warning(
+                "Rejecting payload from station %s (queue stats: %s)",
+                station,
+                queue_stats.as_dict(),
+            )
+            return False
+
+        if queue_stats.overflows > overflows:
+            LOGGER.warning(
+                "Queue for station %s is full; applied the %s policy (queue stats: %s)",
+                station,
+                self.ecowitt.config.queue_overflow_policy,
+                queue_stats.as_dict(),
+            )
+
+        return True
+
+    def _is_duplicate_payload(
+        self, station: str, payload: dict[str, str], *, ignore_timestamp: bool = True
+    ) -> bool:
+        """Return whether a payload duplicates the station's last one."""
+        if not self._payload_deduplicator.is_duplicate(
+            station, payload, ignore_timestamp=ignore_timestamp
+        ):
+            return False
+
+        LOGGER.debug(
+            "Ignoring duplicate payload from station %s (%s suppressed so far)",
+            station,
+            self._payload_deduplicator.suppressed,
+        )
+        return True
+
+    async def _async_stop(self) -> None:
+        """Stop receiving payloads, flush the queue, and then stop publishing."""
+        LOGGER.debug("Stopping payload ingest")
+        # Let the REST API server finish its in-flight requests (rather than cancelling
+        # it) so that every payload it has acknowledged makes it into the queue:
+        self._server.should_exit = True
+        if self._local_api_poller_task:
+            self._local_api_poller_task.cancel()
+        await asyncio.wait(self._ingest_tasks)
+
+        LOGGER.debug(
+            "Flushing %s queued payload(s) (timeout: %s seconds)",
+            self._payload_queue.pending,
+            self.ecowitt.config.shutdown_timeout,
+        )
+        await self._payload_queue.async_drain(self.ecowitt.config.shutdown_timeout)
+
+        queue_stats = self._payload_queue.stats
+        log = LOGGER.warning if queue_stats.abandoned else LOGGER.info
+        log(
+            "Flushed %s queued payload(s) on shutdown; abandoned %s (queue stats: %s)",
+            queue_stats.flushed,
+            queue_stats.abandoned,
+            queue_stats.as_dict(),
+        )
+        if self.ecowitt.config.diagnostics:
+            LOGGER.debug("*** QUEUE STATS: %s", queue_stats.as_dict())
+
+        self._cancel_runtime_tasks()
+
+    def _cancel_runtime_tasks(self) -> None:
+        """Cancel all runtime tasks immediately."""
+        for task in self._runtime_tasks:
+            task.cancel()
 
     async def async_start(self) -> None:
         """Start the runtime."""
@@ -137,10 +305,11 @@ class Runtime:
         def handle_exit_signal(sig: int, frame: FrameType | None) -> None:
             """Handle an exit signal."""
             if self._server.should_exit and sig == signal.SIGINT:
+                # A second Ctrl+C skips flushing the queue:
                 self._server.force_exit = True
+                self._cancel_runtime_tasks()
             else:
-                self._server.should_exit = True
-            self.stop()
+                self.stop()
 
         try:
             for sig in HANDLED_SIGNALS:
@@ -150,9 +319,16 @@ class Runtime:
             for sig in HANDLED_SIGNALS:
                 signal.signal(sig, handle_exit_signal)
 
+        self._ingest_tasks = [asyncio.create_task(self._async_create_server())]
+        if self._local_api_poller:
+            self._local_api_poller_task = asyncio.create_task(
+                self._local_api_poller.async_run()
+            )
+            self._ingest_tasks.append(self._local_api_poller_task)
+
         self._runtime_tasks = [
-            asyncio.create_task(coro_func())
-            for coro_func in (self._async_create_mqtt_loop, self._async_create_server)
+            asyncio.create_task(self._async_create_mqtt_loop()),
+            *self._ingest_tasks,
         ]
 
         try:
@@ -166,6 +342,6 @@ class Runtime:
             LOGGER.debug("Runtime shutdown complete")
 
     def stop(self) -> None:
-        """Stop the REST API server."""
-        for task in self._runtime_tasks:
-            task.cancel()
+        """Stop the runtime (flushing queued payloads before exiting)."""
+        if self._stop_task is None:
+            self._stop_task = asyncio.create_task(self._async_stop())
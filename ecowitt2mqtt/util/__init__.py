@@ -1,20 +1,46 @@
 """Define utilities."""
 from __future__ import annotations
 
-from typing import TypeVar
-
-from thefuzz import fuzz
+from typing import Generic, Mapping, TypeVar
 
 T = TypeVar("T")
 
 
+class GlobMatcher(Generic[T]):
+    """Define a precompiled matcher that implements the rules of `glob_search`.
+
+    The dict's keys are ordered once, longest first (keeping their dict order when they
+    are equally long), so that a search can stop at the first key that the searched-for
+    key contains.
+    """
+
+    def __init__(self, data: Mapping[str, T]) -> None:
+        """Initialize."""
+        self._data = dict(data)
+        self._globs = sorted(self._data, key=len, reverse=True)
+
+    def search(self, key: str) -> tuple[str, T] | tuple[None, None]:
+        """Get a key/value pair for a key (per the rules of `glob_search`)."""
+        if key in self._data:
+            return (key, self._data[key])
+
+        for glob in self._globs:
+            if glob in key:
+                return (glob, self._data[glob])
+
+        return (None, None)
+
+
 def glob_search(data: dict[str, T], key: str) -> tuple[str, T] | tuple[None, None]:
     """Get a key/value pair from a dict based on some rules.
 
     1. If the exact key exists, use it.
     2. If a single glob exists, use it.
-    3. If multiple globs exist, use the "closest" (Levenshtein distance).
+    3. If multiple globs exist, use the "closest" (the longest, which is also the one
+       with the smallest edit distance from the key).
     4. If none of these are satisfied, return None.
+
+    Dicts that are searched repeatedly should use a `GlobMatcher` instead.
     """
     if key in data:
         return (key, data[key])
@@ -23,12 +49,9 @@ def glob_search(data: dict[str, T], key: str) -> tuple[str, T] | tuple[None, Non
     if not (matches := [k for k in data if k in key]):
         return (None, None)
 
-    # Return the closest match based on the Levenshtein distance from the key:
+    # Return the closest match:
     #   Example Key: "winddir_avg10m"
     #   Matches: ["wind", "winddir"]
     #   Closest Match: "winddir"
-    sorted_matches = sorted(
-        matches, key=lambda m: fuzz.ratio(key, m), reverse=True  # type: ignore
-    )
-    match = sorted_matches[0]
+    match = max(matches, key=len)
     return (match, data[match])
@@ -12,6 +12,7 @@ def install_with_constraints(session: nox.sessions.Session, *args: str, **kwargs
             "poetry",
             "export",
             "--dev",
+            "--extras=batch",
             "--without-hashes",
             "--format=requirements.txt",
             f"--output={requirements.name}",
@@ -32,7 +33,13 @@ def coverage(session: nox.sessions.Session) -> None:
     ]
     session.run("poetry", "install", "--no-dev", external=True)
     install_with_constraints(
-        session, "aiohttp", "pytest", "pytest-asyncio", "pytest-cov"
+        session,
+        "aiohttp",
+        "meteocalc",
+        "numpy",
+        "pytest",
+        "pytest-asyncio",
+        "pytest-cov",
     )
     session.run("pytest", *args)
 
@@ -42,5 +49,7 @@ def tests(session: nox.sessions.Session) -> None:
     """Run all tests."""
     args = session.posargs or ["-s", "tests/"]
     session.run("poetry", "install", "--no-dev", external=True)
-    install_with_constraints(session, "aiohttp", "pytest", "pytest-asyncio")
+    install_with_constraints(
+        session, "aiohttp", "meteocalc", "numpy", "pytest", "pytest-asyncio"
+    )
     session.run("pytest", *args)
@@ -0,0 +1,91 @@
+"""Define tests for publishing changes."""
+import pytest
+
+from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint
+from ecowitt2mqtt.helpers.publisher.delta import Deadband, DeltaTracker
+
+TEST_STATION = "station"
+
+
+@pytest.mark.parametrize(
+    "config,deadband",
+    [
+        ("0.5", Deadband(0.5)),
+        (0.5, Deadband(0.5)),
+        (" 2% ", Deadband(0.02, relative=True)),
+    ],
+)
+def test_deadband_from_string(config, deadband):
+    """Test parsing deadbands."""
+    assert Deadband.from_string(config) == deadband
+
+
+def test_deadband_from_string_negative():
+    """Test that negative deadbands are rejected."""
+    with pytest.raises(ValueError):
+        Deadband.from_string("-1%")
+
+
+@pytest.mark.parametrize(
+    "deadband,old,new,exceeded",
+    [
+        (Deadband(0.0), 1.0, 1.0, False),
+        (Deadband(0.0), 1.0, 1.1, True),
+        (Deadband(0.5), 70.0, 70.5, False),
+        (Deadband(0.5), 70.0, 69.4, True),
+        (Deadband(0.1, relative=True), 50, 55, False),
+        (Deadband(0.1, relative=True), -50, -56, True),
+        (Deadband(10.0), "OFF", "ON", True),
+        (Deadband(10.0), "OFF", "OFF", False),
+        (Deadband(10.0), True, False, True),
+    ],
+)
+def test_deadband_is_exceeded(deadband, old, new, exceeded):
+    """Test whether changes exceed deadbands."""
+    assert deadband.is_exceeded(old, new) is exceeded
+
+
+def test_delta_tracker():
+    """Test tracking which entities have changed."""
+    tracker = DeltaTracker(
+        {"temp": Deadband(0.5), "tempin": Deadband(1.0)}, heartbeat=900
+    )
+    temp = CalculatedDataPoint(data_point_key="temp", value=70.0)
+
+    assert tracker.has_changed(TEST_STATION, "temp", temp, 0)
+    tracker.record(TEST_STATION, "temp", temp, 0)
+
+    # Changes within the deadband aren't published (but are measured against the last
+    # published value, so drift adds up):
+    temp.value = 70.3
+    assert not tracker.has_changed(TEST_STATION, "temp", temp, 10)
+    temp.value = 70.6
+    assert tracker.has_changed(TEST_STATION, "temp", temp, 20)
+
+    # The same entity on another station is tracked separately:
+    assert tracker.has_changed("other_station", "temp", temp, 20)
+
+    # Changes in availability and attributes are always published:
+    temp.value = None
+    assert tracker.has_changed(TEST_STATION, "temp", temp, 30)
+    temp.value = 70.0
+    temp.attributes = {"extra": 1}
+    assert tracker.has_changed(TEST_STATION, "temp", temp, 40)
+    temp.attributes = {}
+
+    # A deadband for a particular key overrides the one for its type:
+    tempin = CalculatedDataPoint(data_point_key="temp", value=70.0)
+    tracker.record(TEST_STATION, "tempin", tempin, 0)
+    tempin.value = 70.8
+    assert not tracker.has_changed(TEST_STATION, "tempin", tempin, 50)
+
+    # Entities are republished once their heartbeat passes:
+    assert tracker.has_changed(TEST_STATION, "tempin", tempin, 900)
+
+
+def test_delta_tracker_no_heartbeat():
+    """Test that unchanged entities are never republished without a heartbeat."""
+    tracker = DeltaTracker({}, heartbeat=0)
+    humidity = CalculatedDataPoint(data_point_key="humidity", value=50)
+    tracker.record(TEST_STATION, "humidity", humidity, 0)
+    assert not tracker.has_changed(TEST_STATION, "humidity", humidity, 1_000_000)
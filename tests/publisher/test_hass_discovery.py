@@ -7,8 +7,11 @@ import pytest
 
 from ecowitt2mqtt.const import (
     CONF_DEFAULT_BATTERY_STRATEGY,
+    CONF_HASS_DEADBAND,
+    CONF_HASS_DELTA_PUBLISHING,
     CONF_HASS_DISCOVERY,
     CONF_HASS_ENTITY_ID_PREFIX,
+    CONF_ROLLING_STATS_KEY,
 )
 from ecowitt2mqtt.helpers.calculator.battery import BatteryStrategy
 from ecowitt2mqtt.helpers.publisher.factory import get_publisher
@@ -4121,6 +4124,99 @@ async def test_publish_custom_entity_id_prefix(
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_HASS_DEADBAND: ("runtime=100",),
+            CONF_HASS_DELTA_PUBLISHING: True,
+            CONF_HASS_DISCOVERY: True,
+        }
+    ],
+)
+@pytest.mark.parametrize("device_data_filename", ["payload_gw2000a_2.json"])
+async def test_publish_delta(
+    device_data, ecowitt, mock_asyncio_mqtt_client, setup_asyncio_mqtt
+):
+    """Test that only changed entities are republished."""
+    publisher = ecowitt._runtime._publisher
+    await publisher.async_publish(mock_asyncio_mqtt_client, device_data)
+    initial_count = mock_asyncio_mqtt_client.publish.await_count
+    assert initial_count > 0
+
+    # Nothing has changed:
+    await publisher.async_publish(mock_asyncio_mqtt_client, device_data)
+    assert mock_asyncio_mqtt_client.publish.await_count == initial_count
+
+    # A change within the deadband isn't republished:
+    device_data["runtime"] = str(int(device_data["runtime"]) + 50)
+    await publisher.async_publish(mock_asyncio_mqtt_client, device_data)
+    assert mock_asyncio_mqtt_client.publish.await_count == initial_count
+
+    # ...but one outside of it is (as all four of its messages):
+    device_data["runtime"] = str(int(device_data["runtime"]) + 100)
+    await publisher.async_publish(mock_asyncio_mqtt_client, device_data)
+    assert mock_asyncio_mqtt_client.publish.await_count == initial_count + 4
+    mock_asyncio_mqtt_client.publish.assert_awaited_with(
+        "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/runtime/state",
+        payload=device_data["runtime"].encode(),
+        retain=False,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_HASS_DISCOVERY: True,
+            CONF_ROLLING_STATS_KEY: ("tempin",),
+        }
+    ],
+)
+@pytest.mark.parametrize("device_data_filename", ["payload_gw2000a_2.json"])
+async def test_publish_rolling_stats(
+    device_data, ecowitt, mock_asyncio_mqtt_client, setup_asyncio_mqtt
+):
+    """Test publishing rolling statistics as extra entities."""
+    await ecowitt._runtime._publisher.async_publish(
+        mock_asyncio_mqtt_client, device_data
+    )
+    mock_asyncio_mqtt_client.publish.assert_has_awaits(
+        [
+            call(
+                "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/tempin_1h_max/config",
+                payload=b'{"availability_topic": "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/tempin_1h_max/availability", "device": {"identifiers": ["xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"], "manufacturer": "Ecowitt", "model": "GW2000A", "name": "GW2000A", "sw_version": "GW2000A_V2.1.4"}, "json_attributes_topic": "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/tempin_1h_max/attributes", "name": "tempin_1h_max", "qos": 1, "retain": false, "state_topic": "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/tempin_1h_max/state", "unique_id": "xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx_tempin_1h_max", "unit_of_measurement": "\\u00b0F", "device_class": "temperature", "state_class": "measurement"}',
+                retain=False,
+            ),
+            call(
+                "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/tempin_1h_max/availability",
+                payload=b"online",
+                retain=False,
+            ),
+            call(
+                "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/tempin_1h_max/attributes",
+                payload=b"{}",
+                retain=False,
+            ),
+            call(
+                "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/tempin_1h_max/state",
+                payload=b"72.9",
+                retain=False,
+            ),
+            call(
+                "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/tempin_1h_stddev/config",
+                payload=b'{"availability_topic": "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/tempin_1h_stddev/availability", "device": {"identifiers": ["xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"], "manufacturer": "Ecowitt", "model": "GW2000A", "name": "GW2000A", "sw_version": "GW2000A_V2.1.4"}, "json_attributes_topic": "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/tempin_1h_stddev/attributes", "name": "tempin_1h_stddev", "qos": 1, "retain": false, "state_topic": "homeassistant/sensor/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/tempin_1h_stddev/state", "unique_id": "xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx_tempin_1h_stddev", "unit_of_measurement": "\\u00b0F", "icon": "mdi:sigma", "state_class": "measurement"}',
+                retain=False,
+            ),
+        ],
+        any_order=True,
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "config,device_data_filename,mqtt_publish_side_effect",
@@ -0,0 +1,92 @@
+"""Define tests for rolling statistics."""
+import random
+import statistics
+
+import pytest
+
+from ecowitt2mqtt.const import DATA_POINT_ROLLING_STDDEV
+from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint, DataPointType
+from ecowitt2mqtt.helpers.filter import KeyFilter
+from ecowitt2mqtt.helpers.publisher.rolling import (
+    BUCKETS_PER_WINDOW,
+    RollingStatistics,
+    RollingWindow,
+    Window,
+)
+
+TEST_STATION = "station"
+TEST_WINDOW = Window("10m", 600)
+
+
+@pytest.mark.parametrize("base", [0.0, 1013.25])
+def test_window(base):
+    """Test that a window's statistics match those of the samples within it."""
+    rng = random.Random(0)
+    rolling_window = RollingWindow(TEST_WINDOW)
+    bucket_duration = TEST_WINDOW.duration / BUCKETS_PER_WINDOW
+    samples = []
+
+    # Samples that arrive once per bucket expire exactly when they leave the window:
+    for idx in range(1000):
+        now = idx * bucket_duration
+        value = base + round(rng.gauss(0, 5), 1)
+        samples.append((now, value))
+        window_values = [
+            value for (then, value) in samples if then > now - TEST_WINDOW.duration
+        ]
+
+        stats = rolling_window.add(value, now)
+        assert stats.minimum == min(window_values)
+        assert stats.maximum == max(window_values)
+        assert stats.mean == pytest.approx(statistics.fmean(window_values))
+        assert stats.stddev == pytest.approx(statistics.pstdev(window_values))
+
+
+def test_window_bounded():
+    """Test that a window's memory use doesn't depend on how often samples arrive."""
+    rolling_window = RollingWindow(TEST_WINDOW)
+    for idx in range(10000):
+        stats = rolling_window.add(idx % 7, idx * 0.5)
+        assert len(rolling_window._buckets) <= BUCKETS_PER_WINDOW + 1
+
+    assert stats.minimum == 0
+    assert stats.maximum == 6
+
+
+def test_window_gap():
+    """Test that a window starts over once all of its samples expire."""
+    rolling_window = RollingWindow(TEST_WINDOW)
+    rolling_window.add(10.0, 0)
+    rolling_window.add(20.0, 1)
+    stats = rolling_window.add(5.0, 5000)
+    assert stats.minimum == stats.maximum == stats.mean == 5.0
+    assert stats.stddev == 0.0
+
+
+def test_rolling_statistics():
+    """Test calculating rolling statistics of the selected data points."""
+    rolling_statistics = RollingStatistics(KeyFilter(include=("temp", "wind*")))
+    output = {
+        "tempin": CalculatedDataPoint("temp", 70.0, unit="°F"),
+        "humidityin": CalculatedDataPoint("humidity", 40, unit="%"),
+        "windspeed": CalculatedDataPoint("wind", None, unit="mph"),
+        "winddir": CalculatedDataPoint("winddir", 180),
+        "windbatt": CalculatedDataPoint("batt", True, data_type=DataPointType.BOOLEAN),
+    }
+
+    rolling_statistics.update(TEST_STATION, output, 0)
+    output["tempin"] = CalculatedDataPoint("temp", 72.0, unit="°F")
+    output["winddir"] = CalculatedDataPoint("winddir", "N")
+    stats = rolling_statistics.update(TEST_STATION, output, 60)
+
+    assert len(stats) == 12
+    assert stats["tempin_10m_min"] == CalculatedDataPoint("temp", 70.0, unit="°F")
+    assert stats["tempin_1h_max"] == CalculatedDataPoint("temp", 72.0, unit="°F")
+    assert stats["tempin_24h_mean"] == CalculatedDataPoint("temp", 71.0, unit="°F")
+    assert stats["tempin_24h_stddev"] == CalculatedDataPoint(
+        DATA_POINT_ROLLING_STDDEV, 1.0, unit="°F"
+    )
+
+    # Stations are tracked separately:
+    stats = rolling_statistics.update("other_station", output, 60)
+    assert stats["tempin_24h_mean"].value == 72.0
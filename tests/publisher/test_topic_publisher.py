@@ -2,8 +2,16 @@
 from asyncio_mqtt import Client, MqttError
 import pytest
 
-from ecowitt2mqtt.const import CONF_MQTT_RETAIN, CONF_RAW_DATA
-from ecowitt2mqtt.helpers.publisher import generate_mqtt_payload
+from ecowitt2mqtt.const import (
+    CONF_EXCLUDE_KEY,
+    CONF_INCLUDE_KEY,
+    CONF_MQTT_RETAIN,
+    CONF_RAW_DATA,
+    CONF_ROLLING_STATS_KEY,
+)
+from ecowitt2mqtt.data import ProcessedData
+from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint
+from ecowitt2mqtt.helpers.publisher import OverlaidOutput, generate_mqtt_payload
 from ecowitt2mqtt.helpers.publisher.factory import get_publisher
 from ecowitt2mqtt.helpers.publisher.topic import TopicPublisher
 
@@ -16,6 +24,22 @@ def test_get_publisher(ecowitt):
     assert isinstance(publisher, TopicPublisher)
 
 
+def test_overlaid_output(device_data, ecowitt):
+    """Test that extra data points don't cause processed ones to be calculated."""
+    output = ProcessedData(ecowitt, device_data, lazy=True).output
+    extra = CalculatedDataPoint("extra", 1.0)
+    overlaid_output = OverlaidOutput(output, {"extra": extra, "tempin": extra})
+
+    assert "extra" in overlaid_output
+    assert "humidityin" in overlaid_output
+    assert overlaid_output["tempin"] is extra
+    assert list(overlaid_output)[-1] == "extra"
+    assert len(overlaid_output) == len(output) + 1
+    assert not output._values
+
+    assert overlaid_output["humidityin"] == output["humidityin"]
+
+
 @pytest.mark.asyncio
 async def test_publish_processed(
     device_data, ecowitt, mock_asyncio_mqtt_client, setup_asyncio_mqtt
@@ -26,11 +50,198 @@ async def test_publish_processed(
     )
     mock_asyncio_mqtt_client.publish.assert_awaited_with(
         TEST_MQTT_TOPIC,
-        payload=b'{"runtime": 319206, "tempin": 79.5, "humidityin": 31, "baromrel": 24.74, "baromabs": 24.74, "temp": 93.2, "humidity": 64, "winddir": 139, "windspeed": 20.89, "windgust": 1.12, "maxdailygust": 8.05, "solarradiation": 264.61, "uv": 2, "rainrate": 0.0, "eventrain": 0.0, "hourlyrain": 0.0, "dailyrain": 0.0, "weeklyrain": 0.0, "monthlyrain": 2.177, "yearlyrain": 4.441, "lightning_num": 13, "lightning": 0.6, "lightning_time": "2022-04-20T17:17:17+00:00", "wh65batt": "OFF", "beaufortscale": 5, "dewpoint": 79.2, "feelslike": 111.1, "frostpoint": 70.3, "frostrisk": "No risk", "heatindex": 111.1, "humidityabs": 0.0, "humidityabsin": 0.0, "safe_exposure_time_skin_type_1": 83.3, "safe_exposure_time_skin_type_2": 100.0, "safe_exposure_time_skin_type_3": 133.3, "safe_exposure_time_skin_type_4": 166.7, "safe_exposure_time_skin_type_5": 266.7, "safe_exposure_time_skin_type_6": 433.3, "simmerindex": 113.9, "simmerzone": "Danger of heatstroke", "solarradiation_lux": 33494.9, "solarradiation_perceived": 90.0, "thermalperception": "Severely high", "windchill": null}',
+        payload=b'{"runtime": 319206, "tempin": 79.5, "humidityin": 31, "baromrel": 24.74, "baromabs": 24.74, "temp": 93.2, "humidity": 64, "winddir": 139, "windspeed": 20.89, "windgust": 1.12, "maxdailygust": 8.05, "solarradiation": 264.61, "uv": 2, "rainrate": 0.0, "eventrain": 0.0, "hourlyrain": 0.0, "dailyrain": 0.0, "weeklyrain": 0.0, "monthlyrain": 2.177, "yearlyrain": 4.441, "lightning_num": 13, "lightning": 0.6, "lightning_time": "2022-04-20T17:17:17+00:00", "wh65batt": "OFF", "beaufortscale": 5, "dewpoint": 79.2, "feelslike": 111.1, "frostpoint": 70.3, "frostrisk": "No risk", "heatindex": 111.1, "humidityabs": 0.0, "humidityabsin": 0.0, "safe_exposure_time_skin_type_1": 83.3, "safe_exposure_time_skin_type_2": 100.0, "safe_exposure_time_skin_type_3": 133.3, "safe_exposure_time_skin_type_4": 166.7, "safe_exposure_time_skin_type_5": 266.7, "safe_exposure_time_skin_type_6": 433.3, "simmerindex": 113.9, "simmerzone": "Danger of heatstroke", "solarradiation_lux": 33494.9, "solarradiation_perceived": 90.0, "thermalperception": "Severely high", "windchill": null, "pressuretendency": null, "pressuretrend": null, "zambrettiforecast": null}',
+        retain=False,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_EXCLUDE_KEY: ["tempin"],
+            CONF_INCLUDE_KEY: ["temp*", "dewpoint"],
+        }
+    ],
+)
+async def test_publish_filtered(
+    device_data, ecowitt, mock_asyncio_mqtt_client, setup_asyncio_mqtt
+):
+    """Test publishing only the selected data points of a processed payload."""
+    await ecowitt._runtime._publisher.async_publish(
+        mock_asyncio_mqtt_client, device_data
+    )
+    mock_asyncio_mqtt_client.publish.assert_awaited_with(
+        TEST_MQTT_TOPIC, payload=b'{"temp": 93.2, "dewpoint": 79.2}', retain=False
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [{**TEST_CONFIG_JSON, CONF_INCLUDE_KEY: ["pressure*", "zambretti*"]}],
+)
+async def test_publish_pressure_tendency(
+    device_data, ecowitt, mock_asyncio_mqtt_client, setup_asyncio_mqtt
+):
+    """Test publishing pressure tendency once there are 3 hours of history."""
+    publisher = ecowitt._runtime._publisher
+    device_data["dateutc"] = "2022-04-20 15:00:00"
+    await publisher.async_publish(mock_asyncio_mqtt_client, device_data)
+    mock_asyncio_mqtt_client.publish.assert_awaited_with(
+        TEST_MQTT_TOPIC,
+        payload=(
+            b'{"pressuretendency": null, "pressuretrend": null, '
+            b'"zambrettiforecast": null}'
+        ),
+        retain=False,
+    )
+
+    # History is kept by when payloads were measured (not when they arrive):
+    device_data["dateutc"] = "2022-04-20 18:00:00"
+    device_data["baromrelin"] = "24.600"
+    await publisher.async_publish(mock_asyncio_mqtt_client, device_data)
+    mock_asyncio_mqtt_client.publish.assert_awaited_with(
+        TEST_MQTT_TOPIC,
+        payload=(
+            b'{"pressuretendency": -0.139, "pressuretrend": "Falling quickly", '
+            b'"zambrettiforecast": "Stormy, much rain"}'
+        ),
+        retain=False,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [{**TEST_CONFIG_JSON, CONF_INCLUDE_KEY: ["pressure*", "zambretti*"]}],
+)
+@pytest.mark.parametrize("dateutc", ["now", "not a time", None])
+async def test_publish_pressure_tendency_no_dateutc(
+    dateutc, device_data, ecowitt, mock_asyncio_mqtt_client, setup_asyncio_mqtt
+):
+    """Test pressure tendency for a payload without a valid measurement time."""
+    publisher = ecowitt._runtime._publisher
+    device_data.pop("dateutc")
+    if dateutc is not None:
+        device_data["dateutc"] = dateutc
+    await publisher.async_publish(mock_asyncio_mqtt_client, device_data)
+    mock_asyncio_mqtt_client.publish.assert_awaited_with(
+        TEST_MQTT_TOPIC,
+        payload=(
+            b'{"pressuretendency": null, "pressuretrend": null, '
+            b'"zambrettiforecast": null}'
+        ),
+        retain=False,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_INCLUDE_KEY: ["temp"],
+            CONF_ROLLING_STATS_KEY: ["temp"],
+        }
+    ],
+)
+async def test_publish_rolling_stats(
+    device_data, ecowitt, mock_asyncio_mqtt_client, setup_asyncio_mqtt
+):
+    """Test publishing rolling statistics alongside a processed payload."""
+    publisher = ecowitt._runtime._publisher
+    device_data["dateutc"] = "2022-04-20 17:00:00"
+    await publisher.async_publish(mock_asyncio_mqtt_client, device_data)
+
+    # Samples are placed by when they were measured, so the first one has already left
+    # the 10-minute window:
+    device_data["dateutc"] = "2022-04-20 17:15:00"
+    device_data["tempf"] = "95.2"
+    await publisher.async_publish(mock_asyncio_mqtt_client, device_data)
+    mock_asyncio_mqtt_client.publish.assert_awaited_with(
+        TEST_MQTT_TOPIC,
+        payload=(
+            b'{"temp": 95.2, '
+            b'"temp_10m_min": 95.2, "temp_10m_max": 95.2, '
+            b'"temp_10m_mean": 95.2, "temp_10m_stddev": 0.0, '
+            b'"temp_1h_min": 93.2, "temp_1h_max": 95.2, '
+            b'"temp_1h_mean": 94.2, "temp_1h_stddev": 1.0, '
+            b'"temp_24h_min": 93.2, "temp_24h_max": 95.2, '
+            b'"temp_24h_mean": 94.2, "temp_24h_stddev": 1.0}'
+        ),
+        retain=False,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_INCLUDE_KEY: ["temp"],
+            CONF_ROLLING_STATS_KEY: ["temp"],
+        }
+    ],
+)
+@pytest.mark.parametrize("dateutc", ["now", "not a time", None])
+async def test_publish_rolling_stats_no_dateutc(
+    dateutc, device_data, ecowitt, mock_asyncio_mqtt_client, setup_asyncio_mqtt
+):
+    """Test rolling statistics for a payload without a valid measurement time."""
+    publisher = ecowitt._runtime._publisher
+    device_data.pop("dateutc")
+    if dateutc is not None:
+        device_data["dateutc"] = dateutc
+    await publisher.async_publish(mock_asyncio_mqtt_client, device_data)
+    mock_asyncio_mqtt_client.publish.assert_awaited_with(
+        TEST_MQTT_TOPIC,
+        payload=(
+            b'{"temp": 93.2, '
+            b'"temp_10m_min": 93.2, "temp_10m_max": 93.2, '
+            b'"temp_10m_mean": 93.2, "temp_10m_stddev": 0.0, '
+            b'"temp_1h_min": 93.2, "temp_1h_max": 93.2, '
+            b'"temp_1h_mean": 93.2, "temp_1h_stddev": 0.0, '
+            b'"temp_24h_min": 93.2, "temp_24h_max": 93.2, '
+            b'"temp_24h_mean": 93.2, "temp_24h_stddev": 0.0}'
+        ),
         retain=False,
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_EXCLUDE_KEY: ["PASSKEY", "*batt"],
+            CONF_RAW_DATA: True,
+        }
+    ],
+)
+async def test_publish_filtered_raw(
+    device_data, ecowitt, mock_asyncio_mqtt_client, setup_asyncio_mqtt
+):
+    """Test publishing only the selected keys of a raw payload."""
+    await ecowitt._runtime._publisher.async_publish(
+        mock_asyncio_mqtt_client, device_data
+    )
+    expected = {
+        key: value
+        for key, value in device_data.items()
+        if key != "PASSKEY" and not key.endswith("batt")
+    }
+    assert len(expected) < len(device_data)
+    mock_asyncio_mqtt_client.publish.assert_awaited_with(
+        TEST_MQTT_TOPIC, payload=generate_mqtt_payload(expected), retain=False
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "config",
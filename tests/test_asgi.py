@@ -0,0 +1,123 @@
+"""Define tests for the raw ASGI ingest fast path."""
+from urllib.parse import urlencode
+
+from aiohttp import ClientSession
+import pytest
+
+from ecowitt2mqtt.const import CONF_FAST_INGEST
+from ecowitt2mqtt.helpers.asgi import (
+    FastIngestMiddleware,
+    MalformedBodyError,
+    parse_urlencoded_body,
+)
+
+from tests.common import TEST_CONFIG_JSON, TEST_ENDPOINT, TEST_PORT
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"",
+        b"&&",
+        b"tempf",
+        b"=70.0",
+        "tempf=70.0&model=GW1000é".encode("utf-8"),
+    ],
+)
+def test_parse_malformed_body(body):
+    """Test that malformed bodies are rejected."""
+    with pytest.raises(MalformedBodyError):
+        parse_urlencoded_body(body)
+
+
+def test_parse_matches_urlencode(device_data):
+    """Test that parsing round-trips a standard urlencoded payload."""
+    device_data["stationtype"] = "GW2000A V2.1.4"
+    device_data["freq"] = "868M&more"
+    assert parse_urlencoded_body(urlencode(device_data).encode()) == device_data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [{**TEST_CONFIG_JSON, CONF_FAST_INGEST: True}])
+async def test_fast_ingest(
+    device_data,
+    ecowitt,
+    mock_asyncio_mqtt_client,
+    setup_asyncio_mqtt,
+    setup_uvicorn_server,
+):
+    """Test a successful payload POST via the fast path."""
+    async with ClientSession() as session:
+        resp = await session.request(
+            "post",
+            f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}",
+            data=device_data,
+        )
+        assert resp.status == 204
+    mock_asyncio_mqtt_client.publish.assert_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [{**TEST_CONFIG_JSON, CONF_FAST_INGEST: True}])
+@pytest.mark.parametrize(
+    "method,data,status",
+    [
+        ("post", b"tempf", 400),
+        ("post", b"tempf=70.0&" * 10000, 413),
+        # Anything other than a payload POST is handed to the regular app:
+        ("put", b"", 405),
+    ],
+)
+async def test_fast_ingest_errors(
+    data, ecowitt, method, setup_asyncio_mqtt, setup_uvicorn_server, status
+):
+    """Test rejecting bad requests via the fast path."""
+    async with ClientSession() as session:
+        resp = await session.request(
+            method,
+            f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}",
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        assert resp.status == status
+
+
+@pytest.mark.asyncio
+async def test_fast_ingest_rejected_payload():
+    """Test that a payload rejected by the queue results in a 503."""
+    chunks = iter(
+        [
+            {"type": "http.request", "body": b"tempf=", "more_body": True},
+            {"type": "http.request", "body": b"70.0", "more_body": False},
+        ]
+    )
+    messages = []
+
+    async def receive():
+        """Return the next chunk of the request body."""
+        return next(chunks)
+
+    async def send(message):
+        """Record a response message."""
+        messages.append(message)
+
+    payloads = []
+
+    async def async_on_payload(payload):
+        """Record a payload (and reject it)."""
+        payloads.append(payload)
+        return False
+
+    middleware = FastIngestMiddleware(None, TEST_ENDPOINT, async_on_payload)
+    await middleware(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": TEST_ENDPOINT,
+            "headers": [(b"content-type", b"application/x-www-form-urlencoded")],
+        },
+        receive,
+        send,
+    )
+    assert payloads == [{"tempf": "70.0"}]
+    assert messages[0]["status"] == 503
@@ -0,0 +1,60 @@
+"""Define tests for parsing batches of payloads."""
+import json
+
+import pytest
+
+from ecowitt2mqtt.helpers.batch import BatchPayloadParser, MalformedBatchError
+
+PAYLOADS = [{"PASSKEY": "station1", "runtime": runtime} for runtime in range(5)]
+
+
+def parse_in_chunks(body, chunk_size):
+    """Parse a body by feeding it to a parser in chunks of a particular size."""
+    parser = BatchPayloadParser()
+    payloads = []
+    for idx in range(0, len(body), chunk_size):
+        payloads.extend(parser.feed(body[idx : idx + chunk_size]))
+    return payloads + list(parser.close())
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        json.dumps(PAYLOADS).encode(),
+        f" [ {' , '.join(json.dumps(payload) for payload in PAYLOADS)} ]\n".encode(),
+        "\n".join(json.dumps(payload) for payload in PAYLOADS).encode(),
+        "\n\n".join(json.dumps(payload) for payload in PAYLOADS).encode() + b"\n",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_parse(body, chunk_size):
+    """Test parsing JSON arrays and NDJSON, however the body is chunked."""
+    assert parse_in_chunks(body, chunk_size) == [
+        {"PASSKEY": "station1", "runtime": str(runtime)} for runtime in range(5)
+    ]
+
+
+@pytest.mark.parametrize("body", [b"", b"  \n", b"[]"])
+def test_parse_empty(body):
+    """Test parsing an empty batch."""
+    assert parse_in_chunks(body, 1) == []
+
+
+@pytest.mark.parametrize(
+    "body,error",
+    [
+        (b'[{"tempf": "70"}', "Incomplete or invalid JSON array"),
+        (b'[{"tempf": "70"},]', "Incomplete or invalid JSON array"),
+        (b'[{"tempf": "70"} {"tempf": "71"}]', "Expected ',' between array items"),
+        (b'[{"tempf": "70"}] []', "Unexpected data after the end of the array"),
+        (b'["tempf"]', "Batch item isn't an object: 'tempf'"),
+        (b'{"tempf": "70"}\n{"tempf":', 'Invalid JSON line: {"tempf":'),
+        (b'{"tempf": "\xff"}', "Body isn't valid UTF-8"),
+        (b'{"tempf": "\xc3', "Body isn't valid UTF-8"),
+    ],
+)
+def test_parse_malformed(body, error):
+    """Test parsing malformed batches."""
+    with pytest.raises(MalformedBatchError) as err:
+        parse_in_chunks(body, 65536)
+    assert error in str(err)
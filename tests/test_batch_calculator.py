@@ -0,0 +1,155 @@
+"""Define tests for batch calculations."""
+import math
+import random
+from unittest.mock import patch
+
+import pytest
+
+from ecowitt2mqtt.const import (
+    CONF_INPUT_UNIT_SYSTEM,
+    CONF_OUTPUT_UNIT_SYSTEM,
+    UNIT_SYSTEM_IMPERIAL,
+    UNIT_SYSTEM_METRIC,
+)
+from ecowitt2mqtt.data import ProcessedData
+from ecowitt2mqtt.helpers.calculator.meteo import FrostRisk, SimmerZone
+
+from tests.common import TEST_CONFIG_JSON
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from ecowitt2mqtt.helpers.calculator.batch import calculate_batch  # noqa: E402
+
+
+def assert_matches_scalar(ecowitt, columns, results):
+    """Assert that batch results match those of processing each row as a payload."""
+    for index in range(len(next(iter(columns.values())))):
+        payload = {
+            "PASSKEY": "12345",
+            "model": "GW2000A",
+            "stationtype": "GW2000A_V2.1.4",
+            **{key: str(column[index]) for key, column in columns.items()},
+        }
+        try:
+            output = ProcessedData(ecowitt, payload).output
+        except ValueError:
+            # The scalar calculators raise where a value can't be calculated:
+            continue
+
+        for key, values in results.items():
+            expected = output[key].value
+            if expected is None:
+                assert values[index] is None or math.isnan(values[index])
+            else:
+                assert values[index] == expected, (key, payload)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_INPUT_UNIT_SYSTEM: input_unit_system,
+            CONF_OUTPUT_UNIT_SYSTEM: output_unit_system,
+        }
+        for input_unit_system in (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_METRIC)
+        for output_unit_system in (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_METRIC)
+    ],
+)
+def test_matches_scalar(ecowitt):
+    """Test that batch results match the per-payload calculators."""
+    rng = random.Random(0)
+    if ecowitt.config.unit_converter.input_unit_system == UNIT_SYSTEM_IMPERIAL:
+        temperature_range = (-40.0, 130.0)
+    else:
+        temperature_range = (-40.0, 55.0)
+
+    columns = {
+        "humidity": [rng.randint(1, 100) for _ in range(2000)],
+        "solarradiation": [round(rng.uniform(0, 1200), 2) for _ in range(2000)],
+        "tempf": [round(rng.uniform(*temperature_range), 1) for _ in range(2000)],
+        "tempinf": [round(rng.uniform(10, 40), 1) for _ in range(2000)],
+        "uv": [rng.randint(0, 11) for _ in range(2000)],
+        "windspeedmph": [round(rng.uniform(0, 80), 1) for _ in range(2000)],
+    }
+    results = calculate_batch(ecowitt.config.unit_converter, columns)
+
+    assert len(results) == 20
+    assert_matches_scalar(ecowitt, columns, results)
+
+
+def test_recalculated(ecowitt):
+    """Test that values recalculated with the scalar kernel are unchanged."""
+    columns = {
+        "humidity": [5, 35, 65, 95],
+        "solarradiation": [0.5, 10.25, 250.0, 999.99],
+        "tempf": [-10.3, 31.9, 75.1, 102.7],
+        "tempinf": [50.0, 65.5, 70.1, 80.9],
+        "uv": [1, 3, 7, 11],
+        "windspeedmph": [1.5, 12.2, 30.0, 55.5],
+    }
+    results = calculate_batch(ecowitt.config.unit_converter, columns)
+
+    # With a huge tolerance, every value is recalculated (one row at a time):
+    with patch("ecowitt2mqtt.helpers.calculator.batch.BOUNDARY_TOLERANCE", 1e6):
+        recalculated = calculate_batch(ecowitt.config.unit_converter, columns)
+
+    for key, values in results.items():
+        np.testing.assert_array_equal(recalculated[key], values)
+
+
+def test_missing_values(ecowitt):
+    """Test values that can't be calculated (or are missing from the input)."""
+    results = calculate_batch(
+        ecowitt.config.unit_converter,
+        {
+            "humidity": [0, 50, 50, math.nan],
+            "solarradiation": [0.0, -1.0, math.nan, 100.0],
+            "tempf": [20.0, 60.0, math.nan, 20.0],
+            "uv": [0, 1, 2, 3],
+            "windspeedmph": [250.0, 2.0, 10.0, 10.0],
+        },
+    )
+
+    assert math.isnan(results["dewpoint"][0])
+    assert results["frostrisk"].tolist() == [
+        None,
+        FrostRisk.NO_RISK,
+        None,
+        None,
+    ]
+    assert results["thermalperception"][0] is None
+    assert results["beaufortscale"].tolist() == [None, 1, 3, 3]
+    assert math.isnan(results["safe_exposure_time_skin_type_1"][0])
+    assert results["solarradiation_perceived"][:2].tolist() == [0.0, 0.0]
+    assert math.isnan(results["solarradiation_perceived"][2])
+    assert math.isnan(results["windchill"][1])
+    assert math.isnan(results["simmerindex"][0])
+    assert results["simmerzone"][0] is None
+
+
+def test_partial_columns(ecowitt):
+    """Test that only the data points whose inputs are present are calculated."""
+    results = calculate_batch(
+        ecowitt.config.unit_converter, {"tempf": [85.0], "humidity": [60]}
+    )
+    assert sorted(results) == [
+        "dewpoint",
+        "frostpoint",
+        "frostrisk",
+        "heatindex",
+        "humidityabs",
+        "simmerindex",
+        "simmerzone",
+        "thermalperception",
+    ]
+    assert results["simmerzone"][0] is SimmerZone.INCREASED_DISCOMFORT
+    assert calculate_batch(ecowitt.config.unit_converter, {}) == {}
+
+
+def test_rounding_halfway(ecowitt):
+    """Test that values halfway between two roundings are rounded like round()."""
+    # A UV index of 160 leaves skin type 2 with exactly 1.25 minutes:
+    results = calculate_batch(ecowitt.config.unit_converter, {"uv": [160]})
+    assert results["safe_exposure_time_skin_type_2"].tolist() == [round(1.25, 1)]
@@ -7,9 +7,27 @@ import pytest
 from ecowitt2mqtt.config import Config, ConfigError
 from ecowitt2mqtt.const import (
     CONF_BATTERY_OVERRIDES,
+    CONF_COALESCE_WINDOW,
     CONF_CONFIG,
+    CONF_DEDUPE_WINDOW,
     CONF_DEFAULT_BATTERY_STRATEGY,
+    CONF_INGEST_WORKERS,
+    CONF_EXCLUDE_KEY,
+    CONF_HASS_DEADBAND,
+    CONF_HASS_DELTA_PUBLISHING,
+    CONF_HASS_HEARTBEAT,
+    CONF_INCLUDE_KEY,
+    CONF_INPUT_UNIT_SYSTEM,
+    CONF_LOCAL_API_GATEWAY,
+    CONF_LOCAL_API_POLL_INTERVAL,
+    CONF_LOCAL_API_TIMEOUT,
     CONF_MQTT_BROKER,
+    CONF_PUBLISH_WORKERS,
+    CONF_QUEUE_OVERFLOW_POLICY,
+    CONF_QUEUE_SIZE,
+    CONF_ROLLING_STATS_KEY,
+    CONF_SHUTDOWN_TIMEOUT,
+    CONF_STATION_CLAIM_BATCH_SIZE,
     ENV_BATTERY_OVERRIDE,
     ENV_DEFAULT_BATTERY_STRATEGY,
     ENV_ENDPOINT,
@@ -17,6 +35,10 @@ from ecowitt2mqtt.const import (
     ENV_HASS_DISCOVERY_PREFIX,
     ENV_HASS_ENTITY_ID_PREFIX,
     ENV_INPUT_UNIT_SYSTEM,
+    ENV_EXCLUDE_KEY,
+    ENV_HASS_DEADBAND,
+    ENV_INCLUDE_KEY,
+    ENV_LOCAL_API_GATEWAY,
     ENV_MQTT_BROKER,
     ENV_MQTT_PASSWORD,
     ENV_MQTT_PORT,
@@ -42,6 +64,10 @@ from ecowitt2mqtt.const import (
     LEGACY_ENV_RAW_DATA,
 )
 from ecowitt2mqtt.helpers.calculator.battery import BatteryStrategy
+from ecowitt2mqtt.helpers.calculator.units import Quantity
+from ecowitt2mqtt.helpers.filter import KeyFilter
+from ecowitt2mqtt.helpers.publisher.delta import Deadband
+from ecowitt2mqtt.helpers.queue import OverflowPolicy
 
 from tests.common import (
     TEST_CONFIG_JSON,
@@ -233,3 +259,349 @@ def test_deprecated_env_var(caplog, config, legacy_env_var, new_env_var, value):
         in m
     )
     os.environ.pop(legacy_env_var)
+
+
+@pytest.mark.parametrize(
+    "raw_config",
+    [
+        json.dumps(
+            {
+                **TEST_CONFIG_JSON,
+                CONF_COALESCE_WINDOW: 250,
+                CONF_DEDUPE_WINDOW: 2.5,
+                CONF_INGEST_WORKERS: 4,
+                CONF_PUBLISH_WORKERS: 8,
+                CONF_QUEUE_OVERFLOW_POLICY: "reject",
+                CONF_QUEUE_SIZE: 25,
+                CONF_SHUTDOWN_TIMEOUT: 30,
+                CONF_STATION_CLAIM_BATCH_SIZE: 3,
+            }
+        )
+    ],
+)
+def test_queue_config_file(config_filepath):
+    """Test queue settings provided by a config file."""
+    config = Config({CONF_CONFIG: config_filepath})
+    assert config.coalesce_window == 250
+    assert config.dedupe_window == 2.5
+    assert config.ingest_workers == 4
+    assert config.publish_workers == 8
+    assert config.queue_overflow_policy == OverflowPolicy.REJECT
+    assert config.queue_size == 25
+    assert config.shutdown_timeout == 30.0
+    assert config.station_claim_batch_size == 3
+
+
+def test_queue_defaults(config):
+    """Test the default queue settings."""
+    config = Config(config)
+    assert config.coalesce_window == 0
+    assert config.dedupe_window == 0
+    assert config.ingest_workers == 1
+    assert config.publish_workers == 4
+    assert config.queue_overflow_policy == OverflowPolicy.DROP_OLDEST
+    assert config.queue_size == 10
+    assert config.shutdown_timeout == 10.0
+    assert config.station_claim_batch_size == 1
+
+
+@pytest.mark.parametrize(
+    "config,error",
+    [
+        (
+            {**TEST_CONFIG_JSON, CONF_QUEUE_OVERFLOW_POLICY: "drop_everything"},
+            "Invalid queue overflow policy: drop_everything",
+        ),
+        ({**TEST_CONFIG_JSON, CONF_QUEUE_SIZE: 0}, "Invalid queue size: 0"),
+        (
+            {**TEST_CONFIG_JSON, CONF_INGEST_WORKERS: 0},
+            "Invalid ingest workers: 0",
+        ),
+        (
+            {**TEST_CONFIG_JSON, CONF_COALESCE_WINDOW: -100},
+            "Invalid coalesce window: -100",
+        ),
+        (
+            {**TEST_CONFIG_JSON, CONF_DEDUPE_WINDOW: -5},
+            "Invalid dedupe window: -5.0",
+        ),
+        (
+            {**TEST_CONFIG_JSON, CONF_HASS_HEARTBEAT: -1},
+            "Invalid Home Assistant heartbeat: -1",
+        ),
+        (
+            {**TEST_CONFIG_JSON, CONF_SHUTDOWN_TIMEOUT: -1},
+            "Invalid shutdown timeout: -1.0",
+        ),
+        (
+            {**TEST_CONFIG_JSON, CONF_PUBLISH_WORKERS: 0},
+            "Invalid publish workers: 0",
+        ),
+        (
+            {**TEST_CONFIG_JSON, CONF_STATION_CLAIM_BATCH_SIZE: -1},
+            "Invalid station claim batch size: -1",
+        ),
+    ],
+)
+def test_queue_config_error(config, error):
+    """Test handling invalid queue settings."""
+    with pytest.raises(ConfigError) as err:
+        _ = Config(config)
+    assert error in str(err)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_HASS_DEADBAND: ("temp=0.5", "humidity=2%"),
+            CONF_HASS_DELTA_PUBLISHING: True,
+            CONF_HASS_HEARTBEAT: 5,
+        }
+    ],
+)
+def test_hass_delta_publishing_cli_options(config):
+    """Test Home Assistant delta publishing settings provided by CLI options."""
+    config = Config(config)
+    assert config.hass_deadbands == {
+        "temp": Deadband(0.5),
+        "humidity": Deadband(0.02, relative=True),
+    }
+    assert config.hass_delta_publishing is True
+    assert config.hass_heartbeat == 5
+
+
+@pytest.mark.parametrize(
+    "raw_config",
+    [
+        json.dumps(
+            {
+                **TEST_CONFIG_JSON,
+                CONF_HASS_DEADBAND: {"temp": 0.5, "humidity": "2%"},
+            }
+        )
+    ],
+)
+def test_hass_delta_publishing_config_file(config_filepath):
+    """Test Home Assistant deadbands provided by a config file."""
+    # An empty CLI option shouldn't override the config file:
+    config = Config({CONF_CONFIG: config_filepath, CONF_HASS_DEADBAND: ()})
+    assert config.hass_deadbands == {
+        "temp": Deadband(0.5),
+        "humidity": Deadband(0.02, relative=True),
+    }
+
+
+def test_hass_delta_publishing_defaults(config):
+    """Test the default Home Assistant delta publishing settings."""
+    config = Config(config)
+    assert config.hass_deadbands == {}
+    assert config.hass_delta_publishing is False
+    assert config.hass_heartbeat == 15
+
+
+def test_hass_delta_publishing_env_vars(config):
+    """Test Home Assistant deadbands provided by environment variables."""
+    os.environ[ENV_HASS_DEADBAND] = "temp=0.5;humidity=2%"
+    config = Config(config)
+    assert config.hass_deadbands == {
+        "temp": Deadband(0.5),
+        "humidity": Deadband(0.02, relative=True),
+    }
+    os.environ.pop(ENV_HASS_DEADBAND)
+
+
+@pytest.mark.parametrize(
+    "deadbands",
+    [("temp;0.5",), ("temp=abc",), ("temp=-1",), ("temp=1=2",), (1,)],
+)
+def test_hass_delta_publishing_deadband_error(config, deadbands):
+    """Test handling invalid Home Assistant deadbands."""
+    with pytest.raises(ConfigError) as err:
+        _ = Config({**config, CONF_HASS_DEADBAND: deadbands})
+    assert "Unable to parse deadband configurations" in str(err.value)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_EXCLUDE_KEY: ("*batt",),
+            CONF_INCLUDE_KEY: ("temp*", "humidity*"),
+        }
+    ],
+)
+def test_key_filter_cli_options(config):
+    """Test key patterns provided by CLI options."""
+    config = Config(config)
+    assert config.key_filter == KeyFilter(
+        include=("temp*", "humidity*"), exclude=("*batt",)
+    )
+
+
+@pytest.mark.parametrize(
+    "raw_config",
+    [
+        json.dumps(
+            {
+                **TEST_CONFIG_JSON,
+                CONF_EXCLUDE_KEY: ["*batt"],
+                CONF_INCLUDE_KEY: ["temp*"],
+            }
+        )
+    ],
+)
+def test_key_filter_config_file(config_filepath):
+    """Test key patterns provided by a config file."""
+    # An empty CLI option shouldn't override the config file:
+    config = Config({CONF_CONFIG: config_filepath, CONF_INCLUDE_KEY: ()})
+    assert config.key_filter == KeyFilter(include=("temp*",), exclude=("*batt",))
+
+
+def test_key_filter_defaults(config):
+    """Test that no key patterns select everything by default."""
+    config = Config(config)
+    assert not config.key_filter
+
+
+def test_key_filter_env_vars(config):
+    """Test key patterns provided by environment variables."""
+    os.environ[ENV_EXCLUDE_KEY] = "*batt PASSKEY"
+    os.environ[ENV_INCLUDE_KEY] = "temp*"
+    config = Config(
+        {
+            **config,
+            CONF_EXCLUDE_KEY: os.getenv(ENV_EXCLUDE_KEY),
+            CONF_INCLUDE_KEY: os.getenv(ENV_INCLUDE_KEY),
+        }
+    )
+    assert config.key_filter == KeyFilter(
+        include=("temp*",), exclude=("*batt", "PASSKEY")
+    )
+    os.environ.pop(ENV_EXCLUDE_KEY)
+    os.environ.pop(ENV_INCLUDE_KEY)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_LOCAL_API_GATEWAY: ("192.168.1.50", "192.168.1.51:12345"),
+            CONF_LOCAL_API_POLL_INTERVAL: 10,
+            CONF_LOCAL_API_TIMEOUT: 2.5,
+        }
+    ],
+)
+def test_local_api_cli_options(config):
+    """Test local API settings provided by CLI options."""
+    config = Config(config)
+    assert config.local_api_gateways == [
+        ("192.168.1.50", 45000),
+        ("192.168.1.51", 12345),
+    ]
+    assert config.local_api_poll_interval == 10.0
+    assert config.local_api_timeout == 2.5
+
+
+@pytest.mark.parametrize(
+    "raw_config",
+    [
+        json.dumps(
+            {
+                **TEST_CONFIG_JSON,
+                CONF_LOCAL_API_GATEWAY: ["192.168.1.50", "192.168.1.51:12345"],
+            }
+        )
+    ],
+)
+def test_local_api_config_file(config_filepath):
+    """Test local API gateways provided by a config file."""
+    # An empty CLI option shouldn't override the config file:
+    config = Config({CONF_CONFIG: config_filepath, CONF_LOCAL_API_GATEWAY: ()})
+    assert config.local_api_gateways == [
+        ("192.168.1.50", 45000),
+        ("192.168.1.51", 12345),
+    ]
+
+
+def test_local_api_defaults(config):
+    """Test the default local API settings."""
+    config = Config(config)
+    assert config.local_api_gateways == []
+    assert config.local_api_poll_interval == 5.0
+    assert config.local_api_timeout == 5.0
+
+
+def test_local_api_env_vars(config):
+    """Test local API gateways provided by environment variables."""
+    os.environ[ENV_LOCAL_API_GATEWAY] = "192.168.1.50 192.168.1.51:12345"
+    config = Config(
+        {**config, CONF_LOCAL_API_GATEWAY: os.getenv(ENV_LOCAL_API_GATEWAY)}
+    )
+    assert config.local_api_gateways == [
+        ("192.168.1.50", 45000),
+        ("192.168.1.51", 12345),
+    ]
+    os.environ.pop(ENV_LOCAL_API_GATEWAY)
+
+
+@pytest.mark.parametrize(
+    "config,error",
+    [
+        (
+            {**TEST_CONFIG_JSON, CONF_LOCAL_API_GATEWAY: ("192.168.1.50:abc",)},
+            "Invalid local API gateway: 192.168.1.50:abc",
+        ),
+        (
+            {**TEST_CONFIG_JSON, CONF_LOCAL_API_GATEWAY: (":45000",)},
+            "Invalid local API gateway: :45000",
+        ),
+        (
+            {**TEST_CONFIG_JSON, CONF_LOCAL_API_POLL_INTERVAL: 0},
+            "Invalid local API poll interval: 0.0",
+        ),
+        (
+            {**TEST_CONFIG_JSON, CONF_LOCAL_API_TIMEOUT: -1},
+            "Invalid local API timeout: -1.0",
+        ),
+    ],
+)
+def test_local_api_config_error(config, error):
+    """Test handling invalid local API settings."""
+    with pytest.raises(ConfigError) as err:
+        _ = Config(config)
+    assert error in str(err)
+
+
+def test_rolling_stats_defaults(config):
+    """Test that rolling statistics are disabled by default."""
+    config = Config(config)
+    assert config.rolling_stats_filter is None
+
+
+@pytest.mark.parametrize(
+    "raw_config",
+    [json.dumps({**TEST_CONFIG_JSON, CONF_ROLLING_STATS_KEY: "temp wind*"})],
+)
+def test_rolling_stats_config_file(config_filepath):
+    """Test rolling statistics keys provided by a config file."""
+    config = Config({CONF_CONFIG: config_filepath, CONF_ROLLING_STATS_KEY: ()})
+    assert config.rolling_stats_filter == KeyFilter(include=("temp", "wind*"))
+
+
+def test_unit_converter(config):
+    """Test that unit conversions are built for the configured unit systems."""
+    config = Config({**config, CONF_INPUT_UNIT_SYSTEM: "metric"})
+    assert config.unit_converter.input_unit_system == "metric"
+    assert config.unit_converter.output_unit_system == "imperial"
+    assert config.unit_converter[Quantity.PRESSURE].unit == "inHg"
+
+
+def test_unit_converter_error(config):
+    """Test handling invalid unit systems (e.g., from a config file)."""
+    with pytest.raises(ConfigError) as err:
+        _ = Config({**config, CONF_INPUT_UNIT_SYSTEM: "kelvin"})
+    assert "Invalid unit systems: kelvin -> imperial" in str(err)
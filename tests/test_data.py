@@ -1,5 +1,7 @@
 """Define tests for data processing."""
 from datetime import datetime, timezone
+import math
+from unittest.mock import patch
 
 import pytest
 
@@ -34,12 +36,31 @@ from ecowitt2mqtt.const import (
     WATER_VAPOR_GRAMS_PER_CUBIC_METER,
     WATER_VAPOR_POUNDS_PER_CUBIC_FOOT,
 )
-from ecowitt2mqtt.data import ProcessedData
-from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint, DataPointType
+from ecowitt2mqtt.data import (
+    PROCESSING_PLANS,
+    KeyResolution,
+    ProcessedData,
+    ProcessingPlanCache,
+    calculate_raw_value,
+    calculate_temperature,
+    calculate_wind_dir,
+    get_numeric_value,
+    get_payload_timestamp,
+    get_typed_value,
+    get_value_parser,
+    resolve_key,
+)
+from ecowitt2mqtt.helpers.calculator import (
+    EMPTY_ATTRIBUTES,
+    CalculatedDataPoint,
+    DataPointType,
+    kernel,
+)
 from ecowitt2mqtt.helpers.calculator.battery import BatteryStrategy, BooleanBatteryState
 from ecowitt2mqtt.helpers.calculator.leak import LeakState
 from ecowitt2mqtt.helpers.calculator.meteo import (
     FrostRisk,
+    RatingLookup,
     SimmerZone,
     ThermalPerception,
 )
@@ -4950,6 +4971,218 @@ def test_process(device_data, ecowitt, expected_output, request):
     assert processed_data.output == expected_output
 
 
+def test_process_lazy(device_data, ecowitt):
+    """Test that a lazy payload only calculates the data points that are accessed."""
+    eager_data = ProcessedData(ecowitt, device_data)
+
+    with patch(
+        "ecowitt2mqtt.helpers.calculator.kernel.dew_point",
+        wraps=kernel.dew_point,
+    ) as mock_dew_point:
+        processed_data = ProcessedData(ecowitt, device_data, lazy=True)
+        assert "dewpoint" in processed_data.output
+        assert "nonexistent" not in processed_data.output
+        assert processed_data.output["tempin"] == eager_data.output["tempin"]
+        mock_dew_point.assert_not_called()
+
+        dew_point = processed_data.output["dewpoint"]
+        assert processed_data.output["dewpoint"] is dew_point
+        assert processed_data.output["frostpoint"] == eager_data.output["frostpoint"]
+        mock_dew_point.assert_called_once()
+
+    assert len(processed_data.output) == len(eager_data.output)
+    assert processed_data.output == eager_data.output
+    assert repr(processed_data.output) == repr(dict(eager_data.output))
+
+
+@pytest.mark.parametrize(
+    "device_data",
+    [
+        {
+            "PASSKEY": "12345",
+            "model": "GW2000A",
+            "stationtype": "GW2000A_V2.1.4",
+            "humidity": "5",
+            "tempf": "-140.0",
+            "windspeedmph": "250.0",
+        }
+    ],
+)
+def test_out_of_range_ratings(device_data, ecowitt):
+    """Test values that are outside of every rating."""
+    processed_data = ProcessedData(ecowitt, device_data)
+    assert processed_data.output["beaufortscale"].value is None
+    assert processed_data.output["thermalperception"].value is None
+
+
+def test_rating_lookup():
+    """Test looking up the ratings that cover ranges of values."""
+    lookup = RatingLookup([(10.0, 20.0, "warm"), (0.0, 10.0, "cool")])
+    assert lookup.boundaries == [0.0, 10.0, 20.0]
+    assert [lookup.get(value) for value in (-0.1, 0.0, 9.9, 10.0, 19.9, 20.0)] == [
+        None,
+        "cool",
+        "cool",
+        "warm",
+        "warm",
+        None,
+    ]
+    assert lookup.get(math.nan) is None
+
+    with pytest.raises(ValueError) as err:
+        _ = RatingLookup([(0.0, 10.0, "cool"), (15.0, 20.0, "warm")])
+    assert "Rating ranges aren't consecutive: 10.0 -> 15.0" in str(err.value)
+
+
+def test_processing_plan_cache():
+    """Test that processing plans are bounded and evicted least-recently-used first."""
+    cache = ProcessingPlanCache(2)
+    plan1 = cache.get({"tempf": "70.0", "humidity": "50"})
+    cache.get({"tempf": "70.0"})
+
+    # Key-sets (not key order) identify a plan:
+    assert cache.get({"humidity": "51", "tempf": "71.0"}) is plan1
+
+    cache.get({"humidity": "50"})
+    assert len(cache) == 2
+    assert cache.get({"tempf": "70.0", "humidity": "50"}) is plan1
+    assert cache.get({"tempf": "70.0"}) is not None
+    assert len(cache) == 2
+
+
+def test_calculated_data_point():
+    """Test the slotted representation of a calculated data point."""
+    data_point = CalculatedDataPoint("temp", 70.0, unit="°F")
+    assert data_point.attributes is EMPTY_ATTRIBUTES
+    assert data_point.unit is CalculatedDataPoint("temp", 71.0, unit="°F").unit
+    assert data_point == CalculatedDataPoint("temp", 70.0, unit="°F", attributes={})
+    assert data_point != CalculatedDataPoint("temp", 70.0, unit="°C")
+    assert data_point != ("temp", 70.0, "°F")
+    assert repr(data_point) == (
+        "CalculatedDataPoint(data_point_key='temp', value=70.0, unit='°F', "
+        "attributes=mappingproxy({}), data_type=<DataPointType.NON_BOOLEAN: 2>)"
+    )
+    with pytest.raises(AttributeError):
+        data_point.extra = True
+
+
+@pytest.mark.parametrize("device_data_filename", ["payload_gw2000a_2.json"])
+def test_attributes_shared(device_data, ecowitt):
+    """Test that static attributes are shared by every payload's data points."""
+    first = ProcessedData(ecowitt, device_data).output
+    second = ProcessedData(ecowitt, {**device_data}).output
+    assert first["beaufortscale"].attributes
+    assert first["beaufortscale"].attributes is second["beaufortscale"].attributes
+    assert first["tempin"].attributes is EMPTY_ATTRIBUTES
+
+
+def test_processing_plan_reused(device_data, ecowitt):
+    """Test that payloads with the same keys share a processing plan."""
+    first = ProcessedData(ecowitt, device_data)
+    second = ProcessedData(ecowitt, {**device_data, "tempf": "1.0"})
+    assert len(PROCESSING_PLANS) == 1
+    assert first.output["temp"] != second.output["temp"]
+
+
+def test_derived_values_shared(device_data, ecowitt):
+    """Test that intermediate values are derived once and shared by data points."""
+    with patch(
+        "ecowitt2mqtt.helpers.calculator.kernel.dew_point",
+        wraps=kernel.dew_point,
+    ) as mock_dew_point:
+        processed_data = ProcessedData(ecowitt, device_data)
+
+    # The dew point, thermal perception, frost point, and frost risk all need it:
+    assert "dewpoint" in processed_data.output
+    assert "frostrisk" in processed_data.output
+    mock_dew_point.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "0",
+        "12",
+        "-12",
+        "12.5",
+        "-0.25",
+        ".5",
+        "5.",
+        "+5",
+        " 5 ",
+        "1e3",
+        "nan",
+        "1_000",
+        "²",
+        "--",
+        "GW2000A_V2.1.8",
+        7,
+        7.5,
+    ],
+)
+def test_get_numeric_value(value):
+    """Test that numeric values are parsed the same way as any other value."""
+    try:
+        expected = get_typed_value(value)
+    except ValueError:
+        with pytest.raises(ValueError):
+            get_numeric_value(value)
+        return
+
+    typed_value = get_numeric_value(value)
+    assert type(typed_value) is type(expected)
+    assert typed_value == expected or (typed_value != typed_value)
+
+
+@pytest.mark.parametrize(
+    "data,timestamp",
+    [
+        ({"dateutc": "2022-04-20 17:17:17"}, 1650475037.0),
+        ({"dateutc": "now"}, 1000.0),
+        ({"dateutc": None}, 1000.0),
+        ({}, 1000.0),
+    ],
+)
+def test_get_payload_timestamp(data, timestamp):
+    """Test getting when a payload was measured (falling back to the current time)."""
+    with patch("ecowitt2mqtt.data.time.time", return_value=1000.0):
+        assert get_payload_timestamp(data) == timestamp
+
+
+def test_get_value_parser():
+    """Test that keys with calculators get the numeric value parser."""
+    assert get_value_parser(calculate_temperature) is get_numeric_value
+    assert get_value_parser(calculate_raw_value) is get_typed_value
+
+
+@pytest.mark.parametrize(
+    "payload_key,resolution",
+    [
+        ("PASSKEY", KeyResolution(None, None, "PASSKEY", None)),
+        ("tempinf", KeyResolution("temp", calculate_temperature, "tempin", "f")),
+        ("temp1c", KeyResolution("temp", calculate_temperature, "temp1c", None)),
+        (
+            "winddir_avg10m",
+            KeyResolution("winddir", calculate_wind_dir, "winddir_avg10m", None),
+        ),
+    ],
+)
+def test_resolve_key(payload_key, resolution):
+    """Test resolving a payload key."""
+    assert resolve_key(payload_key) == resolution
+
+
+def test_resolve_key_cached(device_data, ecowitt):
+    """Test that each distinct payload key is only resolved once."""
+    _ = ProcessedData(ecowitt, device_data)
+    misses = resolve_key.cache_info().misses
+    assert misses > 0
+
+    _ = ProcessedData(ecowitt, device_data)
+    assert resolve_key.cache_info().misses == misses
+
+
 @pytest.mark.parametrize(
     "config",
     [
@@ -4961,8 +5194,11 @@ def test_process(device_data, ecowitt, expected_output, request):
 )
 def test_suspcious_temperature_value(caplog, device_data, ecowitt):
     """Test logging a warning when a suspicious temperature value is seen."""
-    with pytest.raises(ValueError):
-        _ = ProcessedData(ecowitt, device_data)
+    processed_data = ProcessedData(ecowitt, device_data)
+
+    # The resulting simmer index is beyond every simmer zone:
+    assert processed_data.output["simmerindex"].value == 283.1
+    assert processed_data.output["simmerzone"].value is None
 
     assert any(
         m
@@ -0,0 +1,64 @@
+"""Define tests for duplicate payload suppression."""
+from unittest.mock import patch
+
+from ecowitt2mqtt.helpers.dedupe import PayloadDeduplicator
+
+
+def test_different_payloads():
+    """Test that payloads with different values aren't duplicates."""
+    deduplicator = PayloadDeduplicator(10)
+    assert not deduplicator.is_duplicate("station1", {"tempf": "51.1"})
+    assert not deduplicator.is_duplicate("station1", {"tempf": "51.2"})
+    assert not deduplicator.is_duplicate("station2", {"tempf": "51.2"})
+    assert deduplicator.suppressed == 0
+
+
+def test_disabled():
+    """Test that a zero-length window disables suppression."""
+    deduplicator = PayloadDeduplicator(0)
+    assert not deduplicator.is_duplicate("station1", {"tempf": "51.1"})
+    assert not deduplicator.is_duplicate("station1", {"tempf": "51.1"})
+    assert deduplicator.suppressed == 0
+
+
+def test_duplicate_ignores_dateutc():
+    """Test that a retried payload with a new timestamp is a duplicate."""
+    deduplicator = PayloadDeduplicator(10)
+    assert not deduplicator.is_duplicate(
+        "station1", {"dateutc": "2022-05-01 12:00:00", "tempf": "51.1"}
+    )
+    assert deduplicator.is_duplicate(
+        "station1", {"dateutc": "2022-05-01 12:00:02", "tempf": "51.1"}
+    )
+    assert deduplicator.suppressed == 1
+
+
+def test_duplicate_with_dateutc():
+    """Test that payloads with different timestamps can be told apart."""
+    deduplicator = PayloadDeduplicator(10)
+    assert not deduplicator.is_duplicate(
+        "station1",
+        {"dateutc": "2022-05-01 12:00:00", "tempf": "51.1"},
+        ignore_timestamp=False,
+    )
+    assert not deduplicator.is_duplicate(
+        "station1",
+        {"dateutc": "2022-05-01 12:01:00", "tempf": "51.1"},
+        ignore_timestamp=False,
+    )
+    assert deduplicator.is_duplicate(
+        "station1",
+        {"dateutc": "2022-05-01 12:01:00", "tempf": "51.1"},
+        ignore_timestamp=False,
+    )
+    assert deduplicator.suppressed == 1
+
+
+def test_window_expiry():
+    """Test that an identical payload outside of the window isn't a duplicate."""
+    deduplicator = PayloadDeduplicator(10)
+    with patch("ecowitt2mqtt.helpers.dedupe.time.monotonic", side_effect=[0, 5, 11]):
+        assert not deduplicator.is_duplicate("station1", {"tempf": "51.1"})
+        assert deduplicator.is_duplicate("station1", {"tempf": "51.1"})
+        assert not deduplicator.is_duplicate("station1", {"tempf": "51.1"})
+    assert deduplicator.suppressed == 1
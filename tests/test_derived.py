@@ -0,0 +1,60 @@
+"""Define tests for derived values."""
+from unittest.mock import Mock
+
+import pytest
+
+from ecowitt2mqtt.helpers.calculator.derived import DerivedValueGraph, DerivedValueNode
+
+
+@pytest.fixture(name="funcs")
+def funcs_fixture():
+    """Define a fixture to return mock node functions."""
+    return {
+        "double": Mock(side_effect=lambda ecowitt, value: value * 2),
+        "sum": Mock(side_effect=lambda ecowitt, *values: sum(values)),
+    }
+
+
+@pytest.fixture(name="graph")
+def graph_fixture(funcs):
+    """Define a fixture to return a derived value graph."""
+    return DerivedValueGraph(
+        {
+            "a_doubled": DerivedValueNode(funcs["double"], ("a",)),
+            "total": DerivedValueNode(funcs["sum"], ("a_doubled", "a_doubled", "b")),
+            "unused": DerivedValueNode(funcs["sum"], ("c",)),
+        }
+    )
+
+
+def test_cycle():
+    """Test that a graph with a cycle is rejected."""
+    with pytest.raises(ValueError) as err:
+        DerivedValueGraph(
+            {
+                "x": DerivedValueNode(Mock(), ("y",)),
+                "y": DerivedValueNode(Mock(), ("a", "x")),
+            }
+        )
+    assert "Derived values form a cycle: x -> y" in str(err.value)
+
+
+def test_evaluate(funcs, graph):
+    """Test that nodes are evaluated lazily and only once."""
+    ecowitt = Mock()
+    values = graph.evaluate(ecowitt, {"a": 1, "b": 10})
+    funcs["double"].assert_not_called()
+
+    assert values["total"] == 14
+    assert values["total"] == 14
+    assert values["a_doubled"] == 2
+    assert values["b"] == 10
+    funcs["double"].assert_called_once_with(ecowitt, 1)
+    funcs["sum"].assert_called_once_with(ecowitt, 2, 2, 10)
+
+
+def test_get_inputs(graph):
+    """Test getting the payload keys that some values depend on."""
+    assert graph.get_inputs(["total"]) == {"a", "b"}
+    assert graph.get_inputs(["a_doubled", "c"]) == {"a", "c"}
+    assert graph.get_inputs([]) == frozenset()
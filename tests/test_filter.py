@@ -0,0 +1,38 @@
+"""Define tests for key filters."""
+import pytest
+
+from ecowitt2mqtt.helpers.filter import KeyFilter
+
+
+@pytest.mark.parametrize(
+    "key_filter,names,selected",
+    [
+        (KeyFilter(), ("tempf",), True),
+        (KeyFilter(include=("temp*",)), ("tempf",), True),
+        (KeyFilter(include=("temp*",)), ("humidity",), False),
+        (KeyFilter(include=("temp",)), ("tempf",), False),
+        (KeyFilter(include=("temp",)), ("tempf", "temp"), True),
+        (KeyFilter(exclude=("*batt",)), ("wh65batt",), False),
+        (KeyFilter(exclude=("*batt",)), ("tempf",), True),
+        (KeyFilter(include=("temp*",), exclude=("tempin*",)), ("tempinf",), False),
+        (KeyFilter(include=("temp?",)), ("Tempf",), False),
+        (KeyFilter(include=("soilmoisture[12]",)), ("soilmoisture2",), True),
+    ],
+)
+def test_matches(key_filter, names, selected):
+    """Test whether names are selected by a filter."""
+    assert key_filter.matches(*names) is selected
+
+
+def test_truthiness():
+    """Test that a filter is only truthy if it excludes something."""
+    assert not KeyFilter()
+    assert KeyFilter(include=("temp*",))
+    assert KeyFilter(exclude=("temp*",))
+
+
+def test_hashable():
+    """Test that filters with the same patterns are interchangeable."""
+    assert KeyFilter(include=("temp*",)) == KeyFilter(include=("temp*",))
+    assert hash(KeyFilter(include=("temp*",))) == hash(KeyFilter(include=("temp*",)))
+    assert KeyFilter(include=("temp*",)) != KeyFilter(exclude=("temp*",))
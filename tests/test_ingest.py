@@ -0,0 +1,249 @@
+"""Define tests for multi-process ingest."""
+import asyncio
+import json
+from multiprocessing import BoundedSemaphore, Pipe, SimpleQueue
+import os
+import socket
+from unittest.mock import AsyncMock, Mock, patch
+
+from aiohttp import ClientError, ClientSession
+import pytest
+
+from ecowitt2mqtt.const import (
+    CONF_INGEST_WORKERS,
+    CONF_QUEUE_OVERFLOW_POLICY,
+    UNIT_SYSTEM_IMPERIAL,
+)
+from ecowitt2mqtt.helpers.ingest import (
+    BATCH_ENDPOINT_SUFFIX,
+    IngestWorkerError,
+    IngestWorkerPool,
+    async_serve_ingest_worker,
+)
+from ecowitt2mqtt.helpers.queue import OverflowPolicy
+
+from tests.common import TEST_CONFIG_JSON, TEST_ENDPOINT, TEST_PORT
+
+
+async def async_post_when_ready(session, data):
+    """Post a payload, retrying while the ingest workers start up."""
+    for _ in range(100):
+        try:
+            return await session.request(
+                "post", f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}", data=data
+            )
+        except ClientError:
+            await asyncio.sleep(0.1)
+    raise AssertionError("Ingest workers never started")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [{**TEST_CONFIG_JSON, CONF_INGEST_WORKERS: 2}])
+async def test_ingest_workers(device_data, ecowitt, setup_asyncio_mqtt):
+    """Test that payloads received by ingest workers are published in order."""
+    published = []
+
+    async def async_publish(client, data):
+        """Record publishes."""
+        published.append(data["runtime"])
+
+    ecowitt._runtime._publisher.async_publish = async_publish
+    start_task = asyncio.create_task(ecowitt.async_start())
+    try:
+        async with ClientSession() as session:
+            resp = await async_post_when_ready(session, {**device_data, "runtime": "0"})
+            assert resp.status == 204
+            for runtime in range(1, 10):
+                resp = await session.request(
+                    "post",
+                    f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}",
+                    data={**device_data, "runtime": str(runtime)},
+                )
+                assert resp.status == 204
+
+            resp = await session.request(
+                "post",
+                f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}{BATCH_ENDPOINT_SUFFIX}",
+                data="\n".join(
+                    json.dumps({**device_data, "runtime": str(runtime)})
+                    for runtime in range(10, 20)
+                ),
+            )
+            assert await resp.json() == {"accepted": 10}
+    finally:
+        ecowitt._runtime.stop()
+        await start_task
+
+    # Every acknowledged payload is handed over (and flushed) before shutdown ends:
+    assert published == [str(runtime) for runtime in range(20)]
+
+    assert not any(
+        process.is_alive() for process in ecowitt._runtime._ingest_pool._processes
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_INGEST_WORKERS: 2,
+            CONF_QUEUE_OVERFLOW_POLICY: OverflowPolicy.REJECT,
+        }
+    ],
+)
+async def test_ingest_workers_reject(device_data, ecowitt, setup_asyncio_mqtt):
+    """Test that ingest workers pass along payloads that the parent rejects."""
+    ecowitt._runtime._enqueue_payload = Mock(side_effect=[False, True])
+    start_task = asyncio.create_task(ecowitt.async_start())
+    try:
+        async with ClientSession() as session:
+            resp = await async_post_when_ready(session, device_data)
+            assert resp.status == 503
+            resp = await session.request(
+                "post", f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+            )
+            assert resp.status == 204
+    finally:
+        ecowitt._runtime.stop()
+        await start_task
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [{**TEST_CONFIG_JSON, CONF_INGEST_WORKERS: 2}])
+async def test_ingest_workers_bind_failure(ecowitt, setup_asyncio_mqtt):
+    """Test that the runtime fails if its ingest workers can't bind their socket."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        # Earlier tests' connections may still be in TIME_WAIT on the port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("0.0.0.0", TEST_PORT))
+        sock.listen()
+        try:
+            with pytest.raises(IngestWorkerError) as err:
+                await asyncio.wait_for(ecowitt.async_start(), 30)
+        finally:
+            ecowitt._runtime._cancel_runtime_tasks()
+    assert "exited unexpectedly" in str(err.value)
+
+
+@pytest.mark.asyncio
+async def test_ingest_worker_decisions(caplog, device_data):
+    """Test that an ingest worker responds to payloads once the parent decides."""
+    payloads = SimpleQueue()
+    worker_decisions, parent_decisions = Pipe(duplex=False)
+    worker_task = asyncio.create_task(
+        async_serve_ingest_worker(
+            "0.0.0.0",
+            TEST_PORT,
+            TEST_ENDPOINT,
+            False,
+            False,
+            UNIT_SYSTEM_IMPERIAL,
+            payloads,
+            BoundedSemaphore(10),
+            os.getppid(),
+            3,
+            worker_decisions,
+        )
+    )
+    loop = asyncio.get_running_loop()
+
+    try:
+        async with ClientSession() as session:
+            with patch("ecowitt2mqtt.helpers.ingest.DEFAULT_DECISION_TIMEOUT", 0.1):
+                resp = await async_post_when_ready(session, device_data)
+            assert resp.status == 503
+            assert payloads.get() == (device_data, False, (3, 1))
+
+            # While one request waits for its decision, another one is handled:
+            requests = [
+                asyncio.create_task(
+                    session.request(
+                        "post",
+                        f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}",
+                        data={**device_data, "runtime": runtime},
+                    )
+                )
+                for runtime in ("2", "3")
+            ]
+            received = [
+                await loop.run_in_executor(None, payloads.get) for _ in range(2)
+            ]
+            assert sorted(
+                (payload["runtime"], reply_to) for payload, _, reply_to in received
+            ) == [("2", (3, 2)), ("3", (3, 3))]
+
+            # A decision that arrives too late (for an earlier payload) is skipped:
+            sequences = {payload["runtime"]: seq for payload, _, (_, seq) in received}
+            parent_decisions.send((1, True))
+            parent_decisions.send((sequences["3"], True))
+            parent_decisions.send((sequences["2"], False))
+            responses = await asyncio.gather(*requests)
+            assert [resp.status for resp in responses] == [503, 204]
+    finally:
+        with patch("ecowitt2mqtt.helpers.ingest.os.getppid", return_value=-1):
+            await asyncio.wait_for(worker_task, 5)
+
+    assert any(m for m in caplog.messages if "Timed out waiting" in m)
+
+
+@pytest.mark.asyncio
+async def test_ingest_workers_full(device_data):
+    """Test that ingest workers reject payloads once the parent falls behind."""
+    pool = IngestWorkerPool(
+        1,
+        host="0.0.0.0",
+        port=TEST_PORT,
+        endpoint=TEST_ENDPOINT,
+        fast_ingest=False,
+        verbose=False,
+        max_pending=1,
+    )
+    pool._processes[0].start()
+    try:
+        async with ClientSession() as session:
+            resp = await async_post_when_ready(session, device_data)
+            assert resp.status == 204
+            resp = await session.request(
+                "post", f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+            )
+            assert resp.status == 503
+    finally:
+        await pool.async_stop()
+
+    # Workers that ignore SIGTERM are killed:
+    with patch("ecowitt2mqtt.helpers.ingest.DEFAULT_WORKER_STOP_TIMEOUT", 0), patch(
+        "multiprocessing.process.BaseProcess.is_alive", return_value=True
+    ), patch("multiprocessing.process.BaseProcess.kill") as mock_kill:
+        await pool.async_stop()
+    mock_kill.assert_called_once()
+
+    on_payload = Mock()
+    loop = asyncio.new_event_loop()
+    loop.close()
+    # Once the parent's loop has closed, the reader stops handing payloads over:
+    pool._read_payloads(loop, on_payload, AsyncMock())
+    on_payload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ingest_worker_orphaned(caplog):
+    """Test that an ingest worker stops once its parent process is gone."""
+    await asyncio.wait_for(
+        async_serve_ingest_worker(
+            "0.0.0.0",
+            TEST_PORT,
+            TEST_ENDPOINT,
+            True,
+            False,
+            UNIT_SYSTEM_IMPERIAL,
+            SimpleQueue(),
+            BoundedSemaphore(1),
+            -1,
+            0,
+            None,
+        ),
+        5,
+    )
+    assert any(m for m in caplog.messages if "Parent process has exited" in m)
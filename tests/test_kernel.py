@@ -0,0 +1,106 @@
+"""Define tests for the meteorological formula kernel."""
+import meteocalc
+import pytest
+
+from ecowitt2mqtt.helpers.calculator import kernel
+
+# Temperatures from -50.0 to 149.9 (in steps of 0.1):
+TEST_TEMPERATURES = [value / 10 for value in range(-500, 1500)]
+
+# Relative humidities from 1 to 100 (in steps of 3):
+TEST_HUMIDITIES = list(range(1, 101, 3))
+
+# Wind speeds from 0.0 to 60.0 (in steps of 2.5):
+TEST_WIND_SPEEDS = [value / 2 for value in range(0, 121, 5)]
+
+
+def test_absolute_humidity():
+    """Test absolute humidity."""
+    assert round(kernel.absolute_humidity(20.0, 50), 2) == 8.64
+
+
+def test_conversions():
+    """Test that temperature conversions match meteocalc."""
+    for value in TEST_TEMPERATURES:
+        assert kernel.celsius_to_fahrenheit(value) == meteocalc.Temp(value, "c").f
+        assert kernel.fahrenheit_to_celsius(value) == meteocalc.Temp(value, "f").c
+
+
+def test_dew_point():
+    """Test that dew points match meteocalc."""
+    mismatches = [
+        (temperature, humidity)
+        for temperature in TEST_TEMPERATURES
+        for humidity in TEST_HUMIDITIES
+        if kernel.dew_point(temperature, humidity)
+        != meteocalc.dew_point(meteocalc.Temp(temperature, "c"), humidity).c
+    ]
+    assert not mismatches
+
+
+@pytest.mark.parametrize("humidity", [0, 101])
+def test_dew_point_invalid_humidity(humidity):
+    """Test that a dew point can't be calculated for an invalid humidity."""
+    with pytest.raises(ValueError):
+        kernel.dew_point(20.0, humidity)
+
+
+def test_feels_like():
+    """Test that "feels like" temperatures match meteocalc."""
+    mismatches = [
+        (temperature, humidity, wind_speed)
+        for temperature in TEST_TEMPERATURES
+        for humidity in TEST_HUMIDITIES
+        for wind_speed in TEST_WIND_SPEEDS[::4]
+        if kernel.feels_like(temperature, humidity, wind_speed)
+        != meteocalc.feels_like(
+            meteocalc.Temp(temperature, "f"), humidity, wind_speed
+        ).f
+    ]
+    assert not mismatches
+
+
+def test_frost_point():
+    """Test frost point."""
+    dew_point = kernel.dew_point(-5.0, 80)
+    frost_point = kernel.frost_point(-5.0, dew_point)
+    assert dew_point < frost_point < -5.0
+    assert round(frost_point, 1) == -7.3
+
+
+def test_heat_index():
+    """Test that heat indices match meteocalc."""
+    mismatches = [
+        (temperature, humidity)
+        for temperature in TEST_TEMPERATURES
+        for humidity in TEST_HUMIDITIES
+        if kernel.heat_index(temperature, humidity)
+        != meteocalc.heat_index(meteocalc.Temp(temperature, "f"), humidity).f
+    ]
+    assert not mismatches
+
+
+def test_simmer_index():
+    """Test simmer index."""
+    assert round(kernel.simmer_index(90.0, 50), 1) == 103.9
+
+
+def test_wind_chill():
+    """Test that wind chills match meteocalc."""
+    mismatches = [
+        (temperature, wind_speed)
+        for temperature in TEST_TEMPERATURES
+        for wind_speed in TEST_WIND_SPEEDS
+        if temperature <= 50
+        and wind_speed > 3
+        and kernel.wind_chill(temperature, wind_speed)
+        != meteocalc.wind_chill(meteocalc.Temp(temperature, "f"), wind_speed).f
+    ]
+    assert not mismatches
+
+
+@pytest.mark.parametrize("temperature,wind_speed", [(50.1, 10.0), (30.0, 3.0)])
+def test_wind_chill_undefined(temperature, wind_speed):
+    """Test that wind chill is undefined outside of cold, windy conditions."""
+    with pytest.raises(ValueError):
+        kernel.wind_chill(temperature, wind_speed)
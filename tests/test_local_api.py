@@ -0,0 +1,315 @@
+"""Define tests for the gateway local API poller."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import struct
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import pytest_asyncio
+
+from ecowitt2mqtt.const import (
+    CONF_LOCAL_API_GATEWAY,
+    CONF_LOCAL_API_POLL_INTERVAL,
+    UNIT_SYSTEM_IMPERIAL,
+    UNIT_SYSTEM_METRIC,
+)
+from ecowitt2mqtt.helpers.local_api import (
+    CMD_LIVEDATA,
+    CMD_READ_FIRMWARE_VERSION,
+    CMD_READ_STATION_MAC,
+    LocalApiError,
+    LocalApiGateway,
+    LocalApiPoller,
+    async_read_frame,
+    build_frame,
+    decode_live_data,
+)
+
+from tests.common import TEST_CONFIG_JSON
+
+TEST_FIRMWARE = b"GW1000B_V1.7.3"
+TEST_LOCAL_API_PORT = 45999
+TEST_MAC = bytes.fromhex("aabbccddeeff")
+
+TEST_LIVE_DATA = b"".join(
+    (
+        struct.pack(">Bh", 0x01, 215),  # Indoor temperature: 21.5 °C
+        struct.pack(">BB", 0x06, 45),  # Indoor humidity: 45%
+        struct.pack(">BH", 0x08, 10132),  # Absolute pressure: 1013.2 hPa
+        struct.pack(">Bh", 0x03, 120),  # Dew point (skipped)
+        struct.pack(">BH", 0x0A, 180),  # Wind direction: 180°
+        struct.pack(">BH", 0x0B, 25),  # Wind speed: 2.5 m/s
+        struct.pack(">BH", 0x10, 127),  # Daily rain: 12.7 mm
+        struct.pack(">BI", 0x15, 126700),  # Solar radiation: 12670 lux
+        struct.pack(">BH", 0x2A, 123),  # PM2.5 (channel 1): 12.3 µg/m³
+        struct.pack(">BB", 0x60, 12),  # Lightning distance: 12 km
+        struct.pack(">BI", 0x61, 1650475037),  # Lightning time
+        struct.pack(">BhB", 0x63, -50, 1),  # WN34 (channel 1): -5.0 °C
+        struct.pack(">BhBHHHHHHB", 0x70, 230, 48, 45, 51, 32, 40, 612, 580, 6),
+        struct.pack(">BI", 0x6C, 123456),  # Free heap (skipped)
+        struct.pack(">BH", 0x80, 12),  # Piezo rain rate: 1.2 mm/hr
+        struct.pack(">BI", 0x83, 254),  # Piezo daily rain: 25.4 mm
+        bytes([0x87]) + bytes(20),  # Piezo rain gains (skipped)
+        bytes([0xFE, 0x01, 0x02]),  # Unknown item (decoding stops here)
+    )
+)
+
+
+class FakeGateway:
+    """Define a fake gateway that answers local API commands."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.connections = 0
+        self.hang = False
+        self.responses = {
+            CMD_READ_STATION_MAC: build_frame(CMD_READ_STATION_MAC, TEST_MAC),
+            CMD_READ_FIRMWARE_VERSION: build_frame(
+                CMD_READ_FIRMWARE_VERSION, bytes([len(TEST_FIRMWARE)]) + TEST_FIRMWARE
+            ),
+            CMD_LIVEDATA: build_frame(CMD_LIVEDATA, TEST_LIVE_DATA, size_length=2),
+        }
+
+    async def async_handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer commands until the client disconnects."""
+        self.connections += 1
+        try:
+            while request := await reader.read(5):
+                if not self.hang:
+                    writer.write(self.responses[request[2]])
+                    await writer.drain()
+        finally:
+            writer.close()
+
+
+@pytest_asyncio.fixture(name="fake_gateway")
+async def fake_gateway_fixture():
+    """Define a fixture to serve a fake gateway."""
+    gateway = FakeGateway()
+    server = await asyncio.start_server(
+        gateway.async_handle, "127.0.0.1", TEST_LOCAL_API_PORT
+    )
+    try:
+        yield gateway
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def test_build_frame():
+    """Test building a command frame."""
+    assert build_frame(CMD_LIVEDATA) == b"\xff\xff\x27\x03\x2a"
+
+
+@pytest.mark.parametrize(
+    "frame,error",
+    [
+        (b"\xff\xfe\x26\x03\x29", "Unexpected response header"),
+        (b"\xff\xff\x50\x03\x53", "Unexpected response header"),
+        (b"\xff\xff\x26\x02\x28", "Invalid response size: 2"),
+        (b"\xff\xff\x26\x04\x01\x00", "Response failed checksum validation"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_read_frame_errors(error, frame):
+    """Test reading invalid response frames."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(frame)
+    reader.feed_eof()
+    with pytest.raises(LocalApiError) as err:
+        await async_read_frame(reader, CMD_READ_STATION_MAC)
+    assert error in str(err.value)
+
+
+def test_decode_live_data_imperial():
+    """Test decoding live data into imperial units."""
+    assert decode_live_data(TEST_LIVE_DATA, UNIT_SYSTEM_IMPERIAL) == {
+        "tempinf": "70.7",
+        "humidityin": "45",
+        "baromabsin": "29.920",
+        "winddir": "180",
+        "windspeedmph": "5.59",
+        "dailyrainin": "0.500",
+        "solarradiation": "100.00",
+        "pm25_ch1": "12.3",
+        "lightning": "12",
+        "lightning_time": "1650475037",
+        "tf_ch1": "23.0",
+        "tf_co2": "73.4",
+        "humi_co2": "48",
+        "pm10_co2": "4.5",
+        "pm10_24h_co2": "5.1",
+        "pm25_co2": "3.2",
+        "pm25_24h_co2": "4",
+        "co2": "612",
+        "co2_24h": "580",
+        "co2_batt": "6",
+        "rrain_piezo": "0.047",
+        "drain_piezo": "1.000",
+    }
+
+
+def test_decode_live_data_metric():
+    """Test decoding live data into metric units."""
+    payload = decode_live_data(TEST_LIVE_DATA, UNIT_SYSTEM_METRIC)
+    assert payload["tempinf"] == "21.5"
+    assert payload["baromabsin"] == "1013.2"
+    assert payload["windspeedmph"] == "9.00"
+    assert payload["dailyrainin"] == "12.7"
+    assert payload["tf_ch1"] == "-5.0"
+    assert payload["tf_co2"] == "23.0"
+    assert payload["drain_piezo"] == "25.4"
+
+
+def test_decode_live_data_unknown_item(caplog):
+    """Test that decoding stops (with a warning) at an unknown item."""
+    payload = decode_live_data(
+        struct.pack(">BB", 0x06, 45) + bytes([0xFE, 0x01, 0x02]), UNIT_SYSTEM_METRIC
+    )
+    assert payload == {"humidityin": "45"}
+    assert "Stopping at unknown live data item: 0xfe" in caplog.messages
+
+
+@pytest.mark.parametrize("data", [b"\x01\x00", b"\x70" + bytes(15)])
+def test_decode_live_data_truncated(data):
+    """Test decoding live data with a truncated item."""
+    with pytest.raises(LocalApiError) as err:
+        decode_live_data(data, UNIT_SYSTEM_IMPERIAL)
+    assert "is truncated" in str(err.value)
+
+
+@pytest.mark.asyncio
+async def test_gateway_payload(fake_gateway):
+    """Test polling a gateway for a push-style payload."""
+    gateway = LocalApiGateway("127.0.0.1", TEST_LOCAL_API_PORT, timeout=1)
+    try:
+        payload = await gateway.async_get_payload(UNIT_SYSTEM_IMPERIAL)
+        assert payload["PASSKEY"] == (
+            hashlib.md5(b"AA:BB:CC:DD:EE:FF").hexdigest().upper()
+        )
+        assert payload["model"] == "GW1000B"
+        assert payload["stationtype"] == "GW1000B_V1.7.3"
+        assert payload["tempinf"] == "70.7"
+
+        # The connection (and the station's identity) are reused:
+        await gateway.async_get_payload(UNIT_SYSTEM_IMPERIAL)
+        assert fake_gateway.connections == 1
+    finally:
+        await gateway.async_close()
+
+
+@pytest.mark.asyncio
+async def test_gateway_reconnect(fake_gateway):
+    """Test that a gateway reconnects after a failed request."""
+    gateway = LocalApiGateway("127.0.0.1", TEST_LOCAL_API_PORT, timeout=0.1)
+    try:
+        fake_gateway.hang = True
+        with pytest.raises(LocalApiError) as err:
+            await gateway.async_get_payload(UNIT_SYSTEM_IMPERIAL)
+        assert "TimeoutError" in str(err.value)
+
+        fake_gateway.hang = False
+        fake_gateway.responses[CMD_LIVEDATA] = build_frame(
+            CMD_LIVEDATA, b"", size_length=2
+        )[:-1] + bytes([0])
+        with pytest.raises(LocalApiError) as err:
+            await gateway.async_get_payload(UNIT_SYSTEM_IMPERIAL)
+        assert "checksum" in str(err.value)
+
+        fake_gateway.responses[CMD_LIVEDATA] = build_frame(
+            CMD_LIVEDATA, TEST_LIVE_DATA, size_length=2
+        )
+        payload = await gateway.async_get_payload(UNIT_SYSTEM_IMPERIAL)
+        assert payload["tempinf"] == "70.7"
+        assert fake_gateway.connections == 3
+    finally:
+        await gateway.async_close()
+
+
+@pytest.mark.asyncio
+async def test_gateway_unreachable():
+    """Test polling a gateway that isn't listening."""
+    gateway = LocalApiGateway("127.0.0.1", TEST_LOCAL_API_PORT, timeout=1)
+    with pytest.raises(LocalApiError) as err:
+        await gateway.async_get_payload(UNIT_SYSTEM_IMPERIAL)
+    assert "Error talking to 127.0.0.1:45999" in str(err.value)
+
+
+@pytest.mark.asyncio
+async def test_gateway_close_error():
+    """Test that an error while closing a connection is ignored."""
+    gateway = LocalApiGateway("127.0.0.1")
+    writer = Mock(wait_closed=AsyncMock(side_effect=OSError))
+    gateway._writer = writer
+    await gateway.async_close()
+    writer.close.assert_called_once()
+    assert gateway._writer is None
+
+
+@pytest.mark.asyncio
+async def test_poller_outage(caplog):
+    """Test that a gateway outage is only warned about once."""
+    caplog.set_level(logging.DEBUG)
+    results = [LocalApiError("Boom"), LocalApiError("Boom"), {"PASSKEY": "abc"}]
+
+    async def async_get_payload(unit_system):
+        """Return the next result (repeating the last one)."""
+        result = results.pop(0) if len(results) > 1 else results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    gateway = Mock(async_close=AsyncMock(), async_get_payload=async_get_payload)
+    gateway.name = "127.0.0.1:45000"
+    on_payload = Mock()
+    poller = LocalApiPoller([gateway], 0.01, UNIT_SYSTEM_IMPERIAL, on_payload)
+
+    task = asyncio.create_task(poller.async_run())
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert [r.getMessage() for r in warnings] == ["Unable to poll gateway: Boom"]
+    assert "Gateway 127.0.0.1:45000 is reachable again" in caplog.messages
+    on_payload.assert_called_with({"PASSKEY": "abc"})
+    gateway.async_close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_LOCAL_API_GATEWAY: (f"127.0.0.1:{TEST_LOCAL_API_PORT}",),
+            CONF_LOCAL_API_POLL_INTERVAL: 0.05,
+        }
+    ],
+)
+async def test_runtime_polling(
+    ecowitt, fake_gateway, setup_asyncio_mqtt, setup_uvicorn_server
+):
+    """Test that polled payloads are published."""
+    published = []
+
+    async def async_publish(client, data):
+        """Record publishes."""
+        published.append(data)
+
+    with patch.object(ecowitt._runtime._publisher, "async_publish", async_publish):
+        await asyncio.sleep(0.2)
+        ecowitt._runtime.stop()
+        await ecowitt._runtime._stop_task
+
+    assert ecowitt._runtime._local_api_poller_task.cancelled()
+
+    assert published
+    assert published[0]["model"] == "GW1000B"
+    assert published[0]["tempinf"] == "70.7"
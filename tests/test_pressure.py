@@ -0,0 +1,185 @@
+"""Define tests for pressure tendency and forecasts."""
+import pytest
+
+from ecowitt2mqtt.const import (
+    CONF_INCLUDE_KEY,
+    CONF_INPUT_UNIT_SYSTEM,
+    CONF_OUTPUT_UNIT_SYSTEM,
+    DATA_POINT_PRESSURE_TENDENCY,
+    DATA_POINT_PRESSURE_TREND,
+    DATA_POINT_ZAMBRETTI_FORECAST,
+    PRESSURE_HPA,
+    PRESSURE_INHG,
+    UNIT_SYSTEM_IMPERIAL,
+    UNIT_SYSTEM_METRIC,
+)
+from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint
+from ecowitt2mqtt.helpers.calculator.pressure import (
+    PRESSURE_TREND_LOOKUP,
+    SLOT_DURATION,
+    SLOT_TOLERANCE,
+    TENDENCY_PERIOD,
+    ZAMBRETTI_FORMULAS,
+    PressureHistory,
+    PressureTendencyCalculator,
+    PressureTrend,
+)
+
+from tests.common import TEST_CONFIG_JSON
+
+TEST_STATION = "station"
+
+
+def test_pressure_history():
+    """Test finding the pressure from 3 hours earlier."""
+    history = PressureHistory()
+    assert history.add(1010.0, 0) is None
+    assert history.add(1011.0, 60) is None
+    assert history.add(1012.0, SLOT_DURATION) is None
+
+    # The last pressure of the slot from 3 hours earlier is used:
+    assert history.add(1013.0, TENDENCY_PERIOD) == 1011.0
+    assert history.add(1014.0, TENDENCY_PERIOD + SLOT_DURATION) == 1012.0
+
+    # Failing that, the nearest slot (within the tolerance) is used:
+    gap = (SLOT_TOLERANCE + 1) * SLOT_DURATION
+    assert history.add(1015.0, TENDENCY_PERIOD + gap) == 1012.0
+    assert history.add(1016.0, TENDENCY_PERIOD + gap + SLOT_DURATION) is None
+
+    # A late payload doesn't overwrite a newer slot in the same place in the ring:
+    assert history.add(1000.0, 0) is None
+    assert history.add(1017.0, 2 * TENDENCY_PERIOD + gap) == 1015.0
+
+    # Once the ring wraps around, stale slots are ignored:
+    assert history.add(1018.0, 5 * TENDENCY_PERIOD) is None
+
+
+@pytest.mark.parametrize(
+    "tendency_hpa,trend",
+    [
+        (-8.0, PressureTrend.FALLING_VERY_RAPIDLY),
+        (-6.0, PressureTrend.FALLING_QUICKLY),
+        (-1.6, PressureTrend.FALLING),
+        (-0.1, PressureTrend.FALLING_SLOWLY),
+        (0.0, PressureTrend.STEADY),
+        (1.5, PressureTrend.RISING_SLOWLY),
+        (3.5, PressureTrend.RISING),
+        (3.6, PressureTrend.RISING_QUICKLY),
+        (6.1, PressureTrend.RISING_VERY_RAPIDLY),
+    ],
+)
+def test_pressure_trend(tendency_hpa, trend):
+    """Test classifying pressure tendencies."""
+    assert PRESSURE_TREND_LOOKUP.get(tendency_hpa) == trend
+
+
+@pytest.mark.parametrize(
+    "trend,pressure_hpa,forecast",
+    [
+        (PressureTrend.FALLING, 1050.0, "Settled fine"),
+        (PressureTrend.FALLING, 1009.1, "Unsettled, rain later"),
+        (PressureTrend.FALLING, 950.0, "Stormy, much rain"),
+        (PressureTrend.RISING_SLOWLY, 1030.0, "Settled fine"),
+        (PressureTrend.STEADY, 1000.0, "Showery, bright intervals"),
+        (PressureTrend.RISING, 1020.0, "Becoming fine"),
+        (PressureTrend.RISING_QUICKLY, 960.0, "Stormy, may improve"),
+    ],
+)
+def test_zambretti_forecast(trend, pressure_hpa, forecast):
+    """Test Zambretti forecasts."""
+    assert ZAMBRETTI_FORMULAS[trend].get_forecast(pressure_hpa) == forecast
+
+
+@pytest.mark.parametrize(
+    "config,pressures,tendency,unit",
+    [
+        (
+            {
+                **TEST_CONFIG_JSON,
+                CONF_INPUT_UNIT_SYSTEM: UNIT_SYSTEM_IMPERIAL,
+                CONF_OUTPUT_UNIT_SYSTEM: UNIT_SYSTEM_IMPERIAL,
+            },
+            ("29.92", "29.80"),
+            -0.121,
+            PRESSURE_INHG,
+        ),
+        (
+            {
+                **TEST_CONFIG_JSON,
+                CONF_INPUT_UNIT_SYSTEM: UNIT_SYSTEM_IMPERIAL,
+                CONF_OUTPUT_UNIT_SYSTEM: UNIT_SYSTEM_METRIC,
+            },
+            ("29.92", "29.80"),
+            -4.1,
+            PRESSURE_HPA,
+        ),
+        (
+            {
+                **TEST_CONFIG_JSON,
+                CONF_INPUT_UNIT_SYSTEM: UNIT_SYSTEM_METRIC,
+                CONF_OUTPUT_UNIT_SYSTEM: UNIT_SYSTEM_METRIC,
+            },
+            ("1013.2", "1009.1"),
+            -4.1,
+            PRESSURE_HPA,
+        ),
+    ],
+)
+def test_pressure_tendency_calculator(ecowitt, pressures, tendency, unit):
+    """Test calculating pressure tendency and forecasts from a station's history."""
+    calculator = PressureTendencyCalculator(ecowitt)
+
+    assert calculator.calculate(TEST_STATION, {"baromrelin": pressures[0]}, 0) == {
+        DATA_POINT_PRESSURE_TENDENCY: CalculatedDataPoint(
+            DATA_POINT_PRESSURE_TENDENCY, None, unit=unit
+        ),
+        DATA_POINT_PRESSURE_TREND: CalculatedDataPoint(DATA_POINT_PRESSURE_TREND, None),
+        DATA_POINT_ZAMBRETTI_FORECAST: CalculatedDataPoint(
+            DATA_POINT_ZAMBRETTI_FORECAST, None
+        ),
+    }
+    assert calculator.calculate(
+        TEST_STATION, {"baromrelin": pressures[1]}, TENDENCY_PERIOD
+    ) == {
+        DATA_POINT_PRESSURE_TENDENCY: CalculatedDataPoint(
+            DATA_POINT_PRESSURE_TENDENCY, tendency, unit=unit
+        ),
+        DATA_POINT_PRESSURE_TREND: CalculatedDataPoint(
+            DATA_POINT_PRESSURE_TREND, PressureTrend.FALLING_QUICKLY
+        ),
+        DATA_POINT_ZAMBRETTI_FORECAST: CalculatedDataPoint(
+            DATA_POINT_ZAMBRETTI_FORECAST, "Unsettled, rain later"
+        ),
+    }
+
+    # Stations are tracked separately:
+    assert (
+        calculator.calculate(
+            "other_station", {"baromrelin": pressures[1]}, TENDENCY_PERIOD
+        )[DATA_POINT_PRESSURE_TREND].value
+        is None
+    )
+
+
+@pytest.mark.parametrize(
+    "config,data,data_points",
+    [
+        (TEST_CONFIG_JSON, {"tempinf": "70.0"}, []),
+        (TEST_CONFIG_JSON, {"baromrelin": ""}, []),
+        (TEST_CONFIG_JSON, {"baromrelin": "nan"}, []),
+        (
+            {**TEST_CONFIG_JSON, CONF_INCLUDE_KEY: ["temp*"]},
+            {"baromrelin": "29.92"},
+            [],
+        ),
+        (
+            {**TEST_CONFIG_JSON, CONF_INCLUDE_KEY: ["*trend"]},
+            {"baromrelin": "29.92"},
+            [DATA_POINT_PRESSURE_TREND],
+        ),
+    ],
+)
+def test_pressure_tendency_calculator_skipped(ecowitt, data, data_points):
+    """Test that pressure tendencies are only calculated when possible and wanted."""
+    calculator = PressureTendencyCalculator(ecowitt)
+    assert list(calculator.calculate(TEST_STATION, data, 0)) == data_points
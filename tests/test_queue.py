@@ -0,0 +1,224 @@
+"""Define tests for the per-station payload queue."""
+import asyncio
+
+import pytest
+
+from ecowitt2mqtt.helpers.queue import OverflowPolicy, PayloadQueue, QueueFullError
+
+
+async def async_get(queue):
+    """Claim, and immediately release, a single payload from a queue."""
+    station, [payload] = await queue.async_claim()
+    queue.release(station)
+    return station, payload
+
+
+@pytest.mark.asyncio
+async def test_async_put():
+    """Test waiting for room in a full station queue."""
+    queue = PayloadQueue(1, OverflowPolicy.REJECT)
+    queue.put("station1", {"runtime": "0"})
+    put_task = asyncio.create_task(queue.async_put("station1", {"runtime": "1"}))
+
+    await asyncio.sleep(0.05)
+    assert not put_task.done()
+
+    assert await async_get(queue) == ("station1", {"runtime": "0"})
+    await put_task
+    assert await async_get(queue) == ("station1", {"runtime": "1"})
+    assert queue.stats.overflows == 0
+
+
+@pytest.mark.asyncio
+async def test_claim_limit():
+    """Test claiming several of a station's payloads at once."""
+    queue = PayloadQueue(10, OverflowPolicy.DROP_OLDEST)
+    for idx in range(3):
+        queue.put("station1", {"runtime": str(idx)})
+
+    station, payloads = await queue.async_claim(2)
+    assert station == "station1"
+    assert payloads == [{"runtime": "0"}, {"runtime": "1"}]
+    queue.release(station)
+
+    station, payloads = await queue.async_claim(2)
+    assert payloads == [{"runtime": "2"}]
+    queue.release(station)
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_claimed_station_is_exclusive():
+    """Test that a claimed station isn't handed to another consumer."""
+    queue = PayloadQueue(10, OverflowPolicy.DROP_OLDEST)
+    queue.put("station1", {"runtime": "0"})
+    station, _ = await queue.async_claim()
+
+    # New payloads for the claimed station must wait until it's released:
+    queue.put("station1", {"runtime": "1"})
+    queue.put("station2", {"runtime": "0"})
+    assert await async_get(queue) == ("station2", {"runtime": "0"})
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(queue.async_claim(), 0.05)
+
+    queue.release(station)
+    assert await async_get(queue) == ("station1", {"runtime": "1"})
+
+
+@pytest.mark.asyncio
+async def test_coalesce():
+    """Test that a full queue merges new payloads into the newest one."""
+    queue = PayloadQueue(1, OverflowPolicy.COALESCE)
+    queue.put("station1", {"tempf": "70.0", "humidity": "50"})
+    queue.put("station1", {"tempf": "71.0"})
+    assert len(queue) == 1
+    assert await async_get(queue) == (
+        "station1",
+        {"tempf": "71.0", "humidity": "50"},
+    )
+    assert queue.stats.as_dict() == {
+        "enqueued": 1,
+        "coalesced": 1,
+        "dropped": 0,
+        "merged": 0,
+        "rejected": 0,
+        "flushed": 0,
+        "abandoned": 0,
+        "overflows": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_coalesce_window():
+    """Test that payloads arriving within the coalescing window are merged."""
+    queue = PayloadQueue(10, OverflowPolicy.DROP_OLDEST, coalesce_window=0.1)
+    queue.put("station1", {"tempf": "70.0", "humidity": "50"})
+    queue.put("station1", {"tempf": "71.0"})
+    queue.put("station2", {"tempf": "60.0"})
+    assert len(queue) == 2
+    assert queue.stats.merged == 1
+
+    # Nothing is ready until the windows close:
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(queue.async_claim(), 0.05)
+
+    assert await async_get(queue) == (
+        "station1",
+        {"tempf": "71.0", "humidity": "50"},
+    )
+    assert await async_get(queue) == ("station2", {"tempf": "60.0"})
+
+    # A payload after the window has closed starts a new one:
+    queue.put("station1", {"tempf": "72.0"})
+    assert queue.stats.enqueued == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesce_window_claim_limit():
+    """Test that a claim never includes a payload whose window is still open."""
+    queue = PayloadQueue(10, OverflowPolicy.DROP_OLDEST, coalesce_window=0.05)
+    queue.put("station1", {"runtime": "0"})
+    station, payloads = await queue.async_claim(5)
+    assert payloads == [{"runtime": "0"}]
+
+    # While the station is claimed, new payloads still collect in an open window:
+    queue.put("station1", {"runtime": "1"})
+    queue.put("station1", {"runtime": "2"})
+    queue.release(station)
+    assert await async_get(queue) == ("station1", {"runtime": "2"})
+    assert queue.stats.merged == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_window_skipped():
+    """Test that payloads put without coalescing are never merged."""
+    queue = PayloadQueue(10, OverflowPolicy.DROP_OLDEST, coalesce_window=10)
+    queue.put("station1", {"runtime": "0"})
+    await queue.async_put("station1", {"runtime": "1"}, coalesce=False)
+    await queue.async_put("station1", {"runtime": "2"}, coalesce=False)
+    assert queue.stats.merged == 0
+
+    # Putting a payload without coalescing closes the station's open window:
+    station, payloads = await asyncio.wait_for(queue.async_claim(5), 0.05)
+    assert payloads == [{"runtime": "0"}, {"runtime": "1"}, {"runtime": "2"}]
+
+
+@pytest.mark.asyncio
+async def test_drain():
+    """Test waiting for pending payloads to be handled."""
+    queue = PayloadQueue(10, OverflowPolicy.DROP_OLDEST)
+    await queue.async_drain(0)
+    assert queue.stats.flushed == 0
+
+    for runtime in range(3):
+        queue.put("station1", {"runtime": runtime})
+    queue.put("station2", {"runtime": 0})
+
+    async def async_consume():
+        """Handle payloads (other than one that is never released)."""
+        while True:
+            station, payloads = await queue.async_claim()
+            if payloads == [{"runtime": 2}]:
+                continue
+            queue.release(station)
+
+    consumer = asyncio.create_task(async_consume())
+    await queue.async_drain(0.1)
+    consumer.cancel()
+
+    assert queue.pending == 1
+    assert queue.stats.flushed == 3
+    assert queue.stats.abandoned == 1
+
+    # Releasing the last payload empties the queue:
+    queue.release("station1")
+    await queue.async_drain(0.1)
+    assert queue.stats.flushed == 0
+    assert queue.stats.abandoned == 0
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    """Test that a full queue drops the oldest payload."""
+    queue = PayloadQueue(2, OverflowPolicy.DROP_OLDEST)
+    for idx in range(3):
+        queue.put("station1", {"runtime": str(idx)})
+    assert await async_get(queue) == ("station1", {"runtime": "1"})
+    assert await async_get(queue) == ("station1", {"runtime": "2"})
+    assert queue.stats.dropped == 1
+    assert queue.stats.overflows == 1
+
+
+@pytest.mark.asyncio
+async def test_reject():
+    """Test that a full queue rejects new payloads."""
+    queue = PayloadQueue(1, OverflowPolicy.REJECT)
+    queue.put("station1", {"runtime": "0"})
+    with pytest.raises(QueueFullError):
+        queue.put("station1", {"runtime": "1"})
+
+    # Other stations shouldn't be affected:
+    queue.put("station2", {"runtime": "0"})
+    assert len(queue) == 2
+    assert queue.stats.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_round_robin():
+    """Test that stations are served fairly and in per-station order."""
+    queue = PayloadQueue(10, OverflowPolicy.DROP_OLDEST)
+    for idx in range(3):
+        queue.put("station1", {"runtime": str(idx)})
+    queue.put("station2", {"runtime": "0"})
+
+    results = [await async_get(queue) for _ in range(4)]
+    assert results == [
+        ("station1", {"runtime": "0"}),
+        ("station2", {"runtime": "0"}),
+        ("station1", {"runtime": "1"}),
+        ("station1", {"runtime": "2"}),
+    ]
+
+    # The queue is now empty, so the next get should wait:
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(queue.async_claim(), 0.05)
@@ -2,21 +2,95 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
 import signal
 import subprocess
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
-from aiohttp import ClientSession
+from aiohttp import ClientError, ClientSession
 from asyncio_mqtt import MqttError
 import pytest
 
-from ecowitt2mqtt.const import CONF_DIAGNOSTICS
+from ecowitt2mqtt.const import (
+    CONF_COALESCE_WINDOW,
+    CONF_DEDUPE_WINDOW,
+    CONF_DIAGNOSTICS,
+    CONF_INPUT_UNIT_SYSTEM,
+    CONF_QUEUE_OVERFLOW_POLICY,
+    CONF_QUEUE_SIZE,
+    CONF_SHUTDOWN_TIMEOUT,
+    UNIT_SYSTEM_METRIC,
+)
+from ecowitt2mqtt.helpers.ingest import BATCH_ENDPOINT_SUFFIX
+from ecowitt2mqtt.helpers.queue import OverflowPolicy
+from ecowitt2mqtt.helpers.wunderground import WUNDERGROUND_ENDPOINT
 
 from tests.common import TEST_CONFIG_JSON, TEST_ENDPOINT, TEST_PORT
 
 
+async def async_slow_publish(*args, **kwargs):
+    """Simulate an MQTT broker that takes a long time to acknowledge a publish."""
+    await asyncio.sleep(10)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [{**TEST_CONFIG_JSON, CONF_COALESCE_WINDOW: 200}])
+async def test_coalesce_window(
+    device_data,
+    ecowitt,
+    setup_asyncio_mqtt,
+    setup_uvicorn_server,
+):
+    """Test that a burst of payloads from one station is published once."""
+    published = []
+
+    async def async_publish(client, data):
+        """Record publishes."""
+        published.append(data)
+
+    with patch.object(ecowitt._runtime._publisher, "async_publish", async_publish):
+        async with ClientSession() as session:
+            for tempf in ("70.0", "71.0"):
+                resp = await session.request(
+                    "post",
+                    f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}",
+                    data={**device_data, "tempf": tempf},
+                )
+                assert resp.status == 204
+            await asyncio.sleep(0.5)
+
+    assert len(published) == 1
+    assert published[0]["tempf"] == "71.0"
+    assert ecowitt._runtime._payload_queue.stats.merged == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [{**TEST_CONFIG_JSON, CONF_DEDUPE_WINDOW: 60}])
+async def test_duplicate_payloads(
+    device_data,
+    ecowitt,
+    mock_asyncio_mqtt_client,
+    setup_asyncio_mqtt,
+    setup_uvicorn_server,
+):
+    """Test that a retried payload is only published once."""
+    async with ClientSession() as session:
+        for dateutc in ("2022-05-01 12:00:00", "2022-05-01 12:00:02"):
+            resp = await session.request(
+                "post",
+                f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}",
+                data={**device_data, "dateutc": dateutc},
+            )
+            assert resp.status == 204
+        await asyncio.sleep(0.1)
+
+    assert ecowitt._runtime._payload_deduplicator.suppressed == 1
+    assert ecowitt._runtime._payload_queue.stats.enqueued == 1
+    mock_asyncio_mqtt_client.publish.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("config", [{**TEST_CONFIG_JSON, CONF_DIAGNOSTICS: True}])
 async def test_get_diagnostics(
@@ -31,7 +105,13 @@ async def test_get_diagnostics(
             data=device_data,
         )
         assert resp.status == 204
+
+    await asyncio.sleep(0.1)
+    await ecowitt._runtime._stop_task
     assert any(m for m in caplog.messages if "DIAGNOSTICS COLLECTED" in m)
+    assert any(
+        m for m in caplog.messages if "QUEUE STATS" in m and "'enqueued': 1" in m
+    )
 
 
 @pytest.mark.asyncio
@@ -49,6 +129,51 @@ async def test_publish_failure(
     assert any(m for m in caplog.messages if "There was an MQTT error" in m)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config,statuses",
+    [
+        (
+            {
+                **TEST_CONFIG_JSON,
+                CONF_QUEUE_OVERFLOW_POLICY: policy,
+                CONF_QUEUE_SIZE: 1,
+            },
+            statuses,
+        )
+        for policy, statuses in (
+            (OverflowPolicy.COALESCE, [204, 204, 204]),
+            (OverflowPolicy.DROP_OLDEST, [204, 204, 204]),
+            (OverflowPolicy.REJECT, [204, 204, 503]),
+        )
+    ],
+)
+@pytest.mark.parametrize(
+    "mqtt_publish_side_effect", [AsyncMock(side_effect=async_slow_publish)]
+)
+async def test_queue_overflow(
+    caplog,
+    device_data,
+    ecowitt,
+    setup_asyncio_mqtt,
+    setup_uvicorn_server,
+    statuses,
+):
+    """Test the various queue overflow policies while the publisher is busy."""
+    async with ClientSession() as session:
+        for status in statuses:
+            resp = await session.request(
+                "post",
+                f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}",
+                data=device_data,
+            )
+            assert resp.status == status
+            await asyncio.sleep(0.05)
+
+    assert ecowitt._runtime._payload_queue.stats.overflows == 1
+    assert any(m for m in caplog.messages if "queue stats" in m)
+
+
 @pytest.mark.asyncio
 async def test_publish_success(
     device_data, ecowitt, setup_asyncio_mqtt, setup_uvicorn_server
@@ -61,3 +186,280 @@ async def test_publish_success(
             data=device_data,
         )
         assert resp.status == 204
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_queue(
+    caplog, device_data, ecowitt, setup_asyncio_mqtt, setup_uvicorn_server
+):
+    """Test that queued payloads are published before the runtime stops."""
+    caplog.set_level(logging.INFO)
+    published = []
+
+    async def async_publish(client, data):
+        """Record publishes (slowly enough that payloads are queued at shutdown)."""
+        await asyncio.sleep(0.05)
+        published.append(data["runtime"])
+
+    with patch.object(ecowitt._runtime._publisher, "async_publish", async_publish):
+        async with ClientSession() as session:
+            for runtime in range(5):
+                resp = await session.request(
+                    "post",
+                    f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}",
+                    data={**device_data, "runtime": runtime},
+                )
+                assert resp.status == 204
+
+            ecowitt._runtime.stop()
+            await ecowitt._runtime._stop_task
+
+            # New payloads are no longer accepted:
+            with pytest.raises(ClientError):
+                await session.request(
+                    "post",
+                    f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}",
+                    data=device_data,
+                )
+
+    assert published == [str(runtime) for runtime in range(5)]
+    queue_stats = ecowitt._runtime._payload_queue.stats
+    assert queue_stats.flushed > 0
+    assert queue_stats.abandoned == 0
+    assert any(m for m in caplog.messages if "Flushed" in m and "abandoned 0" in m)
+    assert all(task.done() for task in ecowitt._runtime._runtime_tasks)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [{**TEST_CONFIG_JSON, CONF_SHUTDOWN_TIMEOUT: 0.1}])
+async def test_shutdown_timeout(
+    caplog, device_data, ecowitt, setup_asyncio_mqtt, setup_uvicorn_server
+):
+    """Test that payloads that can't be published in time are abandoned."""
+    with patch.object(ecowitt._runtime._publisher, "async_publish", async_slow_publish):
+        async with ClientSession() as session:
+            for runtime in range(2):
+                resp = await session.request(
+                    "post",
+                    f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}",
+                    data={**device_data, "runtime": runtime},
+                )
+                assert resp.status == 204
+
+        ecowitt._runtime.stop()
+        await ecowitt._runtime._stop_task
+
+    queue_stats = ecowitt._runtime._payload_queue.stats
+    assert queue_stats.flushed == 0
+    assert queue_stats.abandoned == 2
+    assert any(m for m in caplog.messages if "abandoned 2" in m)
+
+
+@pytest.mark.asyncio
+async def test_slow_station_does_not_block_others(
+    device_data, ecowitt, setup_asyncio_mqtt, setup_uvicorn_server
+):
+    """Test that a station with a slow publish doesn't delay other stations."""
+    published = []
+    slow_station_event = asyncio.Event()
+
+    async def async_publish(client, data):
+        """Record publishes, blocking on the slow station's until released."""
+        if data["PASSKEY"] == "slow":
+            await slow_station_event.wait()
+        published.append((data["PASSKEY"], data["runtime"]))
+
+    with patch.object(ecowitt._runtime._publisher, "async_publish", async_publish):
+        async with ClientSession() as session:
+            for passkey, runtime in (("slow", "1"), ("slow", "2"), ("fast", "1")):
+                await session.request(
+                    "post",
+                    f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}",
+                    data={**device_data, "PASSKEY": passkey, "runtime": runtime},
+                )
+            await asyncio.sleep(0.1)
+            assert published == [("fast", "1")]
+
+            slow_station_event.set()
+            await asyncio.sleep(0.1)
+            assert published == [("fast", "1"), ("slow", "1"), ("slow", "2")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_DEDUPE_WINDOW: 60,
+            CONF_QUEUE_OVERFLOW_POLICY: OverflowPolicy.REJECT,
+            CONF_QUEUE_SIZE: 1,
+        }
+    ],
+)
+async def test_batch(device_data, ecowitt, setup_asyncio_mqtt, setup_uvicorn_server):
+    """Test that a batch is published in order without overflowing the queue."""
+    published = []
+
+    async def async_publish(client, data):
+        """Record publishes (slowly enough that the queue fills up)."""
+        await asyncio.sleep(0.01)
+        published.append(data["runtime"])
+
+    with patch.object(ecowitt._runtime._publisher, "async_publish", async_publish):
+        async with ClientSession() as session:
+            resp = await session.request(
+                "post",
+                f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}{BATCH_ENDPOINT_SUFFIX}",
+                # The last payload is a retry of the one before it:
+                json=[{**device_data, "runtime": runtime} for runtime in range(10)]
+                + [{**device_data, "runtime": 9}],
+            )
+            assert resp.status == 200
+            assert await resp.json() == {"accepted": 11}
+            await asyncio.sleep(0.1)
+
+    assert published == [str(runtime) for runtime in range(10)]
+    assert ecowitt._runtime._payload_queue.stats.overflows == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [{**TEST_CONFIG_JSON, CONF_COALESCE_WINDOW: 200, CONF_DEDUPE_WINDOW: 60}],
+)
+async def test_batch_historical_readings(
+    device_data, ecowitt, setup_asyncio_mqtt, setup_uvicorn_server
+):
+    """Test that every historical reading in a batch is published separately."""
+    published = []
+
+    async def async_publish(client, data):
+        """Record publishes."""
+        published.append(data["dateutc"])
+
+    # Readings with identical values that were taken a minute apart:
+    timestamps = [f"2022-05-01 12:{minute:02}:00" for minute in range(25)]
+
+    with patch.object(ecowitt._runtime._publisher, "async_publish", async_publish):
+        async with ClientSession() as session:
+            resp = await session.request(
+                "post",
+                f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}{BATCH_ENDPOINT_SUFFIX}",
+                json=[{**device_data, "dateutc": dateutc} for dateutc in timestamps],
+            )
+            assert resp.status == 200
+            assert await resp.json() == {"accepted": 25}
+            await asyncio.sleep(0.1)
+
+    assert published == timestamps
+    assert ecowitt._runtime._payload_queue.stats.merged == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_malformed(
+    device_data, ecowitt, setup_asyncio_mqtt, setup_uvicorn_server
+):
+    """Test that a malformed batch reports how many payloads were accepted."""
+    async with ClientSession() as session:
+        resp = await session.request(
+            "post",
+            f"http://0.0.0.0:{TEST_PORT}{TEST_ENDPOINT}{BATCH_ENDPOINT_SUFFIX}",
+            data=f"{json.dumps(device_data)}\nnot json\n",
+        )
+        assert resp.status == 400
+        assert await resp.json() == {
+            "accepted": 1,
+            "error": "Invalid JSON line: not json",
+        }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", [TEST_ENDPOINT, WUNDERGROUND_ENDPOINT])
+async def test_wunderground(ecowitt, path, setup_asyncio_mqtt, setup_uvicorn_server):
+    """Test that a payload sent via the Wunderground protocol is published."""
+    published = []
+
+    async def async_publish(client, data):
+        """Record publishes."""
+        published.append(data)
+
+    with patch.object(ecowitt._runtime._publisher, "async_publish", async_publish):
+        async with ClientSession() as session:
+            resp = await session.request(
+                "get",
+                f"http://0.0.0.0:{TEST_PORT}{path}",
+                params={
+                    "ID": "KTXAUSTI123",
+                    "PASSWORD": "secret",
+                    "action": "updateraw",
+                    "dateutc": "now",
+                    "indoortempf": "70.7",
+                    "softwaretype": "WS2900_V2.01.18",
+                    "tempf": "68.2",
+                },
+            )
+            assert resp.status == 200
+            assert await resp.text() == "success\n"
+            await asyncio.sleep(0.1)
+
+    assert len(published) == 1
+    assert published[0]["PASSKEY"] == "KTXAUSTI123"
+    assert published[0]["model"] == "WS2900"
+    assert published[0]["tempinf"] == "70.7"
+    assert "PASSWORD" not in published[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config", [{**TEST_CONFIG_JSON, CONF_INPUT_UNIT_SYSTEM: UNIT_SYSTEM_METRIC}]
+)
+async def test_wunderground_metric(ecowitt, setup_asyncio_mqtt, setup_uvicorn_server):
+    """Test that a Wunderground payload is read as imperial under a metric config."""
+    published = []
+
+    async def async_publish(client, data):
+        """Record publishes."""
+        published.append(data)
+
+    with patch.object(ecowitt._runtime._publisher, "async_publish", async_publish):
+        async with ClientSession() as session:
+            resp = await session.request(
+                "get",
+                f"http://0.0.0.0:{TEST_PORT}{WUNDERGROUND_ENDPOINT}",
+                params={"ID": "KTXAUSTI123", "baromin": "29.92", "tempf": "68.0"},
+            )
+            assert resp.status == 200
+            await asyncio.sleep(0.1)
+
+    assert len(published) == 1
+    assert published[0]["baromrelin"] == "1013.208"
+    assert published[0]["tempf"] == "20.0"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            **TEST_CONFIG_JSON,
+            CONF_QUEUE_OVERFLOW_POLICY: OverflowPolicy.REJECT,
+            CONF_QUEUE_SIZE: 1,
+        }
+    ],
+)
+async def test_wunderground_rejected(ecowitt, setup_asyncio_mqtt, setup_uvicorn_server):
+    """Test that a rejected Wunderground payload gets an HTTP 503."""
+    with patch.object(ecowitt._runtime._publisher, "async_publish", async_slow_publish):
+        async with ClientSession() as session:
+            statuses = []
+            for tempf in ("68.0", "68.1", "68.2"):
+                resp = await session.request(
+                    "get",
+                    f"http://0.0.0.0:{TEST_PORT}{WUNDERGROUND_ENDPOINT}",
+                    params={"ID": "KTXAUSTI123", "tempf": tempf},
+                )
+                statuses.append(resp.status)
+                await asyncio.sleep(0.05)
+
+    assert statuses == [200, 200, 503]
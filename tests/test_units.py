@@ -0,0 +1,126 @@
+"""Define tests for unit conversions."""
+import meteocalc
+import pytest
+
+from ecowitt2mqtt.const import UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_METRIC
+from ecowitt2mqtt.helpers.calculator.units import Quantity, UnitConverter
+
+# Values from -100.00 to 1499.99 (in steps of 0.01):
+TEST_VALUES = [value / 100 for value in range(-10000, 150000)]
+
+
+@pytest.mark.parametrize(
+    "quantity,input_unit_system,output_unit_system,reference",
+    [
+        (
+            Quantity.PRESSURE,
+            UNIT_SYSTEM_IMPERIAL,
+            UNIT_SYSTEM_METRIC,
+            lambda value: round(value * 33.8639, 3),
+        ),
+        (
+            Quantity.PRESSURE,
+            UNIT_SYSTEM_METRIC,
+            UNIT_SYSTEM_IMPERIAL,
+            lambda value: round(value / 33.8639, 3),
+        ),
+        (
+            Quantity.RAIN_VOLUME,
+            UNIT_SYSTEM_IMPERIAL,
+            UNIT_SYSTEM_METRIC,
+            lambda value: round(value * 25.4, 1),
+        ),
+        (
+            Quantity.RAIN_VOLUME,
+            UNIT_SYSTEM_METRIC,
+            UNIT_SYSTEM_IMPERIAL,
+            lambda value: round(value / 25.4, 1),
+        ),
+        (
+            Quantity.WIND_SPEED,
+            UNIT_SYSTEM_IMPERIAL,
+            UNIT_SYSTEM_METRIC,
+            lambda value: round(value * 1.60934, 1),
+        ),
+        (
+            Quantity.WIND_SPEED,
+            UNIT_SYSTEM_METRIC,
+            UNIT_SYSTEM_IMPERIAL,
+            lambda value: round(value / 1.60934, 1),
+        ),
+        (
+            Quantity.DISTANCE,
+            UNIT_SYSTEM_IMPERIAL,
+            UNIT_SYSTEM_IMPERIAL,
+            lambda value: round(value / 1.609, 1),
+        ),
+        (
+            Quantity.ABSOLUTE_HUMIDITY,
+            UNIT_SYSTEM_IMPERIAL,
+            UNIT_SYSTEM_IMPERIAL,
+            lambda value: round(value / 16018.46592051, 1),
+        ),
+        (
+            Quantity.TEMPERATURE,
+            UNIT_SYSTEM_IMPERIAL,
+            UNIT_SYSTEM_METRIC,
+            lambda value: round(meteocalc.Temp(value, "f").c, 1),
+        ),
+        (
+            Quantity.TEMPERATURE,
+            UNIT_SYSTEM_METRIC,
+            UNIT_SYSTEM_IMPERIAL,
+            lambda value: round(meteocalc.Temp(value, "c").f, 1),
+        ),
+    ],
+)
+def test_conversions_match_reference(
+    input_unit_system, output_unit_system, quantity, reference
+):
+    """Test that conversions are identical to the formulas they replaced."""
+    conversion = UnitConverter(input_unit_system, output_unit_system)[quantity]
+    mismatches = [
+        value for value in TEST_VALUES if conversion.convert(value) != reference(value)
+    ]
+    assert not mismatches
+
+
+@pytest.mark.parametrize(
+    "input_unit_system,output_unit_system",
+    [
+        (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_IMPERIAL),
+        (UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_METRIC),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_IMPERIAL),
+        (UNIT_SYSTEM_METRIC, UNIT_SYSTEM_METRIC),
+    ],
+)
+def test_convert_temperature(input_unit_system, output_unit_system):
+    """Test converting temperatures (regardless of their unit system)."""
+    unit_converter = UnitConverter(input_unit_system, output_unit_system)
+    for value in TEST_VALUES[::10]:
+        for unit, unit_system in (
+            ("c", UNIT_SYSTEM_METRIC),
+            ("f", UNIT_SYSTEM_IMPERIAL),
+        ):
+            temp_obj = meteocalc.Temp(value, unit)
+            if output_unit_system == UNIT_SYSTEM_IMPERIAL:
+                expected = round(temp_obj.f, 1)
+            else:
+                expected = round(temp_obj.c, 1)
+            assert unit_converter.convert_temperature(value, unit_system) == expected
+
+
+def test_identity_conversion():
+    """Test that a conversion within the same unit system leaves values as-is."""
+    unit_converter = UnitConverter(UNIT_SYSTEM_METRIC, UNIT_SYSTEM_METRIC)
+    assert unit_converter[Quantity.DISTANCE].convert(12) == 12
+    assert isinstance(unit_converter[Quantity.DISTANCE].convert(12), int)
+    assert unit_converter[Quantity.PRESSURE].convert(1013.25) == 1013.25
+    assert unit_converter[Quantity.PRESSURE].unit == "hPa"
+
+
+def test_unsupported_unit_systems():
+    """Test that unsupported unit systems are rejected."""
+    with pytest.raises(ValueError) as err:
+        _ = UnitConverter("kelvin", UNIT_SYSTEM_METRIC)
+    assert "Unsupported unit systems: kelvin -> metric" in str(err.value)
@@ -0,0 +1,91 @@
+"""Define tests for utilities."""
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+import json
+import os
+
+import pytest
+
+from ecowitt2mqtt.data import CALCULATOR_FUNCTION_MAP, CALCULATOR_MATCHER
+from ecowitt2mqtt.helpers.calculator.battery import (
+    BATTERY_STRATEGY_MAP,
+    BATTERY_STRATEGY_MATCHER,
+)
+from ecowitt2mqtt.util import GlobMatcher, glob_search
+
+from tests.common import load_fixture
+
+FIXTURE_KEYS = sorted(
+    {
+        key
+        for filename in os.listdir(os.path.join(os.path.dirname(__file__), "fixtures"))
+        for key in json.loads(load_fixture(filename))
+    }
+)
+
+# Every key from the fixtures, plus variations of every known glob (channels, unit
+# suffixes, and prefixes):
+KNOWN_KEYS = sorted(
+    {
+        *FIXTURE_KEYS,
+        *(
+            variant
+            for glob in (*CALCULATOR_FUNCTION_MAP, *BATTERY_STRATEGY_MAP)
+            for variant in (glob, f"{glob}1", f"{glob}_ch8", f"{glob}in", f"x{glob}")
+        ),
+        "unknown",
+    }
+)
+
+
+def levenshtein_glob_search(data, key):
+    """Search the way glob_search did before it used a matcher (as a reference)."""
+    if key in data:
+        return (key, data[key])
+    if not (matches := [k for k in data if k in key]):
+        return (None, None)
+    match = sorted(
+        matches,
+        key=lambda m: round(100 * SequenceMatcher(None, key, m).ratio()),
+        reverse=True,
+    )[0]
+    return (match, data[match])
+
+
+@pytest.mark.parametrize(
+    "data,matcher",
+    [
+        (CALCULATOR_FUNCTION_MAP, CALCULATOR_MATCHER),
+        (BATTERY_STRATEGY_MAP, BATTERY_STRATEGY_MATCHER),
+    ],
+)
+def test_glob_matcher_equivalence(data, matcher):
+    """Test that the matchers agree with the Levenshtein-based search on every key."""
+    for key in KNOWN_KEYS:
+        expected = levenshtein_glob_search(data, key)
+        assert matcher.search(key) == expected, key
+        assert glob_search(data, key) == expected, key
+
+
+@pytest.mark.parametrize(
+    "key,result",
+    [
+        ("wind", ("wind", 1)),
+        ("winddir_avg10m", ("winddir", 2)),
+        ("windspeed", ("wind", 1)),
+        ("dirwin", ("dir", 3)),
+        ("abc", (None, None)),
+        ("", (None, None)),
+    ],
+)
+def test_glob_matcher_rules(key, result):
+    """Test the rules of the matcher."""
+    matcher = GlobMatcher({"wind": 1, "winddir": 2, "dir": 3, "ind": 4})
+    assert matcher.search(key) == result
+
+
+def test_glob_matcher_tie():
+    """Test that the first of several equally long matches wins."""
+    assert GlobMatcher({"ab": 1, "cd": 2}).search("cdab") == ("ab", 1)
+    assert GlobMatcher({"cd": 2, "ab": 1}).search("cdab") == ("cd", 2)
@@ -0,0 +1,90 @@
+"""Define tests for Wunderground protocol normalization."""
+from unittest.mock import patch
+
+from ecowitt2mqtt.const import UNIT_SYSTEM_METRIC
+from ecowitt2mqtt.helpers.wunderground import normalize_wunderground_payload
+
+TEST_WUNDERGROUND_PARAMS = {
+    "ID": "KTXAUSTI123",
+    "PASSWORD": "secret",
+    "action": "updateraw",
+    "dateutc": "2022-05-01 12:00:00",
+    "absbaromin": "29.823",
+    "baromin": "29.920",
+    "dailyrainin": "0.012",
+    "dewptf": "55.4",
+    "indoorhumidity": "45",
+    "indoortempf": "70.7",
+    "rainin": "0.004",
+    "realtime": "1",
+    "rtfreq": "5",
+    "softwaretype": "GW1000B_V1.6.8",
+    "tempf": "68.2",
+    "UV": "3",
+    "windchillf": "68.2",
+}
+
+
+def test_normalize():
+    """Test normalizing a Wunderground payload into Ecowitt keys."""
+    assert normalize_wunderground_payload(TEST_WUNDERGROUND_PARAMS) == {
+        "PASSKEY": "KTXAUSTI123",
+        "dateutc": "2022-05-01 12:00:00",
+        "baromabsin": "29.823",
+        "baromrelin": "29.920",
+        "dailyrainin": "0.012",
+        "humidityin": "45",
+        "tempinf": "70.7",
+        "hourlyrainin": "0.004",
+        "stationtype": "GW1000B_V1.6.8",
+        "tempf": "68.2",
+        "uv": "3",
+        "model": "GW1000B",
+    }
+
+
+def test_normalize_metric():
+    """Test normalizing a Wunderground payload into metric units."""
+    assert normalize_wunderground_payload(
+        {
+            **TEST_WUNDERGROUND_PARAMS,
+            "temp2f": "unknown",
+            "winddir": "180",
+            "windgustmph": "12.0",
+            "windspdmph_avg2m": "3.0",
+        },
+        UNIT_SYSTEM_METRIC,
+    ) == {
+        "PASSKEY": "KTXAUSTI123",
+        "dateutc": "2022-05-01 12:00:00",
+        "baromabsin": "1009.923",
+        "baromrelin": "1013.208",
+        "dailyrainin": "0.3",
+        "humidityin": "45",
+        "tempinf": "21.5",
+        "hourlyrainin": "0.1",
+        "stationtype": "GW1000B_V1.6.8",
+        "temp2f": "unknown",
+        "tempf": "20.1",
+        "uv": "3",
+        "winddir": "180",
+        "windgustmph": "19.3",
+        "windspdmph_avg2m": "4.8",
+        "model": "GW1000B",
+    }
+
+
+def test_normalize_minimal():
+    """Test normalizing a Wunderground payload with "now" as its time."""
+    with patch("ecowitt2mqtt.helpers.wunderground.datetime") as mock_datetime:
+        mock_datetime.now.return_value.strftime.return_value = "2022-05-01 12:00:00"
+        payload = normalize_wunderground_payload(
+            {"ID": "KTXAUSTI123", "dateutc": "now", "tempf": "68.2"}
+        )
+
+    assert payload == {
+        "PASSKEY": "KTXAUSTI123",
+        "dateutc": "2022-05-01 12:00:00",
+        "tempf": "68.2",
+        "model": "Wunderground",
+    }